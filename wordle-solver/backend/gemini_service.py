@@ -5,7 +5,6 @@ Permet d'obtenir des définitions de mots.
 
 import os
 from typing import Optional
-from google import genai
 from dotenv import load_dotenv
 
 # Charger les variables d'environnement
@@ -24,6 +23,9 @@ class GeminiService:
                 "Veuillez créer un fichier .env avec votre clé API Gemini."
             )
         
+        # SDK importé ici : son chargement (lent) n'est payé qu'au premier usage
+        from google import genai
+        
         # Le client récupère automatiquement la clé depuis GEMINI_API_KEY
         self.client = genai.Client()
         self.model = "gemini-2.5-flash-lite"
@@ -4,11 +4,20 @@ API FastAPI pour le Wordle Solver.
 Expose les fonctionnalités du solver via une API REST.
 """
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Set
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Set, Tuple, Union
+import asyncio
+import json
+import os
+import re
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Ajouter le dossier parent au path
@@ -16,25 +25,44 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from wordle_solver import (
     WordleGame,
-    HybridSolver,
-    ConstraintManager,
-    DictionaryLoader,
+    LanguageRegistry,
     generate_feedback,
     FeedbackResult,
     Feedback
 )
-from wordle_solver.strategies import (
-    FrequencyStrategy,
-    EntropyStrategy,
-    MinimaxStrategy,
-    SimpleStrategy
-)
+from wordle_solver.strategies import StrategyComparator
+from wordle_solver.utils import cache_stats, metrics, pattern_to_code
 from gemini_service import get_gemini_service
+from solver_pool import SolverPool, STRATEGY_FACTORIES, create_strategy
+from session_store import GameSession, create_session_store
+
+# Mesure des phases (filtrage, scoring, sérialisation...) exposée sur /metrics.
+# WORDLE_METRICS=0 pour la désactiver.
+metrics.enable(os.getenv('WORDLE_METRICS', '1') != '0')
+
+# Filtrage et stratégies s'exécutent dans des processus workers :
+# une suggestion lente ne bloque plus les autres parties
+solver_pool = SolverPool(
+    languages=('en', 'fr'),
+    workers=int(os.getenv('WORDLE_WORKERS', '0')) or None,
+    default_timeout=float(os.getenv('WORDLE_SUGGEST_TIMEOUT', '2.0'))
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Démarre le pool de workers (préchargé) avant de servir les requêtes."""
+    solver_pool.start()
+    yield
+    solver_pool.shutdown()
+    session_store.close()
+
 
 app = FastAPI(
     title="Wordle Solver API",
     description="API pour résoudre Wordle avec différentes stratégies",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configuration CORS pour permettre les requêtes depuis React
@@ -46,31 +74,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Cache global pour les dictionnaires et solveurs
-_solvers: Dict[str, HybridSolver] = {}
-_strategies: Dict[str, any] = {}
-_games: Dict[str, Dict] = {}  # game_id -> {game, constraint_manager, solver, strategy}
+# Parties en cours : état compact (tentatives + codes), borné et avec expiration.
+# WORDLE_SESSION_DB=chemin.sqlite pour partager les parties entre workers uvicorn.
+session_store = create_session_store()
 
+# Journaux des benchmarks (un fichier .jsonl par run_id, reprise après arrêt)
+BENCHMARK_DIR = Path(os.getenv('WORDLE_BENCHMARK_DIR', Path(__file__).parent / 'benchmarks'))
 
-def get_solver(language: str) -> HybridSolver:
-    """Récupère ou crée un solver pour une langue."""
-    if language not in _solvers:
-        dictionary = DictionaryLoader.load_language(language)
-        _solvers[language] = HybridSolver(dictionary)
-    return _solvers[language]
+# Nombre maximum de mots cibles d'un benchmark (durée bornée : parties jouées dans l'API)
+MAX_BENCHMARK_WORDS = int(os.getenv('WORDLE_MAX_BENCHMARK_WORDS', '500'))
 
+# Bornes de l'échéance d'une suggestion demandée par le client (millisecondes)
+MIN_SUGGEST_TIMEOUT_MS = 10
+MAX_SUGGEST_TIMEOUT_MS = int(os.getenv('WORDLE_MAX_SUGGEST_TIMEOUT_MS', '30000'))
+
+
+@app.middleware("http")
+async def time_requests(request: Request, call_next):
+    """Mesure chaque requête dans la phase 'request <route>'."""
+    if not metrics.is_enabled():
+        return await call_next(request)
+    start = time.perf_counter_ns()
+    response = await call_next(request)
+    route = getattr(request.scope.get('route'), 'path', 'unmatched')
+    metrics.observe(f"request {route}", time.perf_counter_ns() - start)
+    return response
 
-def get_strategy(strategy_name: str):
-    """Récupère ou crée une stratégie."""
-    if strategy_name not in _strategies:
-        strategies_map = {
-            'frequency': FrequencyStrategy(),
-            'entropy': EntropyStrategy(max_words_to_evaluate=100),
-            'minimax': MinimaxStrategy(),
-            'simple': SimpleStrategy()
-        }
-        _strategies[strategy_name] = strategies_map.get(strategy_name, FrequencyStrategy())
-    return _strategies[strategy_name]
+
+def json_response(content) -> JSONResponse:
+    """Sérialise une réponse JSON comme FastAPI (phase 'api_serialization')."""
+    with metrics.timer('api_serialization'):
+        return JSONResponse(jsonable_encoder(content))
+
+
+def load_session(game_id: str) -> GameSession:
+    """Charge une partie ou lève une 404."""
+    session = session_store.get(game_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    return session
 
 
 # Modèles Pydantic
@@ -88,6 +130,16 @@ class GuessRequest(BaseModel):
 class SuggestRequest(BaseModel):
     game_id: str
     limit: int = 10
+    # Échéance (défaut : WORDLE_SUGGEST_TIMEOUT), bornée pour ne pas monopoliser un worker
+    timeout_ms: Optional[int] = Field(None, ge=MIN_SUGGEST_TIMEOUT_MS, le=MAX_SUGGEST_TIMEOUT_MS)
+
+
+class BatchSuggestRequest(BaseModel):
+    language: str = "en"
+    strategy: str = "frequency"
+    # Un historique par état : [[tentative, code 0..242 ou pattern "GYBBG"], ...]
+    histories: List[List[Tuple[str, Union[int, str]]]]
+    limit: int = 0
 
 
 class GameState(BaseModel):
@@ -143,8 +195,8 @@ async def get_languages():
     """Retourne les langues disponibles."""
     return {
         "languages": [
-            {"code": "en", "name": "English", "word_count": 15921},
-            {"code": "fr", "name": "Français", "word_count": 6760}
+            {"code": "en", "name": "English", "word_count": len(LanguageRegistry.get("en"))},
+            {"code": "fr", "name": "Français", "word_count": len(LanguageRegistry.get("fr"))}
         ]
     }
 
@@ -190,36 +242,45 @@ async def get_strategies():
 async def new_game(request: NewGameRequest):
     """Crée une nouvelle partie."""
     import uuid
-    import random
+    
+    if request.language not in solver_pool.languages:
+        raise HTTPException(status_code=400, detail=f"Langue non supportée : {request.language}")
+    if request.strategy not in STRATEGY_FACTORIES:
+        raise HTTPException(status_code=400, detail=f"Stratégie inconnue : {request.strategy}")
     
     game_id = str(uuid.uuid4())
     
-    # Charger le dictionnaire et créer le solver
-    solver = get_solver(request.language)
-    strategy = get_strategy(request.strategy)
+    # Dictionnaire de la langue (chargé une fois par processus)
+    data = LanguageRegistry.get(request.language)
     
     # Choisir un mot cible
     if request.target_word:
         target_word = request.target_word.upper()
+        # Le mot doit être jouable : longueur et dictionnaire de la langue
+        if len(target_word) != data.word_length:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Le mot cible doit faire {data.word_length} lettres"
+            )
+        if target_word not in data:
+            raise HTTPException(status_code=400, detail=f"Mot cible absent du dictionnaire : {target_word}")
     else:
         # Choisir un mot aléatoire du dictionnaire
-        dictionary = DictionaryLoader.load_language(request.language)
-        target_word = random.choice(list(dictionary))
+        target_word = data.random_word()
     
-    # Créer la partie
-    game = WordleGame(target_word)
-    constraint_manager = ConstraintManager()
+    # Valider le mot cible avant de stocker la partie
+    try:
+        WordleGame(target_word)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     # Stocker la partie
-    _games[game_id] = {
-        'game': game,
-        'constraint_manager': constraint_manager,
-        'solver': solver,
-        'strategy': strategy,
-        'language': request.language,
-        'strategy_name': request.strategy,
-        'target_word': target_word
-    }
+    session_store.put(GameSession(
+        game_id=game_id,
+        language=request.language,
+        strategy_name=request.strategy,
+        target_word=target_word
+    ))
     
     return {
         "game_id": game_id,
@@ -233,13 +294,8 @@ async def new_game(request: NewGameRequest):
 @app.post("/api/game/guess")
 async def make_guess(request: GuessRequest):
     """Fait une tentative."""
-    if request.game_id not in _games:
-        raise HTTPException(status_code=404, detail="Partie non trouvée")
-    
-    game_data = _games[request.game_id]
-    game = game_data['game']
-    constraint_manager = game_data['constraint_manager']
-    solver = game_data['solver']
+    session = load_session(request.game_id)
+    game, constraint_manager = session.restore()
     
     guess = request.guess.upper()
     
@@ -247,11 +303,15 @@ async def make_guess(request: GuessRequest):
         # Faire la tentative
         feedback = game.make_guess(guess)
         
-        # Appliquer les contraintes
+        # Appliquer les contraintes et enregistrer la tentative
         constraint_manager.apply_feedback(feedback)
+        session.record(feedback)
+        session_store.put(session)
         
-        # Calculer les mots possibles
-        possible_words = solver.get_possible_words(constraint_manager, limit=100)
+        # Calculer les mots possibles (dans un worker)
+        possible_count, possible_words = await solver_pool.possible_words(
+            session.language, session.history()
+        )
         
         # Formater le feedback
         feedback_data = {
@@ -263,16 +323,16 @@ async def make_guess(request: GuessRequest):
             'absent_letters': list(feedback.get_absent_letters())
         }
         
-        return {
+        return json_response({
             "success": True,
             "feedback": feedback_data,
             "is_over": game.is_over,
             "is_won": game.is_won,
             "attempts_count": len(game.attempts),
-            "possible_words_count": len(possible_words),
+            "possible_words_count": possible_count,
             "possible_words": possible_words[:20],
             "constraints": constraint_manager.get_constraint_summary()
-        }
+        })
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -281,61 +341,163 @@ async def make_guess(request: GuessRequest):
 @app.post("/api/game/suggest")
 async def get_suggestions(request: SuggestRequest):
     """Obtient des suggestions de mots."""
-    if request.game_id not in _games:
-        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    session = load_session(request.game_id)
     
-    game_data = _games[request.game_id]
-    constraint_manager = game_data['constraint_manager']
-    solver = game_data['solver']
-    strategy = game_data['strategy']
-    game = game_data['game']
-    
-    # Obtenir les mots possibles
-    possible_words = solver.solve(constraint_manager, use_cpsat=False)
-    
-    if not possible_words:
-        return {
-            "suggested_word": None,
-            "possible_words": [],
-            "possible_words_count": 0,
-            "explanation": "Aucun mot possible trouvé"
-        }
+    # Stratégie exécutée dans un worker, bornée par l'échéance : si elle
+    # expire, la meilleure réponse disponible est renvoyée ("complete": False)
+    timeout = request.timeout_ms / 1000 if request.timeout_ms is not None else None
+    return json_response(await solver_pool.suggest(
+        session.language,
+        session.strategy_name,
+        session.history(),
+        limit=request.limit,
+        timeout=timeout
+    ))
+
+
+def parse_history(history: List[Tuple[str, Union[int, str]]]) -> Tuple[Tuple[str, int], ...]:
+    """
+    Normalise un historique (tentative, code ou pattern) du lot.
     
-    # Utiliser la stratégie pour choisir le meilleur mot
-    attempt_number = len(game.attempts) + 1
+    Raises:
+        ValueError: Si une tentative ou un pattern est invalide
+    """
+    parsed = []
+    for guess, pattern in history:
+        guess = guess.upper()
+        if len(guess) != 5 or not guess.isalpha():
+            raise ValueError(f"Tentative invalide : {guess}")
+        if isinstance(pattern, str):
+            if len(pattern) != 5 or set(pattern.upper()) - set('BYG'):
+                raise ValueError(f"Pattern invalide : {pattern}")
+            pattern = pattern_to_code(pattern)
+        if not 0 <= pattern <= 242:
+            raise ValueError(f"Code de pattern invalide : {pattern}")
+        parsed.append((guess, pattern))
+    return tuple(parsed)
+
+
+@app.post("/api/batch/suggest")
+async def batch_suggest(request: BatchSuggestRequest):
+    """
+    Suggestions pour un lot d'états de jeu, diffusées en NDJSON.
     
-    if attempt_number == 1:
-        suggested = strategy.get_first_guess(game_data['language'])
-    else:
-        dictionary = DictionaryLoader.load_language(game_data['language'])
-        suggested = strategy.choose_word(
-            possible_words,
-            constraint_manager,
-            attempt_number,
-            full_dictionary=dictionary
-        )
+    Une ligne JSON par historique reçu (champ "index"), émise dès que la
+    tâche qui le contient est terminée : les historiques identiques ne sont
+    résolus qu'une fois et le filtrage est partagé entre préfixes communs.
+    """
+    if request.language not in solver_pool.languages:
+        raise HTTPException(status_code=400, detail=f"Langue non supportée : {request.language}")
+    if request.strategy not in STRATEGY_FACTORIES:
+        raise HTTPException(status_code=400, detail=f"Stratégie inconnue : {request.strategy}")
     
-    explanation = strategy.explain_choice(suggested, possible_words)
+    # Positions du lot de chaque historique distinct
+    positions: Dict[Tuple[Tuple[str, int], ...], List[int]] = {}
+    errors = []
+    for index, history in enumerate(request.histories):
+        try:
+            positions.setdefault(parse_history(history), []).append(index)
+        except ValueError as e:
+            errors.append({"index": index, "error": str(e)})
     
-    return {
-        "suggested_word": suggested,
-        "possible_words": sorted(list(possible_words))[:request.limit],
-        "possible_words_count": len(possible_words),
-        "explanation": explanation,
-        "strategy": game_data['strategy_name']
-    }
+    async def lines():
+        for error in errors:
+            yield json.dumps(error) + "\n"
+        
+        chunks = solver_pool.suggest_batch(request.language, request.strategy, list(positions), request.limit)
+        async for suggestions in chunks:
+            for suggestion in suggestions:
+                key = tuple((guess, code) for guess, code in suggestion["history"])
+                for index in positions[key]:
+                    yield json.dumps({"index": index, **suggestion}) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.get("/api/benchmark/stream")
+async def benchmark_stream(
+    request: Request,
+    language: str = "en",
+    strategies: str = "frequency,entropy",
+    n_words: int = Query(20, ge=1, le=MAX_BENCHMARK_WORDS),
+    run_id: Optional[str] = None,
+    format: str = "sse"
+):
+    """
+    Compare des stratégies en diffusant la progression.
+    
+    Chaque partie terminée et chaque instantané des statistiques est
+    envoyé dès qu'il est disponible, en Server-Sent Events (format=sse)
+    ou en NDJSON (format=ndjson). Avec un run_id, les résultats sont
+    journalisés et relancer le même run_id reprend la comparaison.
+    n_words est borné par MAX_BENCHMARK_WORDS (WORDLE_MAX_BENCHMARK_WORDS).
+    
+    Les parties sont jouées séquentiellement dans un thread de l'API, avec
+    un solveur et des stratégies propres à la requête (aucun cache partagé
+    avec les autres requêtes) ; la comparaison s'arrête dès que le client
+    se déconnecte.
+    """
+    if language not in solver_pool.languages:
+        raise HTTPException(status_code=400, detail=f"Langue non supportée : {language}")
+    names = [name.strip() for name in strategies.split(',') if name.strip()]
+    unknown = [name for name in names if name not in STRATEGY_FACTORIES]
+    if not names or unknown:
+        raise HTTPException(status_code=400, detail=f"Stratégies inconnues : {', '.join(unknown)}")
+    if run_id is not None and not re.fullmatch(r'[A-Za-z0-9_-]+', run_id):
+        raise HTTPException(status_code=400, detail="run_id invalide")
+    if format not in ('sse', 'ndjson'):
+        raise HTTPException(status_code=400, detail="format doit être 'sse' ou 'ndjson'")
+    
+    # Mots cibles répartis sur le dictionnaire (comme quick_benchmark)
+    data = LanguageRegistry.get(language)
+    words = data.table.words
+    step = max(1, len(words) // max(1, n_words))
+    target_words = list(words[::step][:n_words])
+    
+    # Solveur propre (la matrice de patterns, en lecture seule, reste partagée)
+    comparator = StrategyComparator(data.words, language)
+    events = comparator.iter_events(
+        [create_strategy(name, (language,)) for name in names],
+        target_words,
+        workers=1,
+        results_log=BENCHMARK_DIR / f"{run_id}.jsonl" if run_id else None
+    )
+    # Une partie à la fois : la fermeture attend la fin de la partie en cours
+    events_lock = threading.Lock()
+    
+    def next_event():
+        with events_lock:
+            return next(events, None)
+    
+    def close_events():
+        with events_lock:
+            events.close()
+    
+    async def lines():
+        loop = asyncio.get_running_loop()
+        try:
+            while not await request.is_disconnected():
+                event = await loop.run_in_executor(None, next_event)
+                if event is None:
+                    break
+                payload = json.dumps(event.to_dict(), ensure_ascii=False)
+                if format == 'sse':
+                    yield f"event: {event.kind}\ndata: {payload}\n\n"
+                else:
+                    yield payload + "\n"
+        finally:
+            # Fin du flux ou client déconnecté : fermer le générateur (journal compris)
+            await loop.run_in_executor(None, close_events)
+    
+    media_type = "text/event-stream" if format == 'sse' else "application/x-ndjson"
+    return StreamingResponse(lines(), media_type=media_type)
 
 
 @app.get("/api/game/state/{game_id}")
 async def get_game_state(game_id: str):
     """Obtient l'état actuel d'une partie."""
-    if game_id not in _games:
-        raise HTTPException(status_code=404, detail="Partie non trouvée")
-    
-    game_data = _games[game_id]
-    game = game_data['game']
-    constraint_manager = game_data['constraint_manager']
-    solver = game_data['solver']
+    session = load_session(game_id)
+    game, constraint_manager = session.restore()
     
     # Formater l'historique
     attempts = []
@@ -346,29 +508,30 @@ async def get_game_state(game_id: str):
             'display': fb.to_string()
         })
     
-    # Calculer les mots possibles
-    possible_words = solver.get_possible_words(constraint_manager, limit=100)
+    # Calculer les mots possibles (dans un worker)
+    possible_count, possible_words = await solver_pool.possible_words(
+        session.language, session.history()
+    )
     
-    return {
+    return json_response({
         "game_id": game_id,
-        "language": game_data['language'],
-        "strategy": game_data['strategy_name'],
+        "language": session.language,
+        "strategy": session.strategy_name,
         "attempts": attempts,
         "is_over": game.is_over,
         "is_won": game.is_won,
-        "possible_words_count": len(possible_words),
+        "possible_words_count": possible_count,
         "possible_words": possible_words[:20],
         "constraints": constraint_manager.get_constraint_summary()
-    }
+    })
 
 
 @app.delete("/api/game/{game_id}")
 async def delete_game(game_id: str):
     """Supprime une partie."""
-    if game_id not in _games:
+    if not session_store.delete(game_id):
         raise HTTPException(status_code=404, detail="Partie non trouvée")
     
-    del _games[game_id]
     return {"message": "Partie supprimée", "game_id": game_id}
 
 
@@ -376,12 +539,37 @@ async def delete_game(game_id: str):
 async def get_stats():
     """Obtient des statistiques globales."""
     return {
-        "active_games": len(_games),
-        "loaded_dictionaries": list(_solvers.keys()),
-        "available_strategies": list(_strategies.keys())
+        "active_games": len(session_store),
+        "loaded_dictionaries": list(solver_pool.languages),
+        "available_strategies": list(STRATEGY_FACTORIES),
+        "workers": solver_pool.get_stats(),
+        "caches": cache_stats()
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Métriques au format texte de Prometheus.
+    
+    Histogramme des durées par phase (wordle_phase_duration_seconds),
+    mesures des workers comprises, plus les compteurs des caches du
+    processus de l'API et les échéances de suggestion dépassées.
+    """
+    caches = cache_stats()
+    lines = ["# TYPE wordle_cache_hits_total counter"]
+    lines += [f'wordle_cache_hits_total{{cache="{c["name"]}"}} {c["hits"]}' for c in caches]
+    lines += ["# TYPE wordle_cache_misses_total counter"]
+    lines += [f'wordle_cache_misses_total{{cache="{c["name"]}"}} {c["misses"]}' for c in caches]
+    lines += [
+        "# TYPE wordle_suggest_timeouts_total counter",
+        f"wordle_suggest_timeouts_total {solver_pool.timeouts}",
+        "# TYPE wordle_active_games gauge",
+        f"wordle_active_games {len(session_store)}",
+    ]
+    return PlainTextResponse(metrics.metrics_text(lines), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/api/word/definition")
 async def get_word_definition(request: WordDefinitionRequest):
     """
@@ -0,0 +1,296 @@
+"""
+Stockage des parties de l'API.
+
+Une partie est stockée sous forme compacte : mot cible, tentatives
+concaténées et un code de pattern (0..3^L-1, sur 16 bits) par tentative,
+soit quelques dizaines d'octets. La partie (WordleGame) et ses contraintes
+(ConstraintManager) sont reconstruites au chargement.
+
+Deux implémentations :
+- MemorySessionStore : en mémoire, bornée (LRU) avec expiration (TTL)
+- SQLiteSessionStore : fichier SQLite partagé par plusieurs workers uvicorn
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from wordle_solver import WordleGame, ConstraintManager, FeedbackResult
+
+
+# Durée de vie par défaut d'une partie inactive (secondes)
+DEFAULT_TTL = 24 * 3600
+
+# Nombre maximum de parties conservées par défaut
+DEFAULT_MAX_SESSIONS = 10_000
+
+
+@dataclass
+class GameSession:
+    """État compact d'une partie."""
+    game_id: str
+    language: str
+    strategy_name: str
+    target_word: str
+    guesses: List[str] = field(default_factory=list)
+    codes: List[int] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    
+    def history(self) -> Tuple[Tuple[str, int], ...]:
+        """Historique (tentative, code) de la partie."""
+        return tuple(zip(self.guesses, self.codes))
+    
+    def feedbacks(self) -> List[FeedbackResult]:
+        """Feedbacks reconstruits depuis les codes."""
+        return [FeedbackResult.from_code(guess, code) for guess, code in zip(self.guesses, self.codes)]
+    
+    def restore(self) -> Tuple[WordleGame, ConstraintManager]:
+        """
+        Reconstruit la partie et ses contraintes.
+        
+        Returns:
+            Tuple (partie, gestionnaire de contraintes)
+        """
+        feedbacks = self.feedbacks()
+        return WordleGame.from_history(self.target_word, feedbacks), ConstraintManager.from_feedbacks(feedbacks)
+    
+    def record(self, feedback: FeedbackResult):
+        """Ajoute une tentative jouée."""
+        self.guesses.append(feedback.guess)
+        self.codes.append(feedback.code)
+        self.updated_at = time.time()
+
+
+class SessionStore(ABC):
+    """Interface d'un stockage de parties avec expiration."""
+    
+    def __init__(self, ttl: float = DEFAULT_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        """
+        Initialise le stockage.
+        
+        Args:
+            ttl: Durée de vie d'une partie inactive (secondes)
+            max_sessions: Nombre maximum de parties (les moins récentes sont évincées)
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+    
+    @abstractmethod
+    def get(self, game_id: str) -> Optional[GameSession]:
+        """Charge une partie (None si inconnue ou expirée)."""
+    
+    @abstractmethod
+    def put(self, session: GameSession):
+        """Enregistre (ou met à jour) une partie."""
+    
+    @abstractmethod
+    def delete(self, game_id: str) -> bool:
+        """Supprime une partie ; retourne False si elle n'existait pas."""
+    
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Supprime les parties expirées ; retourne leur nombre."""
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """Nombre de parties stockées."""
+    
+    def is_expired(self, session: GameSession, now: Optional[float] = None) -> bool:
+        """Indique si une partie a dépassé sa durée de vie."""
+        return (now or time.time()) - session.updated_at > self.ttl
+    
+    def close(self):
+        """Libère les ressources du stockage."""
+
+
+class MemorySessionStore(SessionStore):
+    """Stockage en mémoire, borné (LRU) avec expiration."""
+    
+    def __init__(self, ttl: float = DEFAULT_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        super().__init__(ttl, max_sessions)
+        self._sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, game_id: str) -> Optional[GameSession]:
+        with self._lock:
+            session = self._sessions.get(game_id)
+            if session is None:
+                return None
+            if self.is_expired(session):
+                del self._sessions[game_id]
+                return None
+            self._sessions.move_to_end(game_id)
+            return session
+    
+    def put(self, session: GameSession):
+        with self._lock:
+            self._sessions[session.game_id] = session
+            self._sessions.move_to_end(session.game_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+    
+    def delete(self, game_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(game_id, None) is not None
+    
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [game_id for game_id, session in self._sessions.items() if self.is_expired(session, now)]
+            for game_id in expired:
+                del self._sessions[game_id]
+        return len(expired)
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Stockage SQLite, partageable entre processus (mode WAL).
+    
+    Les tentatives sont stockées concaténées (TEXT) et les codes de pattern
+    sous forme d'octets (BLOB, deux octets par tentative : uint16, pour
+    les 3^L patterns des mots de 4 à 8 lettres).
+    
+    max_sessions est respecté à chaque écriture (éviction des parties les
+    moins récemment mises à jour, via l'index sur updated_at) ; les parties
+    expirées sont supprimées par purge_expired(), appelée toutes les
+    PURGE_INTERVAL écritures, et ne sont de toute façon plus retournées.
+    """
+    
+    # Une purge des parties expirées toutes les N écritures (par processus)
+    PURGE_INTERVAL = 100
+    
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        """
+        Ouvre (ou crée) la base de parties.
+        
+        Args:
+            path: Chemin du fichier SQLite
+            ttl: Durée de vie d'une partie inactive (secondes)
+            max_sessions: Nombre maximum de parties
+        """
+        super().__init__(ttl, max_sessions)
+        self.path = path
+        self._lock = threading.Lock()
+        self._writes = 0
+        
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                game_id TEXT PRIMARY KEY,
+                language TEXT NOT NULL,
+                strategy TEXT NOT NULL,
+                target TEXT NOT NULL,
+                guesses TEXT NOT NULL,
+                codes BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated_at)")
+        self._connection.commit()
+    
+    def get(self, game_id: str) -> Optional[GameSession]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT language, strategy, target, guesses, codes, created_at, updated_at "
+                "FROM sessions WHERE game_id = ? AND updated_at >= ?",
+                (game_id, time.time() - self.ttl)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        language, strategy_name, target, guesses, codes, created_at, updated_at = row
+        length = len(target)
+        return GameSession(
+            game_id=game_id,
+            language=language,
+            strategy_name=strategy_name,
+            target_word=target,
+            guesses=[guesses[i:i + length] for i in range(0, len(guesses), length)],
+            codes=np.frombuffer(codes, dtype=np.uint16).tolist(),
+            created_at=created_at,
+            updated_at=updated_at
+        )
+    
+    def put(self, session: GameSession):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    session.game_id, session.language, session.strategy_name, session.target_word,
+                    ''.join(session.guesses), np.asarray(session.codes, dtype=np.uint16).tobytes(),
+                    session.created_at, session.updated_at
+                )
+            )
+            self._evict_oldest()
+            self._connection.commit()
+            self._writes += 1
+            purge = self._writes % self.PURGE_INTERVAL == 0
+        if purge:
+            self.purge_expired()
+    
+    def delete(self, game_id: str) -> bool:
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM sessions WHERE game_id = ?", (game_id,))
+            self._connection.commit()
+            return cursor.rowcount > 0
+    
+    def purge_expired(self) -> int:
+        """Supprime les parties expirées puis les plus anciennes au-delà de max_sessions."""
+        with self._lock:
+            expired = self._connection.execute(
+                "DELETE FROM sessions WHERE updated_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            self._evict_oldest()
+            self._connection.commit()
+        return expired
+    
+    def _evict_oldest(self):
+        """Supprime les parties les moins récentes au-delà de max_sessions (verrou tenu)."""
+        self._connection.execute(
+            "DELETE FROM sessions WHERE game_id IN ("
+            "SELECT game_id FROM sessions ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_sessions,)
+        )
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def create_session_store() -> SessionStore:
+    """
+    Crée le stockage configuré par l'environnement.
+    
+    - WORDLE_SESSION_DB : fichier SQLite (sinon stockage en mémoire)
+    - WORDLE_SESSION_TTL : durée de vie d'une partie inactive (secondes)
+    - WORDLE_MAX_SESSIONS : nombre maximum de parties
+    
+    Returns:
+        SessionStore
+    """
+    ttl = float(os.getenv('WORDLE_SESSION_TTL', DEFAULT_TTL))
+    max_sessions = int(os.getenv('WORDLE_MAX_SESSIONS', DEFAULT_MAX_SESSIONS))
+    
+    path = os.getenv('WORDLE_SESSION_DB')
+    if path:
+        return SQLiteSessionStore(path, ttl=ttl, max_sessions=max_sessions)
+    return MemorySessionStore(ttl=ttl, max_sessions=max_sessions)
@@ -0,0 +1,487 @@
+"""
+Pool de processus pour les calculs du solveur.
+
+Les stratégies (entropie, minimax : O(n²)) et le filtrage ne doivent pas
+s'exécuter sur la boucle d'événements : une suggestion lente bloquerait
+toutes les autres parties. SolverPool les exécute dans des processus
+workers préchargés (dictionnaires, solveurs, matrices de patterns,
+stratégies et livres d'ouvertures). Les endpoints attendent le résultat
+avec une échéance ; passée l'échéance, une réponse de repli (fréquences)
+est calculée dans le processus principal.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from wordle_solver import HybridSolver, ConstraintManager, FeedbackResult, LanguageRegistry
+from wordle_solver.utils import PatternMatrix, metrics
+from wordle_solver.strategies import (
+    FrequencyStrategy,
+    EntropyStrategy,
+    MinimaxStrategy,
+    SimpleStrategy,
+    OpeningBook,
+    suggest_batch
+)
+
+
+# Historique compact d'une partie : (tentative, code du pattern)
+History = Sequence[Tuple[str, int]]
+
+STRATEGY_FACTORIES = {
+    'frequency': FrequencyStrategy,
+    'entropy': lambda: EntropyStrategy(max_words_to_evaluate=100),
+    'minimax': MinimaxStrategy,
+    'simple': SimpleStrategy,
+}
+
+# Stratégies assez rapides pour ne pas avoir besoin de réponse de repli
+FAST_STRATEGIES = {'frequency', 'simple'}
+
+# Stratégie de la réponse de repli (renvoyée si l'échéance expire)
+FALLBACK_STRATEGY = 'frequency'
+
+DEFAULT_TIMEOUT = 2.0
+
+# Part de l'échéance laissée à la stratégie (le reste couvre file et transfert)
+STRATEGY_BUDGET_RATIO = 0.8
+
+# Nombre d'historiques distincts par tâche d'un lot
+BATCH_CHUNK_SIZE = 256
+
+
+def create_strategy(strategy_name: str, languages: Sequence[str] = ('en', 'fr')):
+    """
+    Crée une stratégie et charge ses livres d'ouvertures pré-calculés.
+    
+    Args:
+        strategy_name: Identifiant de la stratégie ('frequency', 'entropy', ...)
+        languages: Langues dont les livres sont chargés
+    
+    Returns:
+        La stratégie (FrequencyStrategy si l'identifiant est inconnu)
+    """
+    strategy = STRATEGY_FACTORIES.get(strategy_name, FrequencyStrategy)()
+    
+    # Livres d'ouvertures pré-calculés (python -m wordle_solver.strategies.opening_book)
+    for language in languages:
+        path = OpeningBook.default_path(strategy_name, language)
+        if not path.exists():
+            continue
+        try:
+            book = OpeningBook.load(path)
+        except (OSError, ValueError):
+            continue
+        if book.matches(_state.dictionary(language)):
+            strategy.use_opening_book(book)
+    
+    return strategy
+
+
+class _SolverState:
+    """
+    Stratégies préchargées d'un processus (parent ou worker).
+    
+    Dictionnaires, solveurs et matrices viennent du registre des langues,
+    partagé par tout le processus (hérité par les workers avec fork). Avec
+    own_solvers, les solveurs (et leurs caches) sont propres à cet état :
+    c'est le cas des réponses de repli, calculées dans un thread du
+    processus principal.
+    """
+    
+    def __init__(self, own_solvers: bool = False):
+        self.own_solvers = own_solvers
+        self.strategies: Dict[str, object] = {}
+        self.solvers: Dict[str, HybridSolver] = {}
+    
+    def dictionary(self, language: str) -> FrozenSet[str]:
+        return LanguageRegistry.get(language).words
+    
+    def solver(self, language: str) -> HybridSolver:
+        if not self.own_solvers:
+            return LanguageRegistry.get(language).solver
+        if language not in self.solvers:
+            self.solvers[language] = HybridSolver(LanguageRegistry.get(language).table)
+        return self.solvers[language]
+    
+    def matrix(self, language: str) -> PatternMatrix:
+        return LanguageRegistry.get(language).pattern_matrix
+    
+    def strategy(self, strategy_name: str):
+        if strategy_name not in self.strategies:
+            self.strategies[strategy_name] = create_strategy(strategy_name)
+        return self.strategies[strategy_name]
+    
+    def preload(self, languages: Sequence[str], strategy_names: Sequence[str]):
+        """Charge tout ce dont les tâches auront besoin."""
+        LanguageRegistry.warm_up(languages)
+        for language in languages:
+            self.solver(language)
+        for strategy_name in strategy_names:
+            self.strategy(strategy_name)
+
+
+_state = _SolverState()
+
+# État des réponses de repli (thread du processus principal) : solveurs et
+# stratégie distincts de ceux de _state, aucun cache partagé entre threads
+_fallback_state = _SolverState(own_solvers=True)
+
+
+def _init_worker(languages: Sequence[str], strategy_names: Sequence[str], metrics_enabled: bool = False):
+    """Précharge un worker (déjà fait par héritage si le pool utilise fork)."""
+    # Les mesures héritées du parent (fork) y sont déjà comptées
+    metrics.enable(metrics_enabled)
+    metrics.reset()
+    _state.preload(languages, strategy_names)
+
+
+def _measured(function, *args):
+    """Exécute une tâche et renvoie aussi les mesures du worker (remises à zéro)."""
+    result = function(*args)
+    return result, metrics.drain() if metrics.is_enabled() else None
+
+
+def _ping() -> int:
+    """Tâche vide servant à démarrer les workers."""
+    return os.getpid()
+
+
+def _constraints(history: History) -> ConstraintManager:
+    """Reconstruit le gestionnaire de contraintes d'une partie."""
+    constraint_manager = ConstraintManager()
+    for guess, code in history:
+        constraint_manager.apply_feedback(FeedbackResult.from_code(guess, code))
+    return constraint_manager
+
+
+def possible_words_task(language: str, history: History, limit: int = 100) -> Tuple[int, List[str]]:
+    """
+    Calcule les mots possibles d'une partie.
+    
+    Args:
+        language: Langue de la partie
+        history: Historique (tentative, code)
+        limit: Nombre maximum de mots retournés
+    
+    Returns:
+        Tuple (nombre de mots possibles, premiers mots triés)
+    """
+    constraint_manager = _constraints(history)
+    solver = _state.solver(language)
+    words = solver.get_possible_words(constraint_manager, limit=limit)
+    return solver.count_possible_words(constraint_manager), words
+
+
+def suggest_task(
+    language: str,
+    strategy_name: str,
+    history: History,
+    limit: int = 10,
+    deadline: Optional[float] = None,
+    state: Optional[_SolverState] = None
+) -> Dict:
+    """
+    Calcule la suggestion d'une stratégie pour une partie.
+    
+    L'échéance est transmise à la stratégie (choose_word anytime) : elle
+    renvoie le meilleur mot trouvé à temps et indique sa qualité.
+    
+    Args:
+        language: Langue de la partie
+        strategy_name: Identifiant de la stratégie
+        history: Historique (tentative, code)
+        limit: Nombre de mots possibles retournés
+        deadline: Échéance absolue (time.time()), optionnelle
+        state: Solveurs et stratégies utilisés (défaut : ceux du processus)
+    
+    Returns:
+        Dictionnaire de la réponse de /api/game/suggest
+    """
+    state = state or _state
+    constraint_manager = _constraints(history)
+    solver = state.solver(language)
+    possible_words = solver.solve(constraint_manager, use_cpsat=False)
+    
+    if not possible_words:
+        return {
+            "suggested_word": None,
+            "possible_words": [],
+            "possible_words_count": 0,
+            "explanation": "Aucun mot possible trouvé",
+            "strategy": strategy_name,
+            "quality": "exact",
+            "complete": True
+        }
+    
+    strategy = state.strategy(strategy_name)
+    strategy.stats['quality'] = 'exact'
+    
+    attempt_number = len(history) + 1
+    if attempt_number == 1:
+        suggested = strategy.get_first_guess(language)
+    else:
+        suggested = strategy.choose_word(
+            possible_words,
+            constraint_manager,
+            attempt_number,
+            full_dictionary=state.dictionary(language),
+            pattern_matrix=state.matrix(language),
+            deadline=deadline
+        )
+    
+    quality = strategy.stats['quality']
+    return {
+        "suggested_word": suggested,
+        "possible_words": solver.get_possible_words(constraint_manager, limit=limit),
+        "possible_words_count": len(possible_words),
+        "explanation": strategy.explain_choice(suggested, possible_words),
+        "strategy": strategy_name,
+        "quality": quality,
+        "complete": quality == 'exact'
+    }
+
+
+def suggest_batch_task(
+    language: str,
+    strategy_name: str,
+    histories: Sequence[History],
+    limit: int = 0
+) -> List[Dict]:
+    """
+    Calcule les suggestions d'un lot d'historiques distincts.
+    
+    Le filtrage est partagé entre historiques de même préfixe
+    (voir strategies.suggest_batch).
+    
+    Args:
+        language: Langue des parties
+        strategy_name: Identifiant de la stratégie
+        histories: Historiques (tentative, code), de préférence triés
+        limit: Nombre de candidats joints à chaque suggestion
+    
+    Returns:
+        Une suggestion (dictionnaire) par historique, dans l'ordre reçu
+    """
+    results = suggest_batch(
+        _state.strategy(strategy_name),
+        _state.solver(language),
+        histories,
+        language=language,
+        pattern_matrix=_state.matrix(language),
+        limit=limit
+    )
+    return [suggestion.to_dict() for _, suggestion in results]
+
+
+def _pool_context():
+    """Fork si disponible : les workers héritent des objets préchargés."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+class SolverPool:
+    """
+    Pool de workers exécutant filtrage et stratégies hors de la boucle d'événements.
+    
+    Usage :
+        pool = SolverPool(languages=('en', 'fr'))
+        pool.start()                      # au démarrage de l'application
+        result = await pool.suggest('en', 'minimax', history, timeout=0.5)
+        pool.shutdown()
+    """
+    
+    def __init__(
+        self,
+        languages: Sequence[str] = ('en', 'fr'),
+        strategy_names: Sequence[str] = tuple(STRATEGY_FACTORIES),
+        workers: Optional[int] = None,
+        default_timeout: float = DEFAULT_TIMEOUT
+    ):
+        """
+        Initialise le pool (les processus sont créés par start()).
+        
+        Args:
+            languages: Langues préchargées
+            strategy_names: Stratégies préchargées
+            workers: Nombre de processus (None = nombre de cœurs)
+            default_timeout: Échéance par défaut d'une suggestion (secondes)
+        """
+        self.languages = tuple(languages)
+        self.strategy_names = tuple(strategy_names)
+        self.workers = workers or os.cpu_count() or 1
+        self.default_timeout = default_timeout
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # Réponses de repli : un seul thread du processus principal, avec son propre état (_fallback_state)
+        self.fallback_executor: Optional[ThreadPoolExecutor] = None
+        self.timeouts = 0
+    
+    def start(self):
+        """
+        Précharge les données puis démarre les workers.
+        
+        Les données sont chargées dans le processus parent avant le fork
+        (partagées en copy-on-write), et tous les workers sont démarrés
+        immédiatement plutôt qu'à la première requête.
+        """
+        if self.executor is not None:
+            return
+        
+        _state.preload(self.languages, self.strategy_names)
+        _fallback_state.preload(self.languages, (FALLBACK_STRATEGY,))
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(self.languages, self.strategy_names, metrics.is_enabled())
+        )
+        self.fallback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='suggest-fallback')
+        for future in [self.executor.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+    
+    def shutdown(self):
+        """Arrête les workers (sans attendre les tâches abandonnées)."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        if self.fallback_executor is not None:
+            self.fallback_executor.shutdown(wait=False, cancel_futures=True)
+            self.fallback_executor = None
+    
+    async def run(self, function, *args):
+        """
+        Exécute une tâche dans un worker.
+        
+        Les mesures du worker sont fusionnées dans celles du processus, et
+        la durée vue d'ici (file d'attente comprise) est notée dans la
+        phase 'pool <tâche>'.
+        
+        Args:
+            function: Fonction de niveau module (sérialisable)
+            *args: Arguments
+        
+        Returns:
+            Le résultat de la fonction
+        """
+        if self.executor is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        with metrics.timer(f"pool {function.__name__}"):
+            result, measures = await loop.run_in_executor(self.executor, _measured, function, *args)
+        metrics.merge(measures)
+        return result
+    
+    async def possible_words(self, language: str, history: History, limit: int = 100) -> Tuple[int, List[str]]:
+        """Mots possibles d'une partie (voir possible_words_task)."""
+        return await self.run(possible_words_task, language, tuple(history), limit)
+    
+    async def suggest(
+        self,
+        language: str,
+        strategy_name: str,
+        history: History,
+        limit: int = 10,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Suggestion d'une stratégie, bornée dans le temps.
+        
+        Une seule tâche est soumise au pool : la stratégie reçoit une
+        échéance (STRATEGY_BUDGET_RATIO du délai) et renvoie le meilleur mot
+        trouvé à temps ("quality"). Si la tâche n'a pas répondu à l'échéance
+        (workers saturés), elle est annulée (retirée de la file si aucun
+        worker ne l'a commencée) et, pour les stratégies lentes, une réponse
+        de repli (fréquences) est calculée dans le processus principal, sans
+        attendre de worker, puis renvoyée avec "complete": False.
+        
+        Args:
+            language: Langue de la partie
+            strategy_name: Identifiant de la stratégie
+            history: Historique (tentative, code)
+            limit: Nombre de mots possibles retournés
+            timeout: Échéance en secondes (défaut : default_timeout)
+        
+        Returns:
+            Dictionnaire de la réponse de /api/game/suggest
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        history = tuple(history)
+        deadline = time.time() + timeout * STRATEGY_BUDGET_RATIO
+        
+        full = asyncio.ensure_future(
+            self.run(suggest_task, language, strategy_name, history, limit, deadline)
+        )
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(full), timeout)
+        except asyncio.TimeoutError:
+            if strategy_name in FAST_STRATEGIES:
+                # Stratégie rapide : on attend la réponse complète
+                return await full
+        
+        full.cancel()
+        self.timeouts += 1
+        with metrics.timer("suggest_fallback"):
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.fallback_executor, suggest_task,
+                language, FALLBACK_STRATEGY, history, limit, None, _fallback_state
+            )
+        result["strategy"] = strategy_name
+        result["quality"] = "heuristic"
+        result["complete"] = False
+        return result
+    
+    async def suggest_batch(
+        self,
+        language: str,
+        strategy_name: str,
+        histories: Sequence[History],
+        limit: int = 0,
+        chunk_size: int = BATCH_CHUNK_SIZE
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Suggestions d'un lot, réparties entre les workers.
+        
+        Les historiques sont dédoublonnés puis triés, pour que ceux qui
+        partagent un préfixe tombent dans la même tâche, et découpés en
+        tâches de chunk_size historiques exécutées en parallèle.
+        
+        Args:
+            language: Langue des parties
+            strategy_name: Identifiant de la stratégie
+            histories: Historiques (tentative, code)
+            limit: Nombre de candidats joints à chaque suggestion
+            chunk_size: Nombre d'historiques distincts par tâche
+        
+        Yields:
+            Listes de suggestions (une par historique distinct), dans
+            l'ordre où les tâches se terminent
+        """
+        unique = sorted({tuple((guess.upper(), int(code)) for guess, code in history) for history in histories})
+        tasks = [
+            asyncio.ensure_future(
+                self.run(suggest_batch_task, language, strategy_name, unique[start:start + chunk_size], limit)
+            )
+            for start in range(0, len(unique), chunk_size)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def get_stats(self) -> Dict:
+        """Statistiques du pool."""
+        return {
+            "workers": self.workers,
+            "running": self.executor is not None,
+            "languages": list(self.languages),
+            "strategies": list(self.strategy_names),
+            "timeouts": self.timeouts,
+        }
@@ -20,13 +20,14 @@ from wordle_solver.strategies import (
 )
 
 
-def benchmark_all_strategies(n_words: int = 30, language: str = "en"):
+def benchmark_all_strategies(n_words: int = 30, language: str = "en", workers: int = 1):
     """
     Benchmark de toutes les stratégies disponibles.
     
     Args:
         n_words: Nombre de mots à tester
         language: Langue ('en' ou 'fr')
+        workers: Nombre de processus (0 = tous les cœurs)
     """
     print("\n" + "="*80)
     print(f"BENCHMARK DES STRATÉGIES WORDLE".center(80))
@@ -53,7 +54,8 @@ def benchmark_all_strategies(n_words: int = 30, language: str = "en"):
         strategies=strategies,
         n_words=n_words,
         language=language,
-        verbose=True
+        verbose=True,
+        workers=workers or None
     )
     
     # Afficher le gagnant
@@ -246,12 +248,18 @@ def main():
         default='frequency',
         help='Stratégie à démontrer (mode demo)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Nombre de processus pour le benchmark (0 = tous les cœurs)'
+    )
     
     args = parser.parse_args()
     
     try:
         if args.mode == 'benchmark':
-            benchmark_all_strategies(args.n_words, args.language)
+            benchmark_all_strategies(args.n_words, args.language, args.workers)
         
         elif args.mode == 'compare':
             compare_two_strategies()
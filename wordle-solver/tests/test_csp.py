@@ -2,15 +2,22 @@
 Tests unitaires pour le module CSP.
 """
 
+import os
+import subprocess
 import sys
+import time
 from pathlib import Path
 
-# Ajouter le dossier parent au path pour les imports
+# Ajouter le dossier parent (et le backend) au path pour les imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
+import numpy as np
 import pytest
-from wordle_solver.csp import ConstraintManager, WordFilter, HybridSolver
-from wordle_solver.game import generate_feedback, Feedback
+from wordle_solver.csp import ConstraintManager, WordFilter, HybridSolver, CandidateIndex
+from wordle_solver.game import generate_feedback, feedback_code, feedback_codes, Feedback, FeedbackResult
+from wordle_solver.dictionaries import WordTable, LanguageRegistry
+from session_store import GameSession, MemorySessionStore, SQLiteSessionStore
 
 
 class TestConstraintManager:
@@ -96,6 +103,160 @@ class TestWordFilter:
         assert "AROSE" not in valid_words
 
 
+class TestCandidateIndex:
+    """Tests pour l'index de candidats par bitsets."""
+    
+    DICTIONARY = {"ROBOT", "AROSE", "SLATE", "ROVER", "ROOST", "ROOTS", "SPEED", "EERIE", "STEEL"}
+    
+    def test_words_are_sorted_ids(self):
+        """Les identifiants suivent l'ordre alphabétique."""
+        index = CandidateIndex(self.DICTIONARY)
+        assert list(index.words) == sorted(self.DICTIONARY)
+        assert index.words_of(index.full_mask) == sorted(self.DICTIONARY)
+    
+    def test_first_and_top_words_without_full_sort(self):
+        """Les k premiers mots (parcours arrêté) et les k meilleurs scores."""
+        table = LanguageRegistry.get("en").table
+        solver = HybridSolver(table)
+        index = solver.word_filter.index
+        cm = ConstraintManager.from_feedbacks([generate_feedback("SLATE", "CRANE")])
+        expected = sorted(w for w in table if cm.is_word_valid(w))
+        
+        for limit in (1, 7, len(expected) + 5):
+            assert solver.get_possible_words(cm, limit=limit) == expected[:limit]
+        sparse = index.mask_of([table[0], table[len(table) // 2], table[-1]])
+        assert index.words_of(sparse, 2) == [table[0], table[len(table) // 2]]
+        
+        scores = np.zeros(len(table))
+        scores[table.index[expected[-1]]] = 2.0
+        scores[table.ids(expected[3:6])] = 1.0
+        assert solver.get_possible_words(cm, limit=3, scores=scores) == [expected[-1]] + expected[3:5]
+        assert solver.get_possible_words(cm, scores=scores)[:4] == [expected[-1]] + expected[3:6]
+        assert solver.count_possible_words(cm) == len(expected)
+    
+    @pytest.mark.parametrize("guesses,target", [
+        (["AROSE"], "ROBOT"),
+        (["SPEED", "STEEL"], "EERIE"),
+        (["ROOTS", "ROOST"], "ROBOT"),
+        (["EERIE"], "SPEED"),
+    ])
+    def test_mask_matches_is_word_valid(self, guesses, target):
+        """Le masque équivaut à is_word_valid sur chaque mot."""
+        index = CandidateIndex(self.DICTIONARY)
+        cm = ConstraintManager()
+        for guess in guesses:
+            cm.apply_feedback(generate_feedback(guess, target))
+        
+        expected = sorted(w for w in self.DICTIONARY if cm.is_word_valid(w))
+        assert index.words_of(index.mask_for(cm)) == expected
+
+
+class TestWordTable:
+    """Tests pour la table de mots encodée."""
+    
+    def test_canonical_ids_and_letters(self):
+        """Les mots sont normalisés une fois et encodés par identifiant."""
+        table = WordTable({"robot", "ROBOT", "Arose", "CŒURS"})
+        assert table.words == ("AROSE", "CŒURS", "ROBOT")
+        assert table.letters.shape == (3, 5)
+        assert "".join(table.alphabet[c] for c in table.letters[1]) == "CŒURS"
+        assert list(table.ids(["ROBOT", "AROSE"])) == [2, 0]
+        assert table.counts[table.index["ROBOT"], table.letter_index["O"]] == 2
+    
+    def test_letter_statistics(self):
+        """Comptes par position (bincount) et par présence, sur tout ou partie des mots."""
+        table = WordTable({"ROBOT", "ROOST", "SPEED"})
+        o = table.letter_index["O"]
+        
+        assert table.position_counts()[1, o] == 2
+        assert table.position_counts().sum() == 15
+        assert table.position_counts(table.ids(["ROOST"]))[2, o] == 1
+        assert table.presence_counts()[o] == 2
+        assert table.presence_counts(table.ids(["ROBOT"]))[o] == 1
+        assert table.presence[table.index["SPEED"], table.letter_index["E"]]
+    
+    def test_immutable_and_shared(self):
+        """La table est immuable et partagée par les composants."""
+        table = WordTable(TestCandidateIndex.DICTIONARY)
+        with pytest.raises(AttributeError):
+            table.words = ()
+        with pytest.raises(ValueError):
+            table.letters[0, 0] = 0
+        
+        solver = HybridSolver(table)
+        assert solver.word_filter.index.table is table
+        assert WordTable.of(table) is table
+    
+    def test_other_word_lengths(self):
+        """Une table de mots de 6 lettres donne codes 3^6, matrice uint16 et index de même longueur."""
+        from wordle_solver.utils import PatternMatrix
+        
+        table = WordTable({"BANANA", "BANDIT", "CANNON", "DANGER", "GARDEN", "RANGED"})
+        assert table.word_length == 6 and table.letters.shape == (6, 6)
+        with pytest.raises(ValueError):
+            WordTable({"ROBOT", "BANANA"})
+        
+        matrix = PatternMatrix(table, persist=False)
+        assert matrix.n_patterns == 729 and matrix.matrix.dtype == np.uint16
+        for g in range(len(table)):
+            for t in range(len(table)):
+                assert matrix.matrix[g, t] == feedback_code(table[g], table[t])
+        assert generate_feedback("RANGED", "DANGER").to_pattern() == "YGGGGY"
+        assert FeedbackResult.from_code("DANGER", 728).is_correct()
+        
+        cm = ConstraintManager()
+        cm.apply_feedback(generate_feedback("BANANA", "GARDEN"))
+        assert HybridSolver(table).solve(cm) == {w for w in table if cm.is_word_valid(w)}
+        assert cm.word_length == 6 and not cm.is_word_valid("ROBOT")
+
+
+class TestLanguageRegistry:
+    """Tests pour le registre des langues."""
+    
+    def test_loaded_once_and_shared(self):
+        """Une langue est chargée une fois et ses structures partagées."""
+        data = LanguageRegistry.get("en")
+        assert LanguageRegistry.get("EN") is data
+        assert data.solver is data.solver
+        assert data.index.table is data.table
+        assert data.validator.valid_words is data.words
+        assert data.validator.is_valid("crane")
+        assert data.random_word() in data
+        with pytest.raises(AttributeError):
+            data.words = frozenset()
+    
+    def test_memory_estimate_before_loading(self):
+        """L'estimation mémoire précède toute construction et suit N² pour la matrice."""
+        from wordle_solver.dictionaries import estimate_memory
+        
+        assert estimate_memory(1000, 5)['pattern_matrix'] == 1000 ** 2
+        assert estimate_memory(1000, 6)['pattern_matrix'] == 2 * 1000 ** 2
+        estimate = LanguageRegistry.memory_estimate("fr")
+        assert estimate['pattern_matrix'] == len(LanguageRegistry.get("fr")) ** 2
+        assert estimate['total'] == sum(v for k, v in estimate.items() if k != 'total')
+    
+    def test_other_lengths_need_a_word_list(self, tmp_path):
+        """Sans fichier fourni, une autre longueur lève une erreur explicite ; register() la rend utilisable."""
+        from wordle_solver.dictionaries import DictionaryLoader
+        
+        assert 7 not in DictionaryLoader.available_lengths("en")
+        with pytest.raises(FileNotFoundError, match="register"):
+            LanguageRegistry.get("en", 7)
+        with pytest.raises(FileNotFoundError, match="en_words_7.txt"):
+            LanguageRegistry.memory_estimate("en", 7)
+        
+        path = tmp_path / "mots7.txt"
+        path.write_text("bananes\ncamions\ndangers\nrobot\n", encoding="utf-8")
+        try:
+            data = LanguageRegistry.register("en", path, 7)
+            assert LanguageRegistry.get("en", 7) is data
+            assert sorted(data.words) == ["BANANES", "CAMIONS", "DANGERS"]
+            assert LanguageRegistry.memory_estimate("en", 7)['pattern_matrix'] == 2 * 3 ** 2
+            assert data.solver.get_possible_words(ConstraintManager(word_length=7)) == sorted(data.words)
+        finally:
+            LanguageRegistry.clear()
+
+
 class TestHybridSolver:
     """Tests pour le solveur hybride."""
     
@@ -142,6 +303,77 @@ class TestHybridSolver:
             assert "ROBOT" in possible2
 
 
+    def test_incremental_narrowing_with_fork_and_reset(self):
+        """Le filtrage incrémental reste exact après fork ou reset."""
+        dictionary = {"ROBOT", "AROSE", "SLATE", "ROVER", "ROOST", "ROOTS", "BOOST", "TORSO"}
+        solver = HybridSolver(dictionary)
+        cm = ConstraintManager()
+        
+        cm.apply_feedback(generate_feedback("AROSE", "ROBOT"))
+        solver.solve(cm)
+        
+        fork = cm.copy()
+        fork.apply_feedback(generate_feedback("ROOST", "ROBOT"))
+        cm.apply_feedback(generate_feedback("SLATE", "ROBOT"))
+        
+        for manager in (fork, cm):
+            expected = {w for w in dictionary if manager.is_word_valid(w)}
+            assert solver.solve(manager) == expected
+        
+        cm.reset()
+        assert solver.solve(cm) == dictionary
+    
+    def test_cpsat_matches_filtering(self):
+        """Le modèle CP-SAT (table + fréquences) donne les mêmes mots que le filtrage."""
+        dictionary = {"SPEED", "STEEL", "EERIE", "LEVEL", "KEEPS", "ABBEY", "CREEP", "ROBOT", "EMBER", "GEESE"}
+        solver = HybridSolver(dictionary)
+        
+        for guess, target in [("GEESE", "SPEED"), ("EERIE", "LEVEL"), ("ABBEY", "EMBER"), ("ROBOT", "ROBOT")]:
+            cm = ConstraintManager.from_feedbacks([generate_feedback(guess, target)])
+            expected = {w for w in dictionary if cm.is_word_valid(w)}
+            
+            assert solver.solve(cm, use_cpsat=True) == expected
+            assert set(solver.csp_solver.solve_with_cpsat(cm, hint=target)) == expected
+
+
+
+class TestImportTime:
+    """Budget de temps d'import du paquet (OR-Tools chargé à la demande)."""
+    
+    # Budget en millisecondes, ajustable pour les machines lentes
+    BUDGET_MS = float(os.environ.get('WORDLE_IMPORT_BUDGET_MS', 350))
+    
+    SCRIPT = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        "import wordle_solver\n"
+        "print((time.perf_counter() - t) * 1000, 'ortools' in sys.modules)\n"
+    )
+    
+    def test_import_without_ortools(self):
+        """import wordle_solver n'importe pas OR-Tools et tient dans le budget."""
+        root = str(Path(__file__).parent.parent)
+        timings = []
+        for _ in range(3):
+            out = subprocess.run(
+                [sys.executable, "-c", self.SCRIPT], cwd=root,
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            assert out[1] == "False"
+            timings.append(float(out[0]))
+        
+        assert min(timings) < self.BUDGET_MS, f"import wordle_solver : {min(timings):.0f} ms"
+    
+    def test_cpsat_loaded_lazily(self):
+        """WordleCSPSolver reste accessible depuis le paquet csp."""
+        import wordle_solver.csp as csp
+        
+        solver = csp.WordleCSPSolver({"ROBOT", "SPEED"})
+        assert solver.solve(ConstraintManager()) == ["ROBOT", "SPEED"]
+        with pytest.raises(AttributeError):
+            csp.MissingSolver
+
+
 class TestFeedbackGeneration:
     """Tests pour la génération de feedback."""
     
@@ -170,6 +402,137 @@ class TestFeedbackGeneration:
         # On vérifie juste que le système gère les duplications
         assert feedback is not None
         assert len(feedback.feedbacks) == 5
+    
+    @staticmethod
+    def _reference_pattern(guess, target):
+        """Algorithme de référence à deux passages (liste de lettres consommées)."""
+        pattern = ['B'] * 5
+        target_letters = list(target)
+        for i in range(5):
+            if guess[i] == target[i]:
+                pattern[i] = 'G'
+                target_letters[i] = None
+        for i in range(5):
+            if pattern[i] == 'B' and guess[i] in target_letters:
+                pattern[i] = 'Y'
+                target_letters[target_letters.index(guess[i])] = None
+        return ''.join(pattern)
+    
+    @pytest.mark.parametrize("guess,target", [
+        ("SPEED", "ABIDE"), ("SPEED", "EERIE"), ("EERIE", "SPEED"), ("ROBOT", "ROOST"),
+        ("LEVEL", "STEEL"), ("ABBEY", "BABES"), ("KEEPS", "EERIE"), ("AROSE", "ROBOT"),
+        ("ALLOT", "LLAMA"), ("EEEEE", "SPEED"),
+    ])
+    def test_feedback_code_matches_reference(self, guess, target):
+        """feedback_code est identique à l'algorithme de référence (doublons inclus)."""
+        code = feedback_code(guess, target)
+        feedback = generate_feedback(guess, target)
+        assert feedback.code == code
+        assert feedback.to_pattern() == self._reference_pattern(guess, target)
+    
+    def test_batch_codes_match_scalar(self):
+        """feedback_codes (NumPy) donne les mêmes codes que feedback_code."""
+        table = WordTable({"SPEED", "ABIDE", "EERIE", "ROBOT", "ROOST", "LEVEL", "STEEL", "LLAMA"})
+        ids = list(range(len(table)))
+        codes = feedback_codes(ids, ids, table)
+        for g in ids:
+            for t in ids:
+                assert codes[g, t] == feedback_code(table[g], table[t])
+    
+    def test_lazy_result_from_code(self):
+        """Un FeedbackResult créé depuis un code ne décode les Feedback qu'à la demande."""
+        feedback = FeedbackResult.from_code("AROSE", feedback_code("AROSE", "ROBOT"))
+        assert feedback._feedbacks is None
+        assert feedback.to_pattern() == "BYYBB"
+        assert feedback._feedbacks is None
+        assert feedback.feedbacks == generate_feedback("AROSE", "ROBOT").feedbacks
+        assert not feedback.is_correct()
+
+
+class TestSessionStore:
+    """Tests des stockages de parties de l'API (mémoire et SQLite)."""
+    
+    @staticmethod
+    def make_store(kind, tmp_path, **kwargs):
+        if kind == "memory":
+            return MemorySessionStore(**kwargs)
+        return SQLiteSessionStore(str(tmp_path / "sessions.db"), **kwargs)
+    
+    @staticmethod
+    def make_session(game_id, guesses=(), updated_at=None):
+        session = GameSession(game_id=game_id, language="en", strategy_name="frequency", target_word="ROBOT")
+        for guess in guesses:
+            session.record(generate_feedback(guess, "ROBOT"))
+        if updated_at is not None:
+            session.updated_at = updated_at
+        return session
+    
+    @pytest.mark.parametrize("kind", ["memory", "sqlite"])
+    def test_round_trip(self, kind, tmp_path):
+        """Tentatives et codes sont relus à l'identique ; partie et contraintes reconstruites."""
+        store = self.make_store(kind, tmp_path)
+        store.put(self.make_session("g1", ["AROSE", "STEEL", "ROBOT"]))
+        
+        session = store.get("g1")
+        assert session.guesses == ["AROSE", "STEEL", "ROBOT"]
+        assert session.codes == [generate_feedback(g, "ROBOT").code for g in ("AROSE", "STEEL", "ROBOT")]
+        game, cm = session.restore()
+        assert game.is_won and cm.is_word_valid("ROBOT") and not cm.is_word_valid("AROSE")
+        assert store.get("missing") is None
+        assert store.delete("g1") and not store.delete("g1")
+        store.close()
+    
+    @pytest.mark.parametrize("kind", ["memory", "sqlite"])
+    def test_ttl_expiry(self, kind, tmp_path):
+        """Une partie inactive au-delà du TTL n'est plus retournée et est purgée."""
+        store = self.make_store(kind, tmp_path, ttl=60)
+        store.put(self.make_session("old", ["AROSE"], updated_at=time.time() - 120))
+        store.put(self.make_session("new", ["AROSE"]))
+        
+        assert store.get("old") is None
+        assert store.get("new") is not None
+        store.purge_expired()
+        assert len(store) == 1
+        store.close()
+    
+    @pytest.mark.parametrize("kind", ["memory", "sqlite"])
+    def test_max_sessions(self, kind, tmp_path):
+        """Le nombre de parties est borné à chaque écriture ; les moins récentes sont évincées."""
+        store = self.make_store(kind, tmp_path, max_sessions=2)
+        now = time.time()
+        for i in range(3):
+            store.put(self.make_session(f"g{i}", updated_at=now + i))
+        
+        assert len(store) == 2
+        assert store.get("g0") is None
+        assert store.get("g1") is not None and store.get("g2") is not None
+        store.close()
+    
+    @pytest.mark.parametrize("kind", ["memory", "sqlite"])
+    def test_codes_above_one_byte(self, kind, tmp_path):
+        """Les codes de pattern au-delà de 255 (mots de 6 à 8 lettres, 3^L codes) sont conservés."""
+        store = self.make_store(kind, tmp_path)
+        session = GameSession(game_id="g1", language="en", strategy_name="frequency", target_word="ROBOTS")
+        session.guesses = ["STROBE", "ROBOTS"]
+        session.codes = [3 ** 6 - 2, 3 ** 6 - 1]
+        store.put(session)
+
+        assert store.get("g1").codes == [727, 728]
+        store.close()
+
+    def test_sqlite_shared_between_instances(self, tmp_path):
+        """Le fichier SQLite est relu par une seconde instance (autre worker)."""
+        first = self.make_store("sqlite", tmp_path)
+        first.put(self.make_session("g1", ["AROSE", "ROBOT"]))
+        
+        second = self.make_store("sqlite", tmp_path)
+        session = second.get("g1")
+        assert session.guesses == ["AROSE", "ROBOT"] and session.restore()[0].is_won
+        session.record(generate_feedback("STEEL", "ROBOT"))
+        second.put(session)
+        assert first.get("g1").guesses == ["AROSE", "ROBOT", "STEEL"]
+        first.close()
+        second.close()
 
 
 def test_full_game_simulation():
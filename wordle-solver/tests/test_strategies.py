@@ -0,0 +1,615 @@
+"""
+Tests unitaires pour les stratégies et la matrice de patterns.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent (et le backend) au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+import asyncio
+import time
+import pytest
+from wordle_solver.csp import ConstraintManager, HybridSolver
+from wordle_solver.dictionaries import LanguageRegistry
+from wordle_solver.game import FeedbackResult, generate_feedback, hard_mode_violation, MultiBoardGame, WordleGame
+import numpy as np
+from wordle_solver.strategies import (
+    EntropyStrategy, FastEntropyStrategy, MinimaxStrategy, ExpectedSizeStrategy,
+    FrequencyStrategy, PositionalFrequencyStrategy, StrategyComparator, OpeningBook, OptimalStrategy, suggest_batch,
+    MultiBoardStrategy
+)
+from wordle_solver.utils import (
+    PatternMatrix, LRUCache, cache_stats, encode_feedbacks, code_to_pattern, pattern_to_code,
+    score_guesses, score_guesses_until, frequency_priority, score_boards, metrics
+)
+
+
+TEST_WORDS = {
+    "ROBOT", "AROSE", "SLATE", "ROVER", "ROOST", "ROOTS", "SPEED", "EERIE",
+    "ABBEY", "KEEPS", "CRANE", "TRACE", "CARET", "REACT", "STEEL", "LEVEL",
+}
+
+
+class TestPatternMatrix:
+    """Tests pour la matrice de patterns."""
+    
+    def test_matches_generate_feedback(self):
+        """Chaque case correspond exactement à generate_feedback (doublons inclus)."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        
+        for guess in pm.words:
+            for target in pm.words:
+                expected = encode_feedbacks(generate_feedback(guess, target).feedbacks)
+                assert pm.pattern_code(guess, target) == expected
+    
+    def test_pattern_code_roundtrip(self):
+        """Conversion pattern texte <-> code."""
+        assert pattern_to_code("GGGGG") == 242
+        assert pattern_to_code("BBBBB") == 0
+        for code in (0, 17, 121, 242):
+            assert pattern_to_code(code_to_pattern(code)) == code
+    
+    def test_persisted_matrix_is_memory_mapped(self, tmp_path):
+        """La matrice sauvegardée est rechargée en mmap."""
+        built = PatternMatrix(TEST_WORDS, cache_dir=tmp_path, persist=True)
+        expected = built.matrix.copy()
+        assert built.cache_path.exists()
+        
+        reloaded = PatternMatrix(TEST_WORDS, cache_dir=tmp_path, persist=True)
+        assert reloaded.matrix.base is not None  # memmap
+        assert (reloaded.matrix == expected).all()
+    
+    def test_subset_matrices_stay_in_memory(self, tmp_path, monkeypatch):
+        """Seules les matrices des dictionnaires de langue sont sauvegardées, pas les sous-ensembles."""
+        monkeypatch.setenv("WORDLE_SOLVER_CACHE_DIR", str(tmp_path))
+        words = LanguageRegistry.get("en").table.words
+        subset = set(words[::10][:1200])
+        
+        matrix = PatternMatrix.for_words(subset)
+        assert not matrix.persist and matrix.matrix.shape == (1200, 1200)
+        assert list(tmp_path.iterdir()) == []
+        assert PatternMatrix.for_words(subset) is matrix
+
+    def test_language_matrix_saved_after_for_words(self, tmp_path, monkeypatch):
+        """Une matrice de langue créée d'abord par for_words est sauvegardée par for_language."""
+        monkeypatch.setenv("WORDLE_SOLVER_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(PatternMatrix, "_registry", type(PatternMatrix._registry)())
+        monkeypatch.setattr(PatternMatrix, "_by_language", {})
+        monkeypatch.setattr(LanguageRegistry, "_languages", dict(LanguageRegistry._languages))
+        table = LanguageRegistry.register("xx", TEST_WORDS).table
+
+        matrix = PatternMatrix.for_words(table)
+        matrix.matrix
+        assert not matrix.cache_path.exists()
+
+        assert PatternMatrix.for_language("xx") is matrix
+        assert matrix.persist and matrix.cache_path.exists()
+
+
+class TestLRUCache:
+    """Tests pour le cache LRU borné."""
+    
+    def test_eviction_and_counters(self):
+        """Les entrées les plus anciennes sont évincées et comptées."""
+        cache = LRUCache('test_lru', max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1  # 'a' devient la plus récente
+        cache.put('c', 3)
+        
+        assert 'b' not in cache
+        assert cache.get('b') is None
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    
+    def test_byte_budget(self):
+        """La taille mémoire estimée est bornée."""
+        cache = LRUCache('test_lru_bytes', max_entries=100, max_bytes=100, sizeof=lambda k, v: 40)
+        for i in range(10):
+            cache.put(i, i)
+        assert len(cache) == 2
+        assert cache.bytes == 80
+    
+    def test_stats_aggregated_by_name(self):
+        """cache_stats agrège les caches de même nom."""
+        first = LRUCache('test_lru_aggregate')
+        second = LRUCache('test_lru_aggregate')
+        first.get('missing')
+        second.get('missing')
+        
+        stats = {entry['name']: entry for entry in cache_stats()}
+        assert stats['test_lru_aggregate']['instances'] == 2
+        assert stats['test_lru_aggregate']['misses'] == 2
+
+
+class TestMetrics:
+    """Tests de l'instrumentation par phases."""
+    
+    def test_timers_histograms_and_text(self):
+        """Minuteurs et décorateur alimentent les histogrammes ; inactifs s'ils sont désactivés."""
+        was_enabled = metrics.is_enabled()
+        metrics.reset()
+        try:
+            metrics.enable(False)
+            with metrics.timer("test_phase"):
+                pass
+            assert metrics.snapshot() == {}
+            
+            metrics.enable()
+            with metrics.timer("test_phase"):
+                pass
+            metrics.timed("test_phase")(lambda: None)()
+            metrics.observe("test_phase", 3_000_000_000)
+            
+            state = metrics.drain()
+            assert state["test_phase"]["count"] == 3 and metrics.snapshot() == {}
+            metrics.merge(state)
+            metrics.merge(state)
+            
+            text = metrics.metrics_text()
+            assert 'wordle_phase_duration_seconds_count{phase="test_phase"} 6' in text
+            assert 'wordle_phase_duration_seconds_bucket{phase="test_phase",le="2.5"} 4' in text
+            assert 'wordle_phase_duration_seconds_bucket{phase="test_phase",le="+Inf"} 6' in text
+        finally:
+            metrics.reset()
+            metrics.enable(was_enabled)
+    
+    def test_choose_word_records_time_taken(self):
+        """stats['time_taken'] est renseigné à chaque choix."""
+        strategy = EntropyStrategy()
+        strategy.choose_word(TEST_WORDS, ConstraintManager(), 2, pattern_matrix=PatternMatrix(TEST_WORDS, persist=False))
+        assert strategy.stats['time_taken'] > 0
+
+
+class TestBenchmark:
+    """Tests de la suite de micro-benchmarks de régression."""
+    
+    def test_compare_reports(self):
+        """Classement des écarts au seuil près ; mesures nouvelles ou absentes signalées."""
+        from wordle_solver.cli.benchmark import compare_reports
+        
+        def report(**seconds):
+            return {'results': {name: {'seconds': value} for name, value in seconds.items()}}
+        
+        baseline = report(slower=1.0, faster=1.0, same=1.0, gone=1.0)
+        current = report(slower=1.5, faster=0.5, same=1.1, added=1.0)
+        status = {row['name']: row['status'] for row in compare_reports(baseline, current, threshold=0.2)}
+        assert status == {
+            'slower': 'regression', 'faster': 'improvement', 'same': 'ok', 'gone': 'missing', 'added': 'new',
+        }
+    
+    def test_quick_run_is_reproducible(self, tmp_path):
+        """Série rapide filtrée : mêmes noms et mêmes dictionnaires d'une exécution à l'autre."""
+        from wordle_solver.cli.benchmark import BenchmarkConfig, load_report, main, run_benchmarks
+        
+        config = BenchmarkConfig.quick()
+        first = run_benchmarks(['en'], config, seed=1, only='filter')
+        second = run_benchmarks(['en'], config, seed=1, only='filter')
+        assert sorted(first['results']) == [f'en/filter/turn{k}' for k in (1, 2, 3, 4)]
+        assert first['dictionaries'] == second['dictionaries']
+        assert all(result['seconds'] > 0 for result in first['results'].values())
+        
+        output = tmp_path / "bench.json"
+        assert main(['run', '--quick', '--languages', 'en', '--only', 'feedback', '--output', str(output)]) == 0
+        assert list(load_report(output)['results']) == ['en/feedback']
+        assert main(['compare', str(output), str(output)]) == 0
+
+
+class TestMatrixStrategies:
+    """Tests des stratégies basées sur la matrice de patterns."""
+    
+    @pytest.mark.parametrize("strategy", [
+        EntropyStrategy(),
+        MinimaxStrategy(),
+        ExpectedSizeStrategy(),
+        FastEntropyStrategy(evaluation_limit=5),
+    ])
+    def test_choose_word_among_candidates(self, strategy):
+        """La stratégie choisit un mot parmi les candidats."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        cm = ConstraintManager()
+        
+        word = strategy.choose_word(TEST_WORDS, cm, 2, pattern_matrix=pm)
+        assert word in TEST_WORDS
+    
+    def test_scores_match_pattern_groups(self):
+        """Entropie, pire cas et taille espérée correspondent aux groupes de patterns."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        target_ids = pm.ids(TEST_WORDS)
+        
+        groups = {}
+        for target in TEST_WORDS:
+            pattern = generate_feedback("CRANE", target).to_pattern()
+            groups[pattern] = groups.get(pattern, 0) + 1
+        sizes = np.array(list(groups.values()), dtype=float)
+        p = sizes / len(TEST_WORDS)
+        
+        scores = score_guesses(pm, pm.ids(["CRANE"]), target_ids)
+        assert scores.worst_case[0] == sizes.max()
+        assert scores.n_groups[0] == len(groups)
+        assert scores.entropy[0] == pytest.approx(-(p * np.log2(p)).sum())
+        assert scores.expected_size[0] == pytest.approx((sizes ** 2).sum() / len(TEST_WORDS))
+    
+    def test_frequency_strategies_pick_best_word_score(self):
+        """Le score vectorisé désigne le mot de meilleur score mot à mot."""
+        cm = ConstraintManager()
+        cm.apply_feedback(generate_feedback("SLATE", "ROBOT"))
+        known = cm.get_known_letters()
+        
+        strategy = FrequencyStrategy()
+        word = strategy.choose_word(TEST_WORDS, cm, 2)
+        frequencies = strategy._calculate_letter_frequencies(TEST_WORDS)
+        assert sum(frequencies.values()) == pytest.approx(1.0)
+        best = max(strategy._score_word(w, frequencies, known) for w in TEST_WORDS)
+        assert strategy._score_word(word, frequencies, known) == pytest.approx(best)
+        
+        positional = PositionalFrequencyStrategy()
+        word = positional.choose_word(TEST_WORDS, cm, 2)
+        frequencies = positional._calculate_position_frequencies(TEST_WORDS)
+        assert frequencies[0]["R"] == pytest.approx(5 / len(TEST_WORDS))
+        best = max(positional._score_word_positional(w, frequencies) for w in TEST_WORDS)
+        assert positional._score_word_positional(word, frequencies) == pytest.approx(best)
+
+    def test_word_table_is_not_rebuilt(self):
+        """Sans solveur ni matrice, la table vient du registre ou du cache, pas d'une reconstruction."""
+        strategy = FrequencyStrategy()
+        words = {"ZZZZA", "ZZZZB", "ZZZZC"}
+        assert strategy._get_word_table(words) is strategy._get_word_table(set(words))
+
+        english = LanguageRegistry.get('en')
+        subset = set(sorted(english.words)[:50])
+        assert strategy._get_word_table(subset) is english.table
+
+    def test_weighted_scores(self):
+        """Des poids uniformes donnent les mêmes scores ; un poids nul retire la cible."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        guess_ids = np.arange(len(pm.words))
+        target_ids = np.arange(len(pm.words))
+        
+        plain = score_guesses(pm, guess_ids, target_ids)
+        uniform = score_guesses(pm, guess_ids, target_ids, weights=np.full(len(target_ids), 3.0))
+        assert np.allclose(plain.entropy, uniform.entropy)
+        
+        weights = np.ones(len(target_ids))
+        weights[0] = 0.0
+        weighted = score_guesses(pm, guess_ids, target_ids, weights=weights)
+        subset = score_guesses(pm, guess_ids, target_ids[1:])
+        assert np.allclose(weighted.entropy, subset.entropy)
+        assert np.allclose(weighted.worst_case, subset.worst_case)
+
+
+class TestStrategyComparator:
+    """Tests pour le comparateur de stratégies."""
+    
+    def test_parallel_results_match_sequential(self):
+        """Les résultats ne dépendent pas du nombre de workers."""
+        targets = sorted(TEST_WORDS)
+        
+        sequential = StrategyComparator(TEST_WORDS)
+        parallel = StrategyComparator(TEST_WORDS)
+        seq_stats = sequential.test_strategy(MinimaxStrategy(), targets)
+        par_stats = parallel.test_strategy(MinimaxStrategy(), targets, workers=3)
+        
+        assert [r.guesses for r in parallel.results] == [r.guesses for r in sequential.results]
+        assert [r.target_word for r in parallel.results] == targets
+        assert par_stats.attempt_distribution == seq_stats.attempt_distribution
+        assert par_stats.failed_words == seq_stats.failed_words
+
+    def test_spawn_workers(self, monkeypatch):
+        """Sans fork, le comparateur et la stratégie (caches vidés) sont sérialisés vers les workers."""
+        import multiprocessing
+        import pickle
+        from wordle_solver.strategies import comparator
+
+        targets = sorted(TEST_WORDS)
+        strategy = EntropyStrategy()
+        sequential = StrategyComparator(TEST_WORDS)
+        sequential.test_strategy(strategy, targets)
+        assert len(strategy._entropy_cache) > 0
+        assert len(pickle.loads(pickle.dumps(strategy))._entropy_cache) == 0
+
+        monkeypatch.setattr(comparator, '_pool_context', lambda: multiprocessing.get_context('spawn'))
+        spawned = StrategyComparator(TEST_WORDS)
+        spawned.test_strategy(strategy, targets, workers=2)
+
+        assert [r.guesses for r in spawned.results] == [r.guesses for r in sequential.results]
+
+    def test_events_resume_from_results_log(self, tmp_path):
+        """Une comparaison interrompue reprend depuis le journal sans rejouer les parties."""
+        targets = sorted(TEST_WORDS)
+        strategies = [MinimaxStrategy(), FrequencyStrategy()]
+        log_path = tmp_path / "results.jsonl"
+        
+        reference = StrategyComparator(TEST_WORDS)
+        events = list(reference.iter_events(strategies, targets, snapshot_every=5))
+        assert [e.kind for e in events].count('game') == 2 * len(targets)
+        assert events[0].kind == 'start' and events[-1].kind == 'end'
+        
+        # Interruption après 20 parties, puis une ligne tronquée
+        interrupted = StrategyComparator(TEST_WORDS).iter_events(strategies, targets, results_log=log_path)
+        games = 0
+        for event in interrupted:
+            games += event.kind == 'game'
+            if games == 20:
+                break
+        interrupted.close()
+        with open(log_path, 'a') as f:
+            f.write('{"target": "ROB')
+        
+        resumed = StrategyComparator(TEST_WORDS)
+        resumed_events = list(resumed.iter_events(strategies, targets, results_log=log_path))
+        
+        assert resumed_events[0].completed == 20
+        assert [e.kind for e in resumed_events].count('game') == 2 * len(targets) - 20
+        for strategy in strategies:
+            assert resumed.stats_by_strategy[strategy.name].attempt_distribution == \
+                reference.stats_by_strategy[strategy.name].attempt_distribution
+        assert len(log_path.read_text().splitlines()) == 2 * len(targets)
+
+
+class TestOpeningBook:
+    """Tests pour le livre d'ouvertures."""
+    
+    def test_book_replays_live_choices(self, tmp_path):
+        """Les parties jouées depuis le livre sont identiques au calcul direct."""
+        targets = sorted(TEST_WORDS)
+        book = OpeningBook.build(MinimaxStrategy(), TEST_WORDS, max_depth=3)
+        book.save(tmp_path / "book.npz")
+        book = OpeningBook.load(tmp_path / "book.npz")
+        assert book.matches(TEST_WORDS)
+        
+        live = StrategyComparator(TEST_WORDS)
+        live.test_strategy(MinimaxStrategy(), targets)
+        
+        strategy = MinimaxStrategy()
+        strategy.use_opening_book(book)
+        booked = StrategyComparator(TEST_WORDS)
+        booked.test_strategy(strategy, targets)
+        
+        assert [r.guesses for r in booked.results] == [r.guesses for r in live.results]
+        assert strategy.stats['book_hits'] > 0
+    
+    def test_off_book_falls_back(self):
+        """Hors du livre, la stratégie calcule normalement."""
+        book = OpeningBook.build(MinimaxStrategy(), TEST_WORDS, max_depth=2)
+        strategy = MinimaxStrategy()
+        strategy.use_opening_book(book)
+        
+        cm = ConstraintManager()
+        off_book = "STEEL" if book.first_guess != "STEEL" else "LEVEL"
+        cm.apply_feedback(generate_feedback(off_book, "ROBOT"))
+        possible = {w for w in TEST_WORDS if cm.is_word_valid(w)}
+        
+        assert book.lookup(cm.history, len(possible)) is None
+        assert strategy.choose_word(possible, cm, 2) in possible
+        assert strategy.stats['book_hits'] == 0
+    
+    def test_six_letter_book(self, tmp_path):
+        """Mots de 6 lettres : codes de pattern au-delà de 255 (729 patterns)."""
+        rng = np.random.default_rng(0)
+        words = {''.join(letters) for letters in rng.choice(list("ABCDEFGHIJKLMNOP"), size=(300, 6))}
+        pm = PatternMatrix(words, persist=False)
+        book = OpeningBook.build(EntropyStrategy(), words, max_depth=3, pattern_matrix=pm)
+        assert book.codes.dtype == np.uint16 and int(book.codes.max()) > 255
+        
+        book.save(tmp_path / "book6.npz")
+        book = OpeningBook.load(tmp_path / "book6.npz")
+        
+        # Parcours d'une branche de code > 255 depuis la racine
+        edge = int(np.flatnonzero(book.codes[:book.offsets[1]] > 255)[0])
+        feedback = FeedbackResult.from_code(book.first_guess, int(book.codes[edge]))
+        assert book.lookup([feedback]) == book.vocabulary[book.guesses[edge + 1]]
+
+
+class TestOptimalStrategy:
+    """Tests pour la stratégie optimale exacte."""
+    
+    def test_not_worse_than_heuristics(self):
+        """Le coût optimal minore celui des stratégies heuristiques."""
+        targets = sorted(TEST_WORDS)
+        result = OptimalStrategy().solve(TEST_WORDS)
+        
+        for strategy in (MinimaxStrategy(), EntropyStrategy(), FrequencyStrategy()):
+            comparator = StrategyComparator(TEST_WORDS)
+            stats = comparator.test_strategy(strategy, targets)
+            assert stats.failed_words == []
+            assert result.total_guesses <= sum(r.attempts for r in comparator.results)
+    
+    def test_tree_replays_optimal_cost(self):
+        """L'arbre rejoué par le comparateur atteint exactement le coût optimal."""
+        targets = sorted(TEST_WORDS)
+        strategy = OptimalStrategy()
+        result = strategy.solve(TEST_WORDS)
+        
+        comparator = StrategyComparator(TEST_WORDS)
+        stats = comparator.test_strategy(strategy, targets)
+        
+        assert stats.failed_words == []
+        assert sum(r.attempts for r in comparator.results) == result.total_guesses
+        assert comparator.results[0].guesses[0] == result.first_guess
+    
+    def test_parallel_matches_sequential(self):
+        """Le premier niveau parallèle donne le même résultat."""
+        sequential = OptimalStrategy(workers=1).solve(TEST_WORDS)
+        parallel = OptimalStrategy(workers=2).solve(TEST_WORDS)
+        
+        assert parallel.total_guesses == sequential.total_guesses
+        assert parallel.first_guess == sequential.first_guess
+
+
+class TestAnytime:
+    """Tests pour le choix borné par une échéance."""
+    
+    def test_far_deadline_is_exact(self):
+        """Avec du temps, le résultat est celui de l'évaluation complète."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        ids = np.sort(pm.ids(TEST_WORDS))
+        full = score_guesses(pm, ids, ids)
+        anytime = score_guesses_until(pm, ids, ids, deadline=time.time() + 60)
+        
+        assert np.array_equal(anytime.guess_ids, full.guess_ids)
+        assert np.allclose(anytime.entropy, full.entropy)
+        
+        cm = ConstraintManager()
+        for strategy_class in (MinimaxStrategy, EntropyStrategy):
+            expected = strategy_class().choose_word(TEST_WORDS, cm, 2, pattern_matrix=pm)
+            strategy = strategy_class()
+            word = strategy.choose_word(TEST_WORDS, cm, 2, pattern_matrix=pm, deadline=time.time() + 60)
+            assert word == expected
+            assert strategy.stats['quality'] == 'exact'
+    
+    def test_expired_deadline_uses_heuristic(self):
+        """Échéance dépassée : le mot le plus prioritaire est joué."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        ids = np.sort(pm.ids(TEST_WORDS))
+        priority = frequency_priority(pm, ids, ids)
+        
+        strategy = EntropyStrategy()
+        word = strategy.choose_word(TEST_WORDS, ConstraintManager(), 2, pattern_matrix=pm, deadline=0.0)
+        
+        assert word == pm.words[ids[int(np.argmax(priority))]]
+        assert strategy.stats['quality'] == 'heuristic'
+        assert strategy.stats['words_evaluated'] == 1
+
+
+class TestBatch:
+    """Tests pour la résolution par lots."""
+    
+    def test_batch_matches_single_solves(self):
+        """Chaque suggestion du lot est celle d'une résolution isolée ; les doublons sont partagés."""
+        solver = HybridSolver(TEST_WORDS)
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        crane = generate_feedback("CRANE", "ROBOT").code
+        slate = generate_feedback("SLATE", "ROBOT").code
+        histories = [
+            [("CRANE", crane), ("SLATE", slate)],
+            [],
+            [("crane", crane)],
+            [("CRANE", crane), ("SLATE", slate)],
+        ]
+        
+        results = list(suggest_batch(EntropyStrategy(), solver, histories, pattern_matrix=pm, limit=3))
+        
+        assert [position for position, _ in results] == [0, 1, 2, 3]
+        assert results[0][1] is results[3][1]
+        assert results[1][1].suggested_word == EntropyStrategy().get_first_guess("en")
+        assert results[1][1].candidate_count == len(TEST_WORDS)
+        
+        for position in (0, 2):
+            history = histories[position]
+            cm = ConstraintManager.from_feedbacks([generate_feedback(guess, "ROBOT") for guess, _ in history])
+            expected = solver.get_possible_words(cm)
+            suggestion = results[position][1]
+            
+            assert suggestion.candidate_count == len(expected)
+            assert suggestion.candidates == sorted(expected)[:3]
+            assert suggestion.suggested_word == EntropyStrategy().choose_word(
+                set(expected), cm, len(history) + 1, pattern_matrix=pm
+            )
+
+
+class TestSolverPool:
+    """Tests du pool de workers de l'API (échéance et réponse de repli)."""
+    
+    def test_one_submission_and_fallback_after_timeout(self):
+        """Une seule tâche par suggestion ; à l'échéance, repli calculé hors des workers."""
+        from solver_pool import SolverPool, suggest_task, _fallback_state, _state
+        
+        pool = SolverPool(languages=('en',), strategy_names=('frequency', 'entropy'), workers=1)
+        submitted = []
+        run = pool.run
+        
+        async def counting_run(function, *args):
+            submitted.append((function.__name__, args[1]))
+            return await run(function, *args)
+        
+        async def scenario():
+            complete = await pool.suggest('en', 'entropy', history, timeout=30)
+            # Worker occupé : la tâche n'est pas servie à temps
+            busy = asyncio.get_running_loop().run_in_executor(pool.executor, time.sleep, 1.0)
+            partial = await pool.suggest('en', 'entropy', history, timeout=0.2)
+            await busy
+            return complete, partial
+        
+        pool.run = counting_run
+        history = [("SLATE", generate_feedback("SLATE", "CRANE").code)]
+        pool.start()
+        try:
+            complete, partial = asyncio.run(scenario())
+        finally:
+            pool.shutdown()
+        
+        assert submitted == [(suggest_task.__name__, 'entropy')] * 2
+        assert complete['complete'] and complete['strategy'] == 'entropy'
+        assert not partial['complete'] and partial['quality'] == 'heuristic' and partial['strategy'] == 'entropy'
+        assert partial['possible_words_count'] == complete['possible_words_count']
+        assert partial['suggested_word'] in LanguageRegistry.get('en')
+        assert pool.timeouts == 1
+        # Le repli (thread du processus principal) ne partage ni solveur ni stratégie
+        assert _fallback_state.solver('en') is not _state.solver('en')
+        assert _fallback_state.strategy('frequency') is not _state.strategy('frequency')
+
+
+class TestMultiBoard:
+    """Tests pour les variantes multi-grilles."""
+    
+    def test_score_boards_sums_single_board_scores(self):
+        """Un passage sur toutes les grilles équivaut à la somme des passages par grille."""
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        guess_ids = np.arange(len(pm))
+        boards = [pm.ids(["ROBOT", "ROVER", "ROOST"]), pm.ids(["SLATE", "STEEL"]), pm.ids(sorted(TEST_WORDS))]
+        
+        combined = score_boards(pm, guess_ids, boards)
+        singles = [score_guesses(pm, guess_ids, board) for board in boards]
+        
+        assert np.allclose(combined.entropy, sum(s.entropy for s in singles))
+        assert np.allclose(combined.expected_size, sum(s.expected_size for s in singles))
+        assert np.array_equal(combined.worst_case, np.max([s.worst_case for s in singles], axis=0))
+        assert np.array_equal(combined.n_groups, sum(s.n_groups for s in singles))
+    
+    def test_strategy_solves_all_boards(self):
+        """Une partie à 4 grilles est gagnée, chaque grille n'étant plus jouée une fois résolue."""
+        solver = HybridSolver(TEST_WORDS)
+        pm = PatternMatrix(TEST_WORDS, persist=False)
+        game = MultiBoardGame(["ROBOT", "SPEED", "LEVEL", "CRANE"])
+        
+        MultiBoardStrategy().play(game, solver, pattern_matrix=pm)
+        
+        assert game.is_won
+        assert game.max_attempts == 9
+        for board, solved_at in zip(game.boards, game.solved_at):
+            assert len(board) == solved_at
+            assert board[-1].is_correct()
+
+
+class TestHardMode:
+    """Tests pour le mode difficile."""
+    
+    def test_allowed_guesses_follow_revealed_hints(self):
+        """Le masque incrémental des tentatives autorisées suit la règle du jeu, tour après tour."""
+        solver = HybridSolver(TEST_WORDS)
+        cm = ConstraintManager()
+        for guess in ("CRANE", "TRACE"):
+            cm.apply_feedback(generate_feedback(guess, "REACT"))
+            assert solver.allowed_guesses(cm) == {w for w in TEST_WORDS if cm.is_allowed_guess(w)}
+        # Verts A et C à leur place, R et E réutilisés (T jaune : réutilisé aussi)
+        assert solver.allowed_guesses(cm) == {"REACT", "TRACE"}
+        
+        game = WordleGame("REACT", hard_mode=True)
+        game.make_guess("TRACE")
+        with pytest.raises(ValueError, match="Mode difficile"):
+            game.make_guess("SLATE")
+        assert game.make_guess("REACT").is_correct()
+    
+    def test_comparator_plays_legal_guesses(self):
+        """En mode difficile, chaque tentative jouée respecte les indices des précédentes."""
+        comparator = StrategyComparator(TEST_WORDS, hard_mode=True)
+        comparator.test_strategy(EntropyStrategy(use_full_dictionary=True), sorted(TEST_WORDS))
+        
+        for result in comparator.results:
+            feedbacks = [generate_feedback(guess, result.target_word) for guess in result.guesses]
+            for i, guess in enumerate(result.guesses):
+                assert hard_mode_violation(guess, feedbacks[:i]) is None
@@ -11,7 +11,7 @@ __license__ = "MIT"
 
 from .csp import ConstraintManager, WordFilter, HybridSolver
 from .game import WordleGame, Feedback, FeedbackResult, generate_feedback
-from .dictionaries import DictionaryLoader
+from .dictionaries import DictionaryLoader, LanguageRegistry
 
 __all__ = [
     'ConstraintManager',
@@ -22,4 +22,5 @@ __all__ = [
     'FeedbackResult',
     'generate_feedback',
     'DictionaryLoader',
+    'LanguageRegistry',
 ]
@@ -0,0 +1,424 @@
+"""
+Micro-benchmarks de régression des chemins critiques.
+
+Mesures reproductibles (graine et dictionnaires fixes : en_words.txt et
+fr_words.txt livrés avec le paquet, sans réseau) :
+- feedback : débit de generate_feedback
+- filter/turnK : WordFilter.filter_by_constraints après K tentatives (1 à 4)
+- choose_word/<stratégie>/<taille> : choose_word sur des ensembles de
+  candidats de plusieurs tailles
+- comparator/<stratégie> : parties complètes jouées par StrategyComparator
+
+Chaque mesure est le meilleur temps par opération sur plusieurs répétitions
+(préparation exclue, caches remis à zéro entre répétitions). Les résultats
+sont enregistrés en JSON ; la commande compare signale les mesures plus
+lentes que la référence au-delà d'un seuil.
+
+Usage :
+    python -m wordle_solver.cli.benchmark run --output benchmarks/baseline.json
+    python -m wordle_solver.cli.benchmark run --output new.json --baseline benchmarks/baseline.json
+    python -m wordle_solver.cli.benchmark compare benchmarks/baseline.json new.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..csp import ConstraintManager, WordFilter
+from ..dictionaries import LanguageData, LanguageRegistry
+from ..game import generate_feedback
+from ..strategies import (
+    EntropyStrategy,
+    ExpectedSizeStrategy,
+    FastEntropyStrategy,
+    FrequencyStrategy,
+    MinimaxStrategy,
+    PositionalFrequencyStrategy,
+    StrategyComparator,
+)
+
+
+FORMAT_VERSION = 1
+
+DEFAULT_SEED = 0
+
+# Seuil de régression par défaut (+20 % de temps par opération)
+DEFAULT_THRESHOLD = 0.2
+
+# Stratégies mesurées par choose_word
+STRATEGIES: Dict[str, Callable] = {
+    'frequency': FrequencyStrategy,
+    'positional': PositionalFrequencyStrategy,
+    'entropy': EntropyStrategy,
+    'fast-entropy': FastEntropyStrategy,
+    'minimax': MinimaxStrategy,
+    'expected-size': ExpectedSizeStrategy,
+}
+
+# Stratégies jouées de bout en bout par le comparateur
+COMPARATOR_STRATEGIES: Dict[str, Callable] = {
+    'frequency': FrequencyStrategy,
+    'entropy': lambda: EntropyStrategy(max_words_to_evaluate=100),
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """Paramètres d'une série de mesures (défaut complet, ou rapide)."""
+    repeat: int = 7
+    feedback_pairs: int = 5000
+    filter_states: int = 20
+    turns: Sequence[int] = (1, 2, 3, 4)
+    candidate_sizes: Sequence[int] = (10, 100, 1000)
+    comparator_games: int = 10
+
+    @classmethod
+    def quick(cls) -> "BenchmarkConfig":
+        """Série réduite (quelques secondes), pour les tests et la CI."""
+        return cls(repeat=3, feedback_pairs=1000, filter_states=5, candidate_sizes=(10, 100), comparator_games=3)
+
+
+@dataclass
+class BenchmarkResult:
+    """Mesure d'un benchmark (secondes par opération)."""
+    name: str
+    seconds: float
+    median: float
+    operations: int
+    repeat: int
+
+    @property
+    def ops_per_second(self) -> float:
+        """Débit correspondant au meilleur temps."""
+        return 1.0 / self.seconds if self.seconds > 0 else float('inf')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation sérialisable (JSON)."""
+        data = asdict(self)
+        del data['name']
+        data['ops_per_second'] = self.ops_per_second
+        return data
+
+
+def measure(
+    name: str,
+    function: Callable[[Any], Any],
+    operations: int,
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None
+) -> BenchmarkResult:
+    """
+    Mesure une fonction (meilleur temps et médiane sur `repeat` répétitions).
+
+    Args:
+        name: Nom du benchmark
+        function: Fonction mesurée, appelée avec le résultat de setup
+        operations: Nombre d'opérations effectuées par un appel
+        repeat: Nombre de répétitions
+        setup: Préparation avant chaque répétition (non mesurée), optionnelle
+
+    Returns:
+        BenchmarkResult (secondes par opération)
+    """
+    timings = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter_ns()
+        function(state)
+        timings.append((time.perf_counter_ns() - start) / 1e9 / operations)
+    return BenchmarkResult(name, min(timings), statistics.median(timings), operations, repeat)
+
+
+def _constraint_states(data: LanguageData, turns: int, count: int, rng: random.Random) -> List[ConstraintManager]:
+    """Contraintes de `count` parties après `turns` tentatives tirées au hasard."""
+    words = data.table.words
+    states = []
+    for _ in range(count):
+        target = rng.choice(words)
+        states.append(ConstraintManager.from_feedbacks(
+            [generate_feedback(rng.choice(words), target) for _ in range(turns)]
+        ))
+    return states
+
+
+def bench_language(
+    data: LanguageData,
+    config: BenchmarkConfig = BenchmarkConfig(),
+    seed: int = DEFAULT_SEED,
+    only: Optional[str] = None,
+    verbose: bool = False
+) -> List[BenchmarkResult]:
+    """
+    Exécute les benchmarks d'une langue.
+
+    Args:
+        data: Données de la langue (dictionnaire livré)
+        config: Paramètres de la série
+        seed: Graine des tirages (mots, états, candidats)
+        only: Ne garder que les benchmarks dont le nom contient cette chaîne
+        verbose: Afficher chaque mesure
+
+    Returns:
+        Mesures, nommées '<langue>/<benchmark>'
+    """
+    prefix = data.language
+    words = data.table.words
+    results: List[BenchmarkResult] = []
+
+    def run(name: str, *args, **kwargs):
+        name = f"{prefix}/{name}"
+        if only and only not in name:
+            return
+        result = measure(name, *args, repeat=config.repeat, **kwargs)
+        results.append(result)
+        if verbose:
+            print(f"  {name:<40} {result.seconds * 1e3:10.4f} ms/op  ({result.ops_per_second:,.0f} op/s)")
+
+    # generate_feedback : paires (tentative, cible) fixes
+    rng = random.Random(seed)
+    pairs = [(rng.choice(words), rng.choice(words)) for _ in range(config.feedback_pairs)]
+    run('feedback', lambda _: [generate_feedback(guess, target) for guess, target in pairs], len(pairs))
+
+    # Filtrage après 1 à 4 tentatives (cache du filtre vidé à chaque répétition)
+    word_filter = WordFilter(data.table)
+    for turns in config.turns:
+        states = _constraint_states(data, turns, config.filter_states, random.Random(seed + turns))
+
+        def filter_all(_, states=states):
+            for constraint_manager in states:
+                word_filter.filter_by_constraints(constraint_manager)
+
+        run(f'filter/turn{turns}', filter_all, len(states), setup=word_filter.reset)
+
+    # choose_word : stratégie neuve à chaque répétition (caches vides)
+    needs_matrix = only is None or 'choose_word' in only or 'comparator' in only
+    pattern_matrix = data.pattern_matrix if needs_matrix else None
+    if pattern_matrix is not None:
+        pattern_matrix.matrix  # Chargement (ou calcul) hors mesure
+    for size in config.candidate_sizes:
+        candidates = set(random.Random(seed + size).sample(words, min(size, len(words))))
+        for strategy_name, factory in STRATEGIES.items():
+            run(
+                f'choose_word/{strategy_name}/{size}',
+                lambda strategy: strategy.choose_word(
+                    candidates,
+                    ConstraintManager(),
+                    2,
+                    full_dictionary=data.words,
+                    pattern_matrix=pattern_matrix,
+                    solver=data.solver
+                ),
+                1,
+                setup=factory
+            )
+
+    # Parties complètes (solveur neuf à chaque répétition : pas d'historique en cache)
+    targets = random.Random(seed).sample(words, config.comparator_games)
+    for strategy_name, factory in COMPARATOR_STRATEGIES.items():
+        run(
+            f'comparator/{strategy_name}',
+            lambda state: state[0].test_strategy(state[1], targets),
+            len(targets),
+            setup=lambda factory=factory: (StrategyComparator(data.table, data.language), factory())
+        )
+
+    return results
+
+
+def run_benchmarks(
+    languages: Iterable[str] = ('en', 'fr'),
+    config: BenchmarkConfig = BenchmarkConfig(),
+    seed: int = DEFAULT_SEED,
+    only: Optional[str] = None,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Exécute les benchmarks et retourne le rapport (sérialisable en JSON).
+
+    Args:
+        languages: Langues mesurées (dictionnaires livrés)
+        config: Paramètres de la série
+        seed: Graine des tirages
+        only: Filtre sur les noms de benchmarks
+        verbose: Afficher chaque mesure
+
+    Returns:
+        Rapport : environnement, empreintes des dictionnaires et mesures
+    """
+    report: Dict[str, Any] = {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'config': asdict(config),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'dictionaries': {},
+        'results': {},
+    }
+    for language in languages:
+        data = LanguageRegistry.get(language)
+        report['dictionaries'][language] = data.table.digest
+        if verbose:
+            print(f"[{language}] {len(data)} mots")
+        for result in bench_language(data, config, seed, only, verbose):
+            report['results'][result.name] = result.to_dict()
+    return report
+
+
+def save_report(report: Dict[str, Any], path: Path):
+    """Enregistre un rapport JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    """
+    Lit un rapport JSON.
+
+    Raises:
+        ValueError: Si le format n'est pas reconnu
+    """
+    report = json.loads(Path(path).read_text(encoding='utf-8'))
+    if report.get('version') != FORMAT_VERSION or 'results' not in report:
+        raise ValueError(f"Rapport de benchmark non reconnu : {path}")
+    return report
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """
+    Compare deux rapports, benchmark par benchmark.
+
+    Statuts : 'regression' (plus lent que la référence de plus de
+    threshold), 'improvement' (plus rapide dans la même proportion), 'ok',
+    'new' (absent de la référence), 'missing' (absent de la mesure).
+
+    Args:
+        baseline: Rapport de référence
+        current: Nouveau rapport
+        threshold: Écart relatif toléré (0.2 = 20 %)
+
+    Returns:
+        Une ligne par benchmark, triées par nom
+    """
+    rows = []
+    for name in sorted(set(baseline['results']) | set(current['results'])):
+        before = baseline['results'].get(name)
+        after = current['results'].get(name)
+        row: Dict[str, Any] = {
+            'name': name,
+            'baseline': before['seconds'] if before else None,
+            'current': after['seconds'] if after else None,
+            'ratio': None,
+        }
+        if before is None:
+            row['status'] = 'new'
+        elif after is None:
+            row['status'] = 'missing'
+        else:
+            row['ratio'] = after['seconds'] / before['seconds'] if before['seconds'] > 0 else float('inf')
+            if row['ratio'] > 1 + threshold:
+                row['status'] = 'regression'
+            elif row['ratio'] < 1 / (1 + threshold):
+                row['status'] = 'improvement'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Tableau texte d'une comparaison (voir compare_reports)."""
+    lines = [f"{'benchmark':<40} {'référence':>12} {'mesure':>12} {'ratio':>7}  statut"]
+    for row in rows:
+        before = f"{row['baseline'] * 1e3:.4f}ms" if row['baseline'] is not None else '-'
+        after = f"{row['current'] * 1e3:.4f}ms" if row['current'] is not None else '-'
+        ratio = f"{row['ratio']:.2f}" if row['ratio'] is not None else '-'
+        marker = '  <<<' if row['status'] == 'regression' else ''
+        lines.append(f"{row['name']:<40} {before:>12} {after:>12} {ratio:>7}  {row['status']}{marker}")
+    return '\n'.join(lines)
+
+
+def _check_comparable(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Avertissements si les rapports ne mesurent pas la même chose."""
+    warnings = []
+    for language, digest in current.get('dictionaries', {}).items():
+        expected = baseline.get('dictionaries', {}).get(language)
+        if expected is not None and expected != digest:
+            warnings.append(f"Dictionnaire '{language}' différent de la référence")
+    if baseline.get('seed') != current.get('seed'):
+        warnings.append("Graines différentes")
+    if baseline.get('config') != current.get('config'):
+        warnings.append("Paramètres différents (--quick ?) : charges de travail non identiques")
+    if baseline.get('environment', {}).get('machine') != current.get('environment', {}).get('machine'):
+        warnings.append("Machines différentes : comparer des mesures d'une même machine")
+    return warnings
+
+
+def _report_comparison(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    """Affiche la comparaison ; code de sortie 1 en cas de régression."""
+    for warning in _check_comparable(baseline, current):
+        print(f"⚠️  {warning}")
+    rows = compare_reports(baseline, current, threshold)
+    print(format_comparison(rows))
+    regressions = [row['name'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de {threshold:.0%}")
+        return 1
+    print(f"\nAucune régression au-delà de {threshold:.0%}")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Point d'entrée en ligne de commande (run / compare)."""
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de régression du solveur Wordle")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Exécute les benchmarks')
+    run_parser.add_argument('--languages', nargs='+', choices=['en', 'fr'], default=['en', 'fr'], help='Langues')
+    run_parser.add_argument('--quick', action='store_true', help='Série réduite')
+    run_parser.add_argument('--only', help='Ne garder que les benchmarks dont le nom contient ce texte')
+    run_parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Graine des tirages')
+    run_parser.add_argument('--output', type=Path, help='Fichier JSON des résultats')
+    run_parser.add_argument('--baseline', type=Path, help='Référence à laquelle comparer les résultats')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Écart toléré (0.2 = 20 %%)')
+
+    compare_parser = commands.add_parser('compare', help='Compare deux rapports JSON')
+    compare_parser.add_argument('baseline', type=Path, help='Rapport de référence')
+    compare_parser.add_argument('current', type=Path, help='Nouveau rapport')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Écart toléré (0.2 = 20 %%)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare':
+        return _report_comparison(load_report(args.baseline), load_report(args.current), args.threshold)
+
+    config = BenchmarkConfig.quick() if args.quick else BenchmarkConfig()
+    report = run_benchmarks(args.languages, config, args.seed, args.only, verbose=True)
+    if args.output:
+        save_report(report, args.output)
+        print(f"Résultats enregistrés : {args.output}")
+    if args.baseline:
+        print()
+        return _report_comparison(load_report(args.baseline), report, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,22 @@
 """Module CSP pour la résolution de Wordle."""
 
 from .constraint_manager import ConstraintManager
-from .word_filter import WordFilter, FastWordFilter
-from .solver import WordleCSPSolver, HybridSolver
+from .candidate_index import CandidateIndex
+from .word_filter import WordFilter
+from .solver import HybridSolver
 
 __all__ = [
     'ConstraintManager',
     'WordFilter',
-    'FastWordFilter',
+    'CandidateIndex',
     'WordleCSPSolver',
     'HybridSolver',
 ]
+
+
+def __getattr__(name):
+    """Charge le solveur CP-SAT (et OR-Tools) au premier accès seulement."""
+    if name == 'WordleCSPSolver':
+        from .cpsat import WordleCSPSolver
+        return WordleCSPSolver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,277 @@
+"""
+Module d'index de candidats par bitsets.
+
+Pré-calcule, pour un dictionnaire fixe, un masque de bits (entier Python)
+par couple (position, lettre) et par couple (lettre, nombre minimum
+d'occurrences). Le bit i d'un masque correspond au mot d'identifiant i,
+les identifiants suivant l'ordre alphabétique.
+
+L'état d'un ConstraintManager se traduit alors en quelques opérations
+AND / AND NOT sur ces masques, sans parcourir les mots un par un.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .constraint_manager import ConstraintManager
+from ..game.feedback import Feedback, FeedbackResult
+from ..dictionaries.word_table import WordTable
+
+
+def mask_from_bools(flags: np.ndarray) -> int:
+    """
+    Convertit un tableau booléen en masque de bits.
+
+    Args:
+        flags: Tableau booléen (bit i = flags[i])
+
+    Returns:
+        Masque sous forme d'entier Python
+    """
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+
+def popcount(mask: int) -> int:
+    """Retourne le nombre de bits à 1 d'un masque."""
+    return bin(mask).count('1')
+
+
+# Nombre d'octets (8 mots par octet) décodés à la fois par ids_of(limit=k)
+SCAN_BLOCK_BYTES = 256
+
+
+class CandidateIndex:
+    """
+    Index compilé d'un dictionnaire sous forme de masques de bits.
+
+    Attributs principaux :
+    - table : WordTable du dictionnaire
+    - words : mots triés (identifiant = rang alphabétique)
+    - full_mask : masque de tous les mots
+    - position_masks : {(position, lettre): masque}
+    - count_masks : {(lettre, k): masque des mots avec au moins k occurrences}
+    """
+
+    def __init__(self, words: Union[WordTable, Iterable[str]]):
+        """
+        Construit l'index.
+
+        Args:
+            words: WordTable ou mots du dictionnaire (de même longueur)
+        """
+        self.table = WordTable.of(words)
+        self.words: Tuple[str, ...] = self.table.words
+        self.index: Dict[str, int] = self.table.index
+        self.word_length = self.table.word_length
+        self.full_mask = (1 << len(self.words)) - 1
+
+        self.position_masks: Dict[Tuple[int, str], int] = {}
+        self.count_masks: Dict[Tuple[str, int], int] = {}
+        self._build()
+
+    def _build(self):
+        """Pré-calcule les masques par position et par nombre d'occurrences."""
+        if not self.words:
+            return
+
+        letters = self.table.letters
+
+        for code, letter in enumerate(self.table.alphabet):
+            at_position = letters == code
+
+            for pos in range(self.word_length):
+                column = at_position[:, pos]
+                if column.any():
+                    self.position_masks[(pos, letter)] = mask_from_bools(column)
+
+            counts = self.table.counts[:, code]
+            for k in range(1, int(counts.max()) + 1):
+                self.count_masks[(letter, k)] = mask_from_bools(counts >= k)
+
+    def position_mask(self, position: int, letter: str) -> int:
+        """Masque des mots ayant `letter` à la position donnée."""
+        return self.position_masks.get((position, letter), 0)
+
+    def count_mask(self, letter: str, min_count: int) -> int:
+        """Masque des mots contenant au moins `min_count` fois `letter`."""
+        if min_count <= 0:
+            return self.full_mask
+        return self.count_masks.get((letter, min_count), 0)
+
+    def mask_for(self, constraint_manager: ConstraintManager) -> int:
+        """
+        Calcule le masque des mots respectant toutes les contraintes.
+
+        Équivalent à appliquer ConstraintManager.is_word_valid à chaque mot.
+
+        Args:
+            constraint_manager: Le gestionnaire de contraintes
+
+        Returns:
+            Masque des mots valides
+        """
+        mask = self.full_mask
+
+        # Positions correctes (vertes)
+        for pos, letter in constraint_manager.correct_positions.items():
+            mask &= self.position_mask(pos, letter)
+
+        # Lettres absentes (grises)
+        for letter in constraint_manager.absent_letters:
+            mask &= ~self.count_mask(letter, 1)
+
+        # Lettres présentes et positions interdites (jaunes)
+        for letter, forbidden_positions in constraint_manager.present_letters.items():
+            mask &= self.count_mask(letter, 1)
+            for pos in forbidden_positions:
+                mask &= ~self.position_mask(pos, letter)
+
+        # Contraintes de fréquence
+        for letter, (min_count, max_count) in constraint_manager.letter_counts.items():
+            if min_count > 0:
+                mask &= self.count_mask(letter, min_count)
+            if max_count is not None:
+                mask &= ~self.count_mask(letter, max_count + 1)
+
+        return mask
+
+    def allowed_guess_mask(self, feedbacks: Iterable[FeedbackResult]) -> int:
+        """
+        Calcule le masque des tentatives autorisées en mode difficile.
+
+        Équivalent à appliquer hard_mode_violation à chaque mot : lettres
+        vertes à leur place et lettres révélées présentes au moins autant de
+        fois que dans une même tentative.
+
+        Args:
+            feedbacks: Feedbacks des tentatives précédentes
+
+        Returns:
+            Masque des tentatives autorisées
+        """
+        mask = self.full_mask
+
+        for feedback in feedbacks:
+            revealed: Dict[str, int] = {}
+            for pos, (letter, fb) in enumerate(zip(feedback.guess, feedback.feedbacks)):
+                if fb == Feedback.CORRECT:
+                    mask &= self.position_mask(pos, letter)
+                if fb != Feedback.ABSENT:
+                    revealed[letter] = revealed.get(letter, 0) + 1
+            for letter, count in revealed.items():
+                mask &= self.count_mask(letter, count)
+
+        return mask
+
+    def mask_of(self, words: Iterable[str]) -> int:
+        """
+        Construit le masque d'un ensemble de mots (ignore les mots inconnus).
+
+        Args:
+            words: Mots du dictionnaire
+
+        Returns:
+            Masque correspondant
+        """
+        flags = np.zeros(len(self.words), dtype=bool)
+        for word in words:
+            i = self.index.get(word)
+            if i is not None:
+                flags[i] = True
+        return mask_from_bools(flags)
+
+    def ids_of(self, mask: int, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Retourne les identifiants (croissants) des bits à 1 d'un masque.
+
+        Avec une limite, le masque est parcouru par blocs de bits et le
+        parcours s'arrête dès que `limit` identifiants sont trouvés.
+
+        Args:
+            mask: Masque de mots
+            limit: Nombre maximum d'identifiants (None = tous)
+
+        Returns:
+            Tableau d'identifiants
+        """
+        n = len(self.words)
+        if mask == 0 or n == 0 or limit == 0:
+            return np.empty(0, dtype=np.int64)
+        raw = np.frombuffer(mask.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+        if limit is None:
+            return np.flatnonzero(np.unpackbits(raw, count=n, bitorder='little'))
+
+        found: List[np.ndarray] = []
+        remaining = limit
+        for start in range(0, len(raw), SCAN_BLOCK_BYTES):
+            block = raw[start:start + SCAN_BLOCK_BYTES]
+            if not block.any():
+                continue
+            ids = np.flatnonzero(np.unpackbits(block, bitorder='little'))[:remaining] + start * 8
+            found.append(ids)
+            remaining -= len(ids)
+            if remaining == 0:
+                break
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def words_of(self, mask: int, limit: Optional[int] = None) -> List[str]:
+        """
+        Retourne les mots d'un masque, triés alphabétiquement.
+
+        L'identifiant d'un mot étant son rang alphabétique, les `limit`
+        premiers mots s'obtiennent sans trier (voir ids_of).
+
+        Args:
+            mask: Masque de mots
+            limit: Nombre maximum de mots (None = tous)
+
+        Returns:
+            Liste de mots
+        """
+        words = self.words
+        return [words[i] for i in self.ids_of(mask, limit)]
+
+    def top_ids(self, mask: int, scores: np.ndarray, limit: int) -> np.ndarray:
+        """
+        Retourne les identifiants d'un masque ayant les meilleurs scores.
+
+        Sélection partielle (np.argpartition) puis tri des seuls `limit`
+        retenus : pas de tri de tout le masque.
+
+        Args:
+            mask: Masque de mots
+            scores: Score de chaque mot du dictionnaire, indexé par identifiant
+            limit: Nombre d'identifiants retournés
+
+        Returns:
+            Identifiants par score décroissant (à score égal, alphabétique)
+        """
+        ids = self.ids_of(mask)
+        if limit <= 0 or len(ids) == 0:
+            return ids[:0]
+        candidate_scores = np.asarray(scores)[ids]
+        if limit < len(ids):
+            # Score du limit-ième, puis ex aequo retenus par ordre alphabétique
+            threshold = -np.partition(-candidate_scores, limit - 1)[limit - 1]
+            keep = candidate_scores > threshold
+            ties = np.flatnonzero(candidate_scores == threshold)
+            keep[ties[:limit - np.count_nonzero(keep)]] = True
+            ids, candidate_scores = ids[keep], candidate_scores[keep]
+        return ids[np.lexsort((ids, -candidate_scores))]
+
+    def contains(self, mask: int, word: str) -> bool:
+        """Vérifie si un mot appartient à un masque."""
+        i = self.index.get(word)
+        return i is not None and bool(mask >> i & 1)
+
+    @property
+    def nbytes(self) -> int:
+        """Taille mémoire approximative des masques (N / 8 octets par masque)."""
+        return (len(self.position_masks) + len(self.count_masks)) * ((len(self.words) + 7) // 8)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __repr__(self) -> str:
+        return f"CandidateIndex(words={len(self.words)}, masks={len(self.position_masks) + len(self.count_masks)})"
@@ -8,8 +8,9 @@ Maintient l'état des connaissances accumulées :
 - Contraintes de fréquence pour les lettres dupliquées
 """
 
-from typing import Dict, Set, List, Optional
-from ..game.feedback import FeedbackResult, Feedback
+from typing import Dict, Set, List, Optional, Tuple
+from ..game.feedback import FeedbackResult, Feedback, hard_mode_violation
+from ..dictionaries.word_table import WORD_LENGTH
 
 
 class ConstraintManager:
@@ -23,9 +24,16 @@ class ConstraintManager:
     4. letter_counts: {lettre: (min, max)} - contraintes de fréquence
     """
     
-    def __init__(self):
-        """Initialise un gestionnaire de contraintes vide."""
-        # Positions connues (index 0-4)
+    def __init__(self, word_length: Optional[int] = None):
+        """
+        Initialise un gestionnaire de contraintes vide.
+        
+        Args:
+            word_length: Longueur des mots (défaut : celle du premier feedback)
+        """
+        self.word_length = word_length
+        
+        # Positions connues (index 0 à L-1)
         self.correct_positions: Dict[int, str] = {}
         
         # Lettres présentes mais positions où elles ne peuvent PAS être
@@ -38,6 +46,25 @@ class ConstraintManager:
         # min = nombre minimum d'occurrences
         # max = nombre maximum d'occurrences (None = illimité)
         self.letter_counts: Dict[str, tuple[int, Optional[int]]] = {}
+        
+        # Feedbacks appliqués, dans l'ordre (historique de la partie)
+        self.history: List[FeedbackResult] = []
+    
+    @classmethod
+    def from_feedbacks(cls, feedbacks: List[FeedbackResult]) -> "ConstraintManager":
+        """
+        Construit un gestionnaire en appliquant une suite de feedbacks.
+        
+        Args:
+            feedbacks: Feedbacks dans l'ordre des tentatives
+            
+        Returns:
+            Nouveau ConstraintManager
+        """
+        manager = cls()
+        for feedback in feedbacks:
+            manager.apply_feedback(feedback)
+        return manager
     
     def apply_feedback(self, feedback: FeedbackResult):
         """
@@ -46,7 +73,10 @@ class ConstraintManager:
         Args:
             feedback: Résultat d'une tentative
         """
+        self.history.append(feedback)
         guess = feedback.guess
+        if self.word_length is None:
+            self.word_length = len(guess)
         
         # Compter les occurrences de chaque lettre dans le feedback
         letter_feedback_counts: Dict[str, Dict[str, int]] = {}
@@ -137,14 +167,14 @@ class ConstraintManager:
         Vérifie si un mot respecte toutes les contraintes.
         
         Args:
-            word: Le mot à vérifier (5 lettres en majuscules)
+            word: Le mot à vérifier (majuscules)
             
         Returns:
             True si le mot respecte toutes les contraintes
         """
         word = word.upper()
         
-        if len(word) != 5:
+        if len(word) != (self.word_length or WORD_LENGTH):
             return False
         
         # Vérifier les positions correctes
@@ -197,6 +227,22 @@ class ConstraintManager:
             'total_constraints': len(self.correct_positions) + len(self.present_letters) + len(self.absent_letters)
         }
     
+    def is_allowed_guess(self, word: str) -> bool:
+        """
+        Vérifie qu'une tentative est autorisée en mode difficile.
+        
+        Contrairement à is_word_valid, une tentative peut contenir des
+        lettres grises ou une lettre jaune à une position déjà essayée :
+        seuls les verts et les lettres révélées sont imposés.
+        
+        Args:
+            word: La tentative à vérifier (majuscules)
+        
+        Returns:
+            True si la tentative respecte les indices révélés
+        """
+        return hard_mode_violation(word, self.history) is None
+    
     def get_known_letters(self) -> Set[str]:
         """Retourne l'ensemble des lettres connues (vertes + jaunes)."""
         known = set(self.correct_positions.values())
@@ -205,7 +251,31 @@ class ConstraintManager:
     
     def get_unknown_positions(self) -> List[int]:
         """Retourne les positions qui ne sont pas encore connues."""
-        return [i for i in range(5) if i not in self.correct_positions]
+        return [i for i in range(self.word_length or WORD_LENGTH) if i not in self.correct_positions]
+    
+    def history_key(self) -> Tuple[Tuple[str, int], ...]:
+        """
+        Retourne une clé hashable identifiant l'historique des feedbacks.
+        
+        Returns:
+            Tuple de (tentative, code du pattern) dans l'ordre
+        """
+        return tuple((fb.guess, fb.code) for fb in self.history)
+    
+    def copy(self) -> "ConstraintManager":
+        """
+        Retourne une copie indépendante (fork) du gestionnaire.
+        
+        Returns:
+            Nouveau ConstraintManager avec les mêmes contraintes
+        """
+        clone = ConstraintManager(self.word_length)
+        clone.correct_positions = dict(self.correct_positions)
+        clone.present_letters = {k: set(v) for k, v in self.present_letters.items()}
+        clone.absent_letters = set(self.absent_letters)
+        clone.letter_counts = dict(self.letter_counts)
+        clone.history = list(self.history)
+        return clone
     
     def reset(self):
         """Réinitialise toutes les contraintes."""
@@ -213,6 +283,7 @@ class ConstraintManager:
         self.present_letters.clear()
         self.absent_letters.clear()
         self.letter_counts.clear()
+        self.history.clear()
     
     def __str__(self) -> str:
         summary = self.get_constraint_summary()
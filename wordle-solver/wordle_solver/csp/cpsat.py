@@ -0,0 +1,280 @@
+"""
+Module de résolution CSP avec OR-Tools CP-SAT.
+
+Utilise Google OR-Tools pour modéliser et résoudre le problème Wordle
+comme un problème de satisfaction de contraintes.
+
+OR-Tools est lourd à importer (plusieurs centaines de millisecondes) : ce
+module n'est chargé qu'au premier usage de CP-SAT (HybridSolver.csp_solver,
+ou wordle_solver.csp.WordleCSPSolver), jamais par import wordle_solver.
+"""
+
+from typing import List, Optional, Set, Union
+import numpy as np
+from ortools.sat.python import cp_model
+from ..dictionaries.word_table import WordTable
+from .constraint_manager import ConstraintManager
+from .word_filter import WordFilter
+
+
+class WordleCSPSolver:
+    """
+    Solveur CSP pour Wordle utilisant OR-Tools CP-SAT.
+    
+    Modélise le mot comme un identifiant du dictionnaire lié à une
+    variable par position (contrainte de table), et applique les
+    contraintes de la partie sur ces variables.
+    """
+    
+    def __init__(self, dictionary: Union[WordTable, Set[str]], word_filter: Optional[WordFilter] = None):
+        """
+        Initialise le solveur CSP.
+        
+        Args:
+            dictionary: WordTable ou ensemble de mots valides (de même longueur)
+            word_filter: Filtre existant du même dictionnaire, à partager (optionnel)
+        """
+        self.table = WordTable.of(dictionary)
+        self.word_filter = word_filter if word_filter is not None else WordFilter(self.table)
+        self.dictionary = self.word_filter.full_dictionary
+        
+        # Mapping lettre <-> entier pour OR-Tools (codes de lettres de la table)
+        self.letter_to_int = dict(self.table.letter_index)
+        self.int_to_letter = dict(enumerate(self.table.alphabet))
+    
+    def solve(self, constraint_manager: ConstraintManager, max_solutions: int = 100) -> List[str]:
+        """
+        Résout le CSP et retourne les mots possibles.
+        
+        Note: Pour Wordle, le filtrage direct est souvent plus efficace que CP-SAT
+        pour ce type de contraintes. Cette méthode est fournie pour démonstration.
+        
+        Args:
+            constraint_manager: Gestionnaire de contraintes
+            max_solutions: Nombre maximum de solutions à retourner
+            
+        Returns:
+            Liste de mots valides
+        """
+        # Pour Wordle, le filtrage direct est plus efficace
+        # On utilise donc WordFilter plutôt que de modéliser tout dans CP-SAT
+        valid_words = self.word_filter.filter_by_constraints(constraint_manager)
+        return sorted(list(valid_words))[:max_solutions]
+    
+    def solve_with_cpsat(
+        self,
+        constraint_manager: ConstraintManager,
+        max_solutions: int = 100,
+        hint: Optional[str] = None,
+        max_time: float = 10.0
+    ) -> List[str]:
+        """
+        Résout en utilisant vraiment CP-SAT.
+        
+        Le modèle (voir add_word_variables) ne contient que des mots du
+        dictionnaire : chaque solution énumérée est un candidat, sans
+        combinaisons de lettres à rejeter.
+        
+        Args:
+            constraint_manager: Gestionnaire de contraintes
+            max_solutions: Nombre maximum de solutions
+            hint: Mot probablement valide, proposé au solveur comme point de départ
+            max_time: Temps de résolution maximum (secondes)
+            
+        Returns:
+            Liste de mots valides (dans l'ordre de découverte)
+        """
+        model = cp_model.CpModel()
+        positions = self.add_word_variables(model, constraint_manager)
+        if positions is None:
+            return []  # Aucune solution possible
+        
+        # Point de départ de la recherche
+        if hint is not None and hint in self.table:
+            for var, code in zip(positions, self.table.letters[self.table.index[hint]]):
+                model.AddHint(var, int(code))
+        
+        # Résoudre et collecter les solutions
+        solver = cp_model.CpSolver()
+        solution_collector = WordSolutionCollector(positions, self.table, max_solutions)
+        
+        solver.parameters.enumerate_all_solutions = True
+        solver.parameters.max_time_in_seconds = max_time
+        # Le presolve (qui doit conserver toutes les solutions) coûte plus
+        # qu'il ne rapporte sur une table déjà réduite aux domaines
+        solver.parameters.cp_model_presolve = False
+        
+        status = solver.Solve(model, solution_collector)
+        
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return solution_collector.solutions
+        else:
+            return []
+    
+    def add_word_variables(
+        self,
+        model: cp_model.CpModel,
+        constraint_manager: ConstraintManager,
+        name: str = 'word'
+    ) -> Optional[List[cp_model.IntVar]]:
+        """
+        Ajoute à un modèle un mot du dictionnaire respectant des contraintes.
+        
+        Variables : une lettre (code de la table) par position, restreintes
+        aux mots du dictionnaire par une contrainte de table
+        (AddAllowedAssignments). Les contraintes vertes, jaunes et grises
+        réduisent les domaines des positions, et seules les lignes de la
+        table compatibles avec ces domaines sont ajoutées ; les contraintes
+        de fréquence (letter_counts) portent sur le nombre de positions
+        égales à chaque lettre. Plusieurs mots (plusieurs grilles, par
+        exemple) peuvent être ajoutés au même modèle avec des noms différents.
+        
+        Args:
+            model: Modèle CP-SAT à compléter
+            constraint_manager: Gestionnaire de contraintes
+            name: Préfixe des noms de variables
+            
+        Returns:
+            Variables de position, ou None si aucune solution n'est possible
+        """
+        letter_to_int = self.letter_to_int
+        
+        # Une lettre obligatoire absente du dictionnaire : aucune solution
+        for letter, (min_count, _) in constraint_manager.letter_counts.items():
+            if min_count > 0 and letter not in letter_to_int:
+                return None
+        
+        # Domaine de chaque position (positions vertes, jaunes interdites, grises)
+        domains = []
+        for i in range(self.table.word_length):
+            possible_letters = self._get_possible_letters_at_position(i, constraint_manager)
+            letter_values = sorted(letter_to_int[letter] for letter in possible_letters if letter in letter_to_int)
+            if not letter_values:
+                return None
+            domains.append(letter_values)
+        
+        # Contraintes de fréquence (une lettre présente apparaît au moins une fois)
+        required = dict(constraint_manager.letter_counts)
+        for letter in constraint_manager.present_letters:
+            min_count, max_count = required.get(letter, (0, None))
+            required[letter] = (max(min_count, 1), max_count)
+        for letter, (min_count, _) in required.items():
+            if letter in letter_to_int and min_count > sum(letter_to_int[letter] in values for values in domains):
+                return None
+        
+        # Seules les lignes compatibles avec les domaines entrent dans la table
+        letters = self.table.letters
+        rows = np.ones(len(letters), dtype=bool)
+        for i, values in enumerate(domains):
+            rows &= np.isin(letters[:, i], values)
+        word_ids = np.flatnonzero(rows)
+        if len(word_ids) == 0:
+            return None
+        
+        positions = [
+            model.NewIntVarFromDomain(cp_model.Domain.FromValues(values), f'{name}_pos_{i}')
+            for i, values in enumerate(domains)
+        ]
+        model.AddAllowedAssignments(positions, letters[word_ids].tolist())
+        
+        # min <= nombre de positions égales à la lettre <= max
+        for letter, (min_count, max_count) in required.items():
+            if letter not in letter_to_int:
+                continue
+            code = letter_to_int[letter]
+            matches = []
+            for i, var in enumerate(positions):
+                if code not in domains[i]:
+                    continue
+                is_letter = model.NewBoolVar(f'{name}_{i}_is_{letter}')
+                model.Add(var == code).OnlyEnforceIf(is_letter)
+                model.Add(var != code).OnlyEnforceIf(is_letter.Not())
+                matches.append(is_letter)
+            
+            if min_count > 0:
+                model.Add(sum(matches) >= min_count)
+            if max_count is not None and max_count < len(matches):
+                model.Add(sum(matches) <= max_count)
+        
+        return positions
+    
+    def _get_possible_letters_at_position(
+        self, 
+        position: int, 
+        constraint_manager: ConstraintManager
+    ) -> Set[str]:
+        """
+        Détermine les lettres possibles à une position donnée.
+        
+        Args:
+            position: Position (0-4)
+            constraint_manager: Gestionnaire de contraintes
+            
+        Returns:
+            Ensemble de lettres possibles
+        """
+        # Si position déjà connue
+        if position in constraint_manager.correct_positions:
+            return {constraint_manager.correct_positions[position]}
+        
+        # Sinon, toutes les lettres sauf celles interdites
+        all_letters = set(self.letter_to_int.keys())
+        
+        # Retirer les lettres absentes
+        all_letters -= constraint_manager.absent_letters
+        
+        # Retirer les lettres jaunes à cette position
+        for letter, forbidden_positions in constraint_manager.present_letters.items():
+            if position in forbidden_positions:
+                all_letters.discard(letter)
+        
+        return all_letters
+    
+    def get_statistics(self) -> dict:
+        """
+        Retourne des statistiques sur le dictionnaire.
+        
+        Returns:
+            Dictionnaire avec stats
+        """
+        return {
+            'total_words': len(self.dictionary),
+            'current_candidates': len(self.word_filter.current_candidates),
+            'letters': len(self.letter_to_int),
+            'average_word_length': self.table.word_length,
+        }
+
+
+class WordSolutionCollector(cp_model.CpSolverSolutionCallback):
+    """
+    Callback pour collecter les solutions trouvées par CP-SAT.
+    """
+    
+    def __init__(
+        self, 
+        position_vars: List[cp_model.IntVar],
+        table: WordTable,
+        max_solutions: int
+    ):
+        """
+        Initialise le collecteur.
+        
+        Args:
+            position_vars: Variables CP-SAT pour chaque position
+            table: Table de mots (codes de lettres -> mot)
+            max_solutions: Nombre max de solutions à collecter
+        """
+        super().__init__()
+        self.position_vars = position_vars
+        self.alphabet = table.alphabet
+        self.max_solutions = max_solutions
+        self.solutions: List[str] = []
+    
+    def on_solution_callback(self):
+        """Appelé quand une solution est trouvée."""
+        # Chaque solution est un mot du dictionnaire (contrainte de table)
+        self.solutions.append(''.join(self.alphabet[self.Value(var)] for var in self.position_vars))
+        
+        # Arrêter si on a assez de solutions
+        if len(self.solutions) >= self.max_solutions:
+            self.StopSearch()
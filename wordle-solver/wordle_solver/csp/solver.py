@@ -1,290 +1,254 @@
 """
-Module de résolution CSP avec OR-Tools CP-SAT.
+Module du solveur hybride.
 
-Utilise Google OR-Tools pour modéliser et résoudre le problème Wordle
-comme un problème de satisfaction de contraintes.
+Le filtrage par masques de bits (CandidateIndex) résout la quasi-totalité
+des requêtes ; le solveur CP-SAT (module cpsat, qui importe OR-Tools) n'est
+chargé qu'au premier appel avec use_cpsat=True.
 """
 
-from typing import Set, List, Optional
-from ortools.sat.python import cp_model
+from functools import cached_property
+from typing import Dict, Iterable, Set, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from ..dictionaries.word_table import WordTable
+from ..game.feedback import FeedbackResult
 from .constraint_manager import ConstraintManager
 from .word_filter import WordFilter
+from ..utils import metrics
+from ..utils.cache import LRUCache
 
 
-class WordleCSPSolver:
+class HybridSolver:
     """
-    Solveur CSP pour Wordle utilisant OR-Tools CP-SAT.
+    Solveur hybride combinant filtrage efficace et CP-SAT si nécessaire.
+    
+    Utilise le filtrage direct pour la majorité des cas,
+    et CP-SAT uniquement pour des contraintes complexes.
     
-    Modélise chaque position du mot comme une variable de domaine
-    et applique les contraintes pour trouver les mots valides.
+    Les contraintes d'une partie ne font que s'accumuler : le solveur garde
+    donc l'ensemble des candidats de chaque historique de feedbacks et,
+    au tour suivant, ne restreint que cet ensemble avec le dernier feedback.
     """
     
-    def __init__(self, dictionary: Set[str]):
+    # Nombre maximum d'historiques de parties gardés en mémoire
+    MAX_TRACKED_HISTORIES = 4096
+    
+    def __init__(self, dictionary: Union[WordTable, Set[str]]):
         """
-        Initialise le solveur CSP.
+        Initialise le solveur hybride.
         
         Args:
-            dictionary: Ensemble de mots valides (5 lettres)
+            dictionary: WordTable ou ensemble de mots valides
         """
-        self.dictionary = {word.upper() for word in dictionary}
-        self.word_filter = WordFilter(self.dictionary)
-        
-        # Créer un mapping lettre <-> entier pour OR-Tools
-        all_letters = set()
-        for word in self.dictionary:
-            all_letters.update(word)
+        # Le filtre (et son index) est partagé avec le solveur CP-SAT
+        self.table = WordTable.of(dictionary)
+        self.word_filter = WordFilter(self.table)
         
-        self.letter_to_int = {letter: i for i, letter in enumerate(sorted(all_letters))}
-        self.int_to_letter = {i: letter for letter, i in self.letter_to_int.items()}
+        # Masque des candidats par historique de feedbacks
+        self._history_masks = LRUCache('hybrid_solver_histories', max_entries=self.MAX_TRACKED_HISTORIES)
+        # Masque des tentatives autorisées (mode difficile) par historique
+        self._allowed_masks = LRUCache('hybrid_solver_hard_mode', max_entries=self.MAX_TRACKED_HISTORIES)
+    
+    @cached_property
+    def csp_solver(self):
+        """Solveur CP-SAT partageant le filtre (OR-Tools importé au premier accès)."""
+        from .cpsat import WordleCSPSolver
+        return WordleCSPSolver(self.table, word_filter=self.word_filter)
     
-    def solve(self, constraint_manager: ConstraintManager, max_solutions: int = 100) -> List[str]:
+    def solve(
+        self, 
+        constraint_manager: ConstraintManager, 
+        use_cpsat: bool = False
+    ) -> Set[str]:
         """
-        Résout le CSP et retourne les mots possibles.
-        
-        Note: Pour Wordle, le filtrage direct est souvent plus efficace que CP-SAT
-        pour ce type de contraintes. Cette méthode est fournie pour démonstration.
+        Résout le problème en choisissant la meilleure approche.
         
         Args:
             constraint_manager: Gestionnaire de contraintes
-            max_solutions: Nombre maximum de solutions à retourner
+            use_cpsat: Forcer l'utilisation de CP-SAT
             
         Returns:
-            Liste de mots valides
+            Ensemble de mots valides
         """
-        # Pour Wordle, le filtrage direct est plus efficace
-        # On utilise donc WordFilter plutôt que de modéliser tout dans CP-SAT
-        valid_words = self.word_filter.filter_by_constraints(constraint_manager)
-        return sorted(list(valid_words))[:max_solutions]
+        if use_cpsat:
+            solutions = self.csp_solver.solve_with_cpsat(constraint_manager)
+            return set(solutions)
+        else:
+            # Le filtrage est généralement plus rapide pour Wordle
+            mask = self.candidate_mask(constraint_manager)
+            return set(self.word_filter.index.words_of(mask))
     
-    def solve_with_cpsat(self, constraint_manager: ConstraintManager, max_solutions: int = 100) -> List[str]:
+    @metrics.timed('filter')
+    def candidate_mask(self, constraint_manager: ConstraintManager) -> int:
         """
-        Résout en utilisant vraiment CP-SAT (pour démonstration).
+        Retourne le masque des candidats, en réutilisant le tour précédent.
         
-        Cette approche est plus lente que le filtrage direct mais montre
-        comment modéliser le problème avec OR-Tools.
+        Si le masque de l'historique sans le dernier feedback est connu,
+        seuls ses candidats sont restreints par le nouveau feedback. Sans historique
+        (contraintes construites à la main), le filtrage repart du
+        dictionnaire complet.
         
         Args:
             constraint_manager: Gestionnaire de contraintes
-            max_solutions: Nombre maximum de solutions
             
         Returns:
-            Liste de mots valides
+            Masque des mots valides (voir CandidateIndex)
         """
-        model = cp_model.CpModel()
+        index = self.word_filter.index
+        key = constraint_manager.history_key()
         
-        # Variables : une pour chaque position (0-4)
-        positions = []
-        for i in range(5):
-            # Domaine = toutes les lettres possibles à cette position
-            possible_letters = self._get_possible_letters_at_position(i, constraint_manager)
-            if not possible_letters:
-                return []  # Aucune solution possible
-            
-            letter_values = [self.letter_to_int[letter] for letter in possible_letters]
-            var = model.NewIntVarFromDomain(
-                cp_model.Domain.FromValues(letter_values),
-                f'pos_{i}'
-            )
-            positions.append(var)
-        
-        # Contrainte : positions correctes (vertes)
-        for pos, letter in constraint_manager.correct_positions.items():
-            model.Add(positions[pos] == self.letter_to_int[letter])
-        
-        # Contraintes : lettres présentes (jaunes)
-        for letter, forbidden_positions in constraint_manager.present_letters.items():
-            letter_int = self.letter_to_int[letter]
-            
-            # La lettre doit apparaître au moins une fois
-            at_least_one = []
-            for i in range(5):
-                at_least_one.append(positions[i] == letter_int)
-            model.AddBoolOr(at_least_one)
-            
-            # Mais pas aux positions interdites
-            for forbidden_pos in forbidden_positions:
-                model.Add(positions[forbidden_pos] != letter_int)
-        
-        # Contrainte : lettres absentes (grises)
-        for letter in constraint_manager.absent_letters:
-            if letter in self.letter_to_int:
-                letter_int = self.letter_to_int[letter]
-                for pos in range(5):
-                    model.Add(positions[pos] != letter_int)
+        if not key:
+            return index.mask_for(constraint_manager)
         
-        # Résoudre et collecter les solutions
-        solver = cp_model.CpSolver()
-        solution_collector = WordSolutionCollector(
-            positions, 
-            self.int_to_letter,
-            self.dictionary,
-            max_solutions
-        )
+        mask = self._history_masks.get(key)
+        if mask is not None:
+            return mask
         
-        solver.parameters.enumerate_all_solutions = True
-        solver.parameters.max_time_in_seconds = 10.0
-        
-        status = solver.Solve(model, solution_collector)
-        
-        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-            return solution_collector.solutions
+        parent = self._history_masks.get(key[:-1])
+        if parent is not None:
+            mask = parent & self._feedback_mask(constraint_manager.history[-1])
         else:
-            return []
+            mask = index.mask_for(constraint_manager)
+        
+        self._history_masks.put(key, mask)
+        return mask
     
-    def _get_possible_letters_at_position(
-        self, 
-        position: int, 
-        constraint_manager: ConstraintManager
-    ) -> Set[str]:
+    def _feedback_mask(self, feedback: FeedbackResult) -> int:
+        """Masque des mots compatibles avec un seul feedback."""
+        return self.word_filter.index.mask_for(ConstraintManager.from_feedbacks([feedback]))
+    
+    def allowed_guess_mask(self, constraint_manager: ConstraintManager) -> int:
         """
-        Détermine les lettres possibles à une position donnée.
+        Retourne le masque des tentatives autorisées en mode difficile.
+        
+        Comme candidate_mask, le masque est maintenu d'un tour à l'autre :
+        celui de l'historique sans le dernier feedback est restreint par les
+        seuls indices de ce feedback, avec le même index de bits que les
+        candidats.
         
         Args:
-            position: Position (0-4)
-            constraint_manager: Gestionnaire de contraintes
-            
+            constraint_manager: Gestionnaire de contraintes (historique)
+        
         Returns:
-            Ensemble de lettres possibles
+            Masque des tentatives autorisées (voir CandidateIndex)
         """
-        # Si position déjà connue
-        if position in constraint_manager.correct_positions:
-            return {constraint_manager.correct_positions[position]}
-        
-        # Sinon, toutes les lettres sauf celles interdites
-        all_letters = set(self.letter_to_int.keys())
+        index = self.word_filter.index
+        key = constraint_manager.history_key()
         
-        # Retirer les lettres absentes
-        all_letters -= constraint_manager.absent_letters
+        if not key:
+            return index.full_mask
         
-        # Retirer les lettres jaunes à cette position
-        for letter, forbidden_positions in constraint_manager.present_letters.items():
-            if position in forbidden_positions:
-                all_letters.discard(letter)
+        mask = self._allowed_masks.get(key)
+        if mask is not None:
+            return mask
         
-        return all_letters
-    
-    def get_statistics(self) -> dict:
-        """
-        Retourne des statistiques sur le dictionnaire.
+        parent = self._allowed_masks.get(key[:-1])
+        if parent is not None:
+            mask = parent & index.allowed_guess_mask(constraint_manager.history[-1:])
+        else:
+            mask = index.allowed_guess_mask(constraint_manager.history)
         
-        Returns:
-            Dictionnaire avec stats
-        """
-        return {
-            'total_words': len(self.dictionary),
-            'current_candidates': len(self.word_filter.current_candidates),
-            'letters': len(self.letter_to_int),
-            'average_word_length': 5,  # Fixe pour Wordle
-        }
-
-
-class WordSolutionCollector(cp_model.CpSolverSolutionCallback):
-    """
-    Callback pour collecter les solutions trouvées par CP-SAT.
-    """
+        self._allowed_masks.put(key, mask)
+        return mask
     
-    def __init__(
-        self, 
-        position_vars: List[cp_model.IntVar],
-        int_to_letter: dict[int, str],
-        dictionary: Set[str],
-        max_solutions: int
-    ):
+    def allowed_guesses(self, constraint_manager: ConstraintManager, hard_mode: bool = True) -> Set[str]:
         """
-        Initialise le collecteur.
+        Retourne les tentatives autorisées.
         
         Args:
-            position_vars: Variables CP-SAT pour chaque position
-            int_to_letter: Mapping entier -> lettre
-            dictionary: Dictionnaire pour valider les mots
-            max_solutions: Nombre max de solutions à collecter
-        """
-        super().__init__()
-        self.position_vars = position_vars
-        self.int_to_letter = int_to_letter
-        self.dictionary = dictionary
-        self.max_solutions = max_solutions
-        self.solutions: List[str] = []
-    
-    def on_solution_callback(self):
-        """Appelé quand une solution est trouvée."""
-        # Reconstruire le mot
-        word = ''.join([
-            self.int_to_letter[self.Value(var)]
-            for var in self.position_vars
-        ])
+            constraint_manager: Gestionnaire de contraintes (historique)
+            hard_mode: Mode difficile (sinon tout le dictionnaire est autorisé)
         
-        # Vérifier que c'est un mot valide du dictionnaire
-        if word in self.dictionary:
-            self.solutions.append(word)
-        
-        # Arrêter si on a assez de solutions
-        if len(self.solutions) >= self.max_solutions:
-            self.StopSearch()
-
-
-class HybridSolver:
-    """
-    Solveur hybride combinant filtrage efficace et CP-SAT si nécessaire.
-    
-    Utilise le filtrage direct pour la majorité des cas,
-    et CP-SAT uniquement pour des contraintes complexes.
-    """
-    
-    def __init__(self, dictionary: Set[str]):
-        """
-        Initialise le solveur hybride.
-        
-        Args:
-            dictionary: Ensemble de mots valides
+        Returns:
+            Ensemble des tentatives autorisées
         """
-        self.word_filter = WordFilter(dictionary)
-        self.csp_solver = WordleCSPSolver(dictionary)
+        if not hard_mode:
+            return self.word_filter.full_dictionary
+        return set(self.word_filter.index.words_of(self.allowed_guess_mask(constraint_manager)))
     
-    def solve(
-        self, 
-        constraint_manager: ConstraintManager, 
-        use_cpsat: bool = False
-    ) -> Set[str]:
+    def masks_for_histories(
+        self,
+        histories: Iterable[Sequence[Tuple[str, int]]]
+    ) -> Dict[Tuple[Tuple[str, int], ...], int]:
         """
-        Résout le problème en choisissant la meilleure approche.
+        Calcule les masques de candidats d'un lot d'historiques.
+        
+        Les historiques identiques ne sont filtrés qu'une fois, un préfixe
+        commun à plusieurs historiques n'est calculé qu'une fois, et le
+        masque d'un même feedback est réutilisé entre les branches.
         
         Args:
-            constraint_manager: Gestionnaire de contraintes
-            use_cpsat: Forcer l'utilisation de CP-SAT
+            histories: Historiques de (tentative, code du pattern)
             
         Returns:
-            Ensemble de mots valides
+            Dictionnaire {historique (tuple normalisé): masque des candidats}
         """
-        if use_cpsat:
-            solutions = self.csp_solver.solve_with_cpsat(constraint_manager)
-            return set(solutions)
-        else:
-            # Le filtrage est généralement plus rapide pour Wordle
-            return self.word_filter.filter_by_constraints(constraint_manager)
+        prefix_masks = {(): self.word_filter.index.full_mask}
+        feedback_masks: Dict[Tuple[str, int], int] = {}
+        masks: Dict[Tuple[Tuple[str, int], ...], int] = {}
+        
+        for history in histories:
+            key = tuple((guess.upper(), int(code)) for guess, code in history)
+            if key in masks:
+                continue
+            
+            # Repartir du plus long préfixe déjà filtré
+            depth = len(key)
+            while key[:depth] not in prefix_masks:
+                depth -= 1
+            mask = prefix_masks[key[:depth]]
+            
+            for i in range(depth, len(key)):
+                feedback_mask = feedback_masks.get(key[i])
+                if feedback_mask is None:
+                    feedback_mask = self._feedback_mask(FeedbackResult.from_code(*key[i]))
+                    feedback_masks[key[i]] = feedback_mask
+                mask &= feedback_mask
+                prefix_masks[key[:i + 1]] = mask
+            
+            masks[key] = mask
+        
+        return masks
     
     def get_possible_words(
         self, 
         constraint_manager: ConstraintManager,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        scores: Optional[np.ndarray] = None
     ) -> List[str]:
         """
-        Retourne les mots possibles triés alphabétiquement.
+        Retourne les mots possibles triés alphabétiquement (ou par score).
+        
+        Les identifiants suivant l'ordre alphabétique, les `limit` premiers
+        mots sont lus dans le masque des candidats sans tri ; avec des
+        scores, seuls les `limit` meilleurs sont triés.
         
         Args:
             constraint_manager: Gestionnaire de contraintes
             limit: Nombre maximum de mots à retourner (None = tous)
+            scores: Score de chaque mot du dictionnaire, indexé par
+                    identifiant (ex. probabilité a priori) : tri par score
+                    décroissant, optionnel
             
         Returns:
             Liste de mots possibles
         """
-        words = self.solve(constraint_manager, use_cpsat=False)
-        sorted_words = sorted(list(words))
+        index = self.word_filter.index
+        mask = self.candidate_mask(constraint_manager)
+        
+        if scores is None:
+            return index.words_of(mask, limit or None)
         
-        if limit:
-            return sorted_words[:limit]
-        return sorted_words
+        ids = index.top_ids(mask, scores, limit or len(index))
+        return self.table.words_of(ids)
     
     def count_possible_words(self, constraint_manager: ConstraintManager) -> int:
         """Retourne le nombre de mots possibles."""
-        return len(self.solve(constraint_manager, use_cpsat=False))
+        return self.candidate_mask(constraint_manager).bit_count()
+
+
+def __getattr__(name: str):
+    """Donne accès à WordleCSPSolver depuis ce module sans importer OR-Tools d'avance."""
+    if name == 'WordleCSPSolver':
+        from .cpsat import WordleCSPSolver
+        return WordleCSPSolver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
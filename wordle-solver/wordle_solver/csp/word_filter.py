@@ -5,28 +5,39 @@ Implémente un filtrage efficace du dictionnaire de mots
 en appliquant toutes les contraintes accumulées.
 """
 
-from typing import Set, List
+import hashlib
+from typing import Set, List, Union
 from .constraint_manager import ConstraintManager
+from .candidate_index import CandidateIndex
+from ..dictionaries.word_table import WordTable
+from ..utils.cache import LRUCache
 
 
 class WordFilter:
     """
     Filtre un dictionnaire de mots selon les contraintes CSP.
     
-    Optimisé pour performance avec des opérations sur sets.
+    Optimisé pour performance : les contraintes sont évaluées par
+    opérations sur des masques de bits pré-calculés (CandidateIndex).
     """
     
-    def __init__(self, dictionary: Set[str]):
+    # Nombre maximum d'états de contraintes gardés en cache
+    CACHE_MAX_ENTRIES = 256
+    
+    def __init__(self, dictionary: Union[WordTable, Set[str]]):
         """
         Initialise le filtre avec un dictionnaire.
         
         Args:
-            dictionary: Ensemble de mots valides (5 lettres en majuscules)
+            dictionary: WordTable ou ensemble de mots valides (de même longueur)
         """
-        # Normaliser tous les mots en majuscules
-        self.full_dictionary = {word.upper() for word in dictionary}
+        # Mots normalisés une seule fois par la table
+        self.table = WordTable.of(dictionary)
+        self.full_dictionary = set(self.table.words)
         self.current_candidates = self.full_dictionary.copy()
-        self._cache = {}
+        self.index = CandidateIndex(self.table)
+        # Cache borné : empreinte des contraintes -> masque des candidats
+        self._cache = LRUCache('word_filter', max_entries=self.CACHE_MAX_ENTRIES)
     
     def filter_by_constraints(self, constraint_manager: ConstraintManager) -> Set[str]:
         """
@@ -41,18 +52,15 @@ class WordFilter:
         # Créer une clé de cache basée sur les contraintes
         cache_key = self._create_cache_key(constraint_manager)
         
-        if cache_key in self._cache:
-            return self._cache[cache_key].copy()
-        
-        # CORRECTION: Toujours filtrer depuis le dictionnaire complet
-        # pour éviter de perdre des mots à cause d'un état mutable
-        valid_words = {
-            word for word in self.full_dictionary
-            if constraint_manager.is_word_valid(word)
-        }
+        mask = self._cache.get(cache_key)
+        if mask is None:
+            # CORRECTION: Toujours filtrer depuis le dictionnaire complet
+            # pour éviter de perdre des mots à cause d'un état mutable
+            mask = self.index.mask_for(constraint_manager)
+            self._cache.put(cache_key, mask)
         
-        # Mettre en cache et mettre à jour current_candidates pour info
-        self._cache[cache_key] = valid_words
+        # Mettre à jour current_candidates pour info
+        valid_words = set(self.index.words_of(mask))
         self.current_candidates = valid_words
         
         return valid_words.copy()
@@ -68,12 +76,14 @@ class WordFilter:
         Returns:
             Ensemble de mots valides
         """
+        mask = self.index.mask_for(constraint_manager)
         return {
             word for word in words
-            if constraint_manager.is_word_valid(word)
+            if self.index.contains(mask, word)
+            or (word not in self.index.index and constraint_manager.is_word_valid(word))
         }
     
-    def _create_cache_key(self, constraint_manager: ConstraintManager) -> str:
+    def _create_cache_key(self, constraint_manager: ConstraintManager) -> bytes:
         """
         Crée une clé de cache unique basée sur les contraintes.
         
@@ -81,7 +91,7 @@ class WordFilter:
             constraint_manager: Le gestionnaire de contraintes
             
         Returns:
-            Clé de cache sous forme de string
+            Empreinte compacte (16 octets) des contraintes
         """
         summary = constraint_manager.get_constraint_summary()
         
@@ -93,7 +103,8 @@ class WordFilter:
         absent = tuple(sorted(summary['absent_letters']))
         counts = tuple(sorted(summary['letter_counts'].items()))
         
-        return f"{correct}|{present}|{absent}|{counts}"
+        key = f"{correct}|{present}|{absent}|{counts}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
     
     def get_words_by_length(self, length: int) -> Set[str]:
         """
@@ -170,18 +181,16 @@ class WordFilter:
         if not self.current_candidates:
             return {}
         
-        letter_counts = {}
-        total_letters = 0
-        
-        for word in self.current_candidates:
-            for letter in word:
-                letter_counts[letter] = letter_counts.get(letter, 0) + 1
-                total_letters += 1
+        # Occurrences de chaque lettre, toutes positions confondues
+        ids = self.table.ids(self.current_candidates)
+        letter_counts = self.table.position_counts(ids).sum(axis=0)
+        total_letters = len(ids) * self.table.word_length
         
         # Normaliser en fréquences
         return {
             letter: count / total_letters
-            for letter, count in letter_counts.items()
+            for letter, count in zip(self.table.alphabet, letter_counts.tolist())
+            if count
         }
     
     def get_position_letter_frequency(self) -> dict[int, dict[str, float]]:
@@ -194,19 +203,18 @@ class WordFilter:
         if not self.current_candidates:
             return {}
         
-        position_counts = {i: {} for i in range(5)}
-        
-        for word in self.current_candidates:
-            for pos, letter in enumerate(word):
-                if letter not in position_counts[pos]:
-                    position_counts[pos][letter] = 0
-                position_counts[pos][letter] += 1
+        ids = self.table.ids(self.current_candidates)
+        position_counts = self.table.position_counts(ids)
         
         # Normaliser en fréquences
-        n_words = len(self.current_candidates)
+        n_words = len(ids)
         return {
-            pos: {letter: count / n_words for letter, count in counts.items()}
-            for pos, counts in position_counts.items()
+            pos: {
+                letter: count / n_words
+                for letter, count in zip(self.table.alphabet, counts.tolist())
+                if count
+            }
+            for pos, counts in enumerate(position_counts)
         }
     
     def __len__(self) -> int:
@@ -217,87 +225,3 @@ class WordFilter:
     
     def __repr__(self) -> str:
         return self.__str__()
-
-
-class FastWordFilter:
-    """
-    Version optimisée du filtre de mots utilisant des techniques avancées.
-    
-    Utilise des index pré-calculés pour accélérer les opérations de filtrage.
-    """
-    
-    def __init__(self, dictionary: Set[str]):
-        """
-        Initialise le filtre optimisé.
-        
-        Args:
-            dictionary: Ensemble de mots valides
-        """
-        self.dictionary = {word.upper() for word in dictionary}
-        
-        # Index par position
-        self.by_position: dict[int, dict[str, Set[str]]] = self._build_position_index()
-        
-        # Index par lettre présente
-        self.by_letter: dict[str, Set[str]] = self._build_letter_index()
-    
-    def _build_position_index(self) -> dict[int, dict[str, Set[str]]]:
-        """Construit un index des mots par lettre à chaque position."""
-        index = {i: {} for i in range(5)}
-        
-        for word in self.dictionary:
-            for pos, letter in enumerate(word):
-                if letter not in index[pos]:
-                    index[pos][letter] = set()
-                index[pos][letter].add(word)
-        
-        return index
-    
-    def _build_letter_index(self) -> dict[str, Set[str]]:
-        """Construit un index des mots contenant chaque lettre."""
-        index = {}
-        
-        for word in self.dictionary:
-            for letter in set(word):
-                if letter not in index:
-                    index[letter] = set()
-                index[letter].add(word)
-        
-        return index
-    
-    def filter_by_constraints(self, constraint_manager: ConstraintManager) -> Set[str]:
-        """
-        Filtre rapidement selon les contraintes en utilisant les index.
-        
-        Args:
-            constraint_manager: Le gestionnaire de contraintes
-            
-        Returns:
-            Ensemble de mots valides
-        """
-        candidates = self.dictionary.copy()
-        
-        # Filtrer par positions correctes (très sélectif)
-        for pos, letter in constraint_manager.correct_positions.items():
-            if letter in self.by_position[pos]:
-                candidates &= self.by_position[pos][letter]
-            else:
-                return set()  # Aucun mot possible
-        
-        # Filtrer par lettres présentes
-        for letter in constraint_manager.present_letters.keys():
-            if letter in self.by_letter:
-                candidates &= self.by_letter[letter]
-            else:
-                return set()
-        
-        # Filtrer par lettres absentes
-        for letter in constraint_manager.absent_letters:
-            if letter in self.by_letter:
-                candidates -= self.by_letter[letter]
-        
-        # Validation finale pour les contraintes complexes
-        return {
-            word for word in candidates
-            if constraint_manager.is_word_valid(word)
-        }
@@ -1,5 +1,7 @@
 """Module de gestion des dictionnaires de mots."""
 
 from .loader import DictionaryLoader
+from .word_table import WordTable
+from .registry import LanguageData, LanguageRegistry, estimate_memory
 
-__all__ = ['DictionaryLoader']
+__all__ = ['DictionaryLoader', 'WordTable', 'LanguageData', 'LanguageRegistry', 'estimate_memory']
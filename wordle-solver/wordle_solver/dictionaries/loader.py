@@ -2,12 +2,21 @@
 Module de chargement des dictionnaires de mots.
 
 Gère le chargement des mots français et anglais depuis des fichiers.
+Chaque longueur de mots (4 à 8 lettres) a son propre fichier par langue :
+en_words.txt pour 5 lettres, en_words_6.txt pour 6 lettres, etc.
+
+Seuls les fichiers de 5 lettres (en_words.txt, fr_words.txt) sont fournis.
+Pour une autre longueur, déposer le fichier correspondant dans le dossier
+des dictionnaires, passer un chemin (custom_path) ou enregistrer une liste
+de mots avec LanguageRegistry.register().
 """
 
 import os
-from typing import Set
+from typing import List, Set
 from pathlib import Path
 
+from .word_table import MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH, WordTable, check_word_length
+
 
 class DictionaryLoader:
     """Chargeur de dictionnaires pour Wordle."""
@@ -17,13 +26,73 @@ class DictionaryLoader:
     EN_FILE = "en_words.txt"
     FR_FILE = "fr_words.txt"
     
+    @classmethod
+    def file_name(cls, language: str, word_length: int = WORD_LENGTH) -> str:
+        """
+        Nom du fichier de mots d'une langue pour une longueur donnée.
+        
+        Args:
+            language: 'en' ou 'fr'
+            word_length: Longueur des mots
+        
+        Returns:
+            Nom du fichier (dans DEFAULT_DIR)
+        """
+        base = cls.EN_FILE if language.lower() == 'en' else cls.FR_FILE
+        if word_length == WORD_LENGTH:
+            return base
+        stem, suffix = os.path.splitext(base)
+        return f"{stem}_{check_word_length(word_length)}{suffix}"
+    
+    @classmethod
+    def default_path(cls, language: str, word_length: int = WORD_LENGTH) -> str:
+        """
+        Chemin du fichier fourni d'une langue pour une longueur donnée.
+        
+        Args:
+            language: 'en' ou 'fr'
+            word_length: Longueur des mots
+        
+        Returns:
+            Chemin du fichier (dans DEFAULT_DIR)
+        
+        Raises:
+            FileNotFoundError: Si aucun fichier n'existe pour cette longueur
+        """
+        path = cls.DEFAULT_DIR / cls.file_name(language, word_length)
+        if not path.exists():
+            available = ', '.join(str(length) for length in cls.available_lengths(language)) or 'aucune'
+            raise FileNotFoundError(
+                f"Aucun dictionnaire '{language}' de {word_length} lettres : {path.name} absent de "
+                f"{cls.DEFAULT_DIR} (longueurs fournies : {available}). Ajouter ce fichier, passer "
+                f"custom_path ou enregistrer une liste de mots avec LanguageRegistry.register()."
+            )
+        return str(path)
+    
+    @classmethod
+    def available_lengths(cls, language: str) -> List[int]:
+        """
+        Longueurs de mots dont le fichier de la langue est présent.
+        
+        Args:
+            language: 'en' ou 'fr'
+        
+        Returns:
+            Longueurs disponibles (croissantes)
+        """
+        return [
+            length for length in range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1)
+            if (cls.DEFAULT_DIR / cls.file_name(language, length)).exists()
+        ]
+    
     @staticmethod
-    def load_from_file(filepath: str) -> Set[str]:
+    def load_from_file(filepath: str, word_length: int = WORD_LENGTH) -> Set[str]:
         """
         Charge un dictionnaire depuis un fichier.
         
         Args:
             filepath: Chemin vers le fichier
+            word_length: Longueur des mots retenus (les autres sont ignorés)
             
         Returns:
             Ensemble de mots (en majuscules)
@@ -38,47 +107,50 @@ class DictionaryLoader:
         with open(filepath, 'r', encoding='utf-8') as f:
             for line in f:
                 word = line.strip().upper()
-                if len(word) == 5 and word.isalpha():
+                if len(word) == word_length and word.isalpha():
                     words.add(word)
         
         return words
     
     @classmethod
-    def load_english(cls, custom_path: str = None) -> Set[str]:
+    def load_english(cls, custom_path: str = None, word_length: int = WORD_LENGTH) -> Set[str]:
         """
         Charge le dictionnaire anglais.
         
         Args:
             custom_path: Chemin personnalisé (optionnel)
+            word_length: Longueur des mots
             
         Returns:
             Ensemble de mots anglais
         """
-        path = custom_path or str(cls.DEFAULT_DIR / cls.EN_FILE)
-        return cls.load_from_file(path)
+        path = custom_path or cls.default_path('en', word_length)
+        return cls.load_from_file(path, word_length)
     
     @classmethod
-    def load_french(cls, custom_path: str = None) -> Set[str]:
+    def load_french(cls, custom_path: str = None, word_length: int = WORD_LENGTH) -> Set[str]:
         """
         Charge le dictionnaire français.
         
         Args:
             custom_path: Chemin personnalisé (optionnel)
+            word_length: Longueur des mots
             
         Returns:
             Ensemble de mots français
         """
-        path = custom_path or str(cls.DEFAULT_DIR / cls.FR_FILE)
-        return cls.load_from_file(path)
+        path = custom_path or cls.default_path('fr', word_length)
+        return cls.load_from_file(path, word_length)
     
     @classmethod
-    def load_language(cls, language: str, custom_path: str = None) -> Set[str]:
+    def load_language(cls, language: str, custom_path: str = None, word_length: int = WORD_LENGTH) -> Set[str]:
         """
         Charge un dictionnaire selon la langue.
         
         Args:
             language: 'en' ou 'fr'
             custom_path: Chemin personnalisé (optionnel)
+            word_length: Longueur des mots
             
         Returns:
             Ensemble de mots
@@ -87,12 +159,27 @@ class DictionaryLoader:
             ValueError: Si la langue n'est pas supportée
         """
         if language.lower() == 'en':
-            return cls.load_english(custom_path)
+            return cls.load_english(custom_path, word_length)
         elif language.lower() == 'fr':
-            return cls.load_french(custom_path)
+            return cls.load_french(custom_path, word_length)
         else:
             raise ValueError(f"Langue non supportée : {language}. Utilisez 'en' ou 'fr'.")
     
+    @classmethod
+    def load_table(cls, language: str, custom_path: str = None, word_length: int = WORD_LENGTH) -> WordTable:
+        """
+        Charge un dictionnaire sous forme de WordTable (mots encodés, immuable).
+        
+        Args:
+            language: 'en' ou 'fr'
+            custom_path: Chemin personnalisé (optionnel)
+            word_length: Longueur des mots
+            
+        Returns:
+            WordTable du dictionnaire
+        """
+        return WordTable(cls.load_language(language, custom_path, word_length), word_length)
+    
     @staticmethod
     def save_to_file(words: Set[str], filepath: str):
         """
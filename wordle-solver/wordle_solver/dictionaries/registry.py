@@ -0,0 +1,288 @@
+"""
+Registre des langues, partagé par tout le processus.
+
+Chaque dictionnaire de langue est lu une seule fois ; les structures qui en
+dérivent (table de mots, index de candidats, matrice de patterns,
+validateur) sont construites au premier usage ou par warm_up() au
+démarrage, puis passées par référence aux composants (API, comparateur,
+validateur) au lieu d'être recalculées à chaque requête.
+
+Chaque longueur de mots (4 à 8 lettres) est un dictionnaire distinct, avec
+sa propre table, son index et sa matrice de patterns. La matrice croît en
+N² (et double de taille au-delà de 5 lettres, codes sur 16 bits) :
+memory_estimate() donne les tailles avant toute construction, pour choisir
+les longueurs à précharger.
+
+Seules les listes de 5 lettres sont fournies avec le paquet : une autre
+longueur se charge depuis <langue>_words_<L>.txt s'il a été ajouté au
+dossier des dictionnaires, ou s'enregistre avec register() (liste de mots
+ou chemin de fichier). Sinon get() lève une FileNotFoundError explicite.
+"""
+
+import random
+import threading
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Union
+
+from .loader import DictionaryLoader
+from .word_table import WORD_LENGTH, WordTable, check_word_length
+
+
+def estimate_memory(n_words: int, word_length: int = WORD_LENGTH, alphabet_size: int = 26) -> Dict[str, int]:
+    """
+    Estime la mémoire des structures d'un dictionnaire, sans les construire.
+
+    Args:
+        n_words: Nombre de mots (N)
+        word_length: Longueur des mots (L)
+        alphabet_size: Nombre de lettres distinctes (A)
+
+    Returns:
+        Octets par structure : 'table' (N × (L + 2A)), 'index' (majorant :
+        2 × L × A masques de N bits), 'pattern_matrix' (N² codes de 1 ou
+        2 octets) et 'total'
+    """
+    check_word_length(word_length)
+    code_size = 1 if 3 ** word_length <= 256 else 2
+    estimate = {
+        'table': n_words * (word_length + 2 * alphabet_size),
+        'index': 2 * word_length * alphabet_size * ((n_words + 7) // 8),
+        'pattern_matrix': n_words * n_words * code_size,
+    }
+    estimate['total'] = sum(estimate.values())
+    return estimate
+
+
+class LanguageData:
+    """
+    Données immuables d'une langue.
+
+    Attributs :
+    - language : code de la langue ('en', 'fr')
+    - word_length : longueur des mots du dictionnaire
+    - table : WordTable du dictionnaire (identifiants, lettres)
+    - words : mots du dictionnaire (frozenset, majuscules)
+
+    Construits au premier accès (puis partagés) :
+    - solver : HybridSolver (index de candidats en masques de bits)
+    - index : CandidateIndex du solveur
+    - pattern_matrix : PatternMatrix du dictionnaire (cache disque)
+    - validator : WordValidator partageant l'ensemble words
+    """
+
+    def __init__(self, language: str, table: WordTable):
+        """
+        Initialise les données d'une langue.
+
+        Args:
+            language: Code de la langue
+            table: Table de mots du dictionnaire
+        """
+        set_attribute = super().__setattr__
+        set_attribute('language', language)
+        set_attribute('word_length', table.word_length)
+        set_attribute('table', table)
+        set_attribute('words', frozenset(table.words))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LanguageData est immuable")
+
+    @cached_property
+    def solver(self):
+        """Solveur hybride partagé (filtrage par masques de bits)."""
+        from ..csp import HybridSolver
+        return HybridSolver(self.table)
+
+    @property
+    def index(self):
+        """Index de candidats (masques de bits) du solveur."""
+        return self.solver.word_filter.index
+
+    @cached_property
+    def pattern_matrix(self):
+        """Matrice de patterns du dictionnaire (partagée avec le registre des matrices)."""
+        from ..utils.pattern_matrix import PatternMatrix
+        return PatternMatrix.for_language(self.language, self.word_length)
+
+    @cached_property
+    def validator(self):
+        """Validateur de mots appuyé sur l'ensemble des mots (sans copie)."""
+        from ..game.validator import WordValidator
+        return WordValidator(self)
+
+    def random_word(self, rng: Optional[random.Random] = None) -> str:
+        """
+        Tire un mot au hasard (O(1), sans copie du dictionnaire).
+
+        Args:
+            rng: Générateur aléatoire (optionnel)
+
+        Returns:
+            Un mot du dictionnaire
+        """
+        words = self.table.words
+        return words[(rng or random).randrange(len(words))]
+
+    def memory_estimate(self) -> Dict[str, int]:
+        """Estimation mémoire des structures de la langue (voir estimate_memory)."""
+        return estimate_memory(len(self.table), self.word_length, len(self.table.alphabet))
+
+    def warm_up(self, pattern_matrix: bool = True) -> "LanguageData":
+        """
+        Construit les structures dérivées immédiatement.
+
+        Args:
+            pattern_matrix: Charger aussi la matrice de patterns (la plus coûteuse)
+
+        Returns:
+            self
+        """
+        self.index
+        self.validator
+        if pattern_matrix:
+            self.pattern_matrix.matrix
+        return self
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.table
+
+    def __repr__(self) -> str:
+        return f"LanguageData(language='{self.language}', length={self.word_length}, words={len(self.table)})"
+
+
+class LanguageRegistry:
+    """
+    Registre des langues chargées dans le processus.
+
+    Usage :
+        data = LanguageRegistry.get('en')          # mots de 5 lettres
+        data.solver, data.pattern_matrix, data.random_word()
+        LanguageRegistry.register('en', 'mots6.txt', 6)  # liste fournie par l'appelant
+        LanguageRegistry.get('en', 6)              # mots de 6 lettres
+        LanguageRegistry.memory_estimate('fr', 7)  # avant de précharger
+        LanguageRegistry.warm_up(['en', 'fr'])     # au démarrage d'un serveur
+    """
+
+    _languages: Dict[Tuple[str, int], LanguageData] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, language: str, word_length: int = WORD_LENGTH) -> LanguageData:
+        """
+        Retourne les données d'une langue (chargées une seule fois par longueur).
+
+        Args:
+            language: 'en' ou 'fr'
+            word_length: Longueur des mots (4 à 8)
+
+        Returns:
+            LanguageData partagé
+
+        Raises:
+            FileNotFoundError: Si aucune liste n'existe pour cette longueur
+                               (ni fichier, ni liste enregistrée par register())
+        """
+        key = (language.lower(), word_length)
+        data = cls._languages.get(key)
+        if data is None:
+            with cls._lock:
+                data = cls._languages.get(key)
+                if data is None:
+                    from ..utils import metrics
+                    with metrics.timer('dictionary_load'):
+                        table = DictionaryLoader.load_table(key[0], word_length=word_length)
+                    data = LanguageData(key[0], table)
+                    cls._languages[key] = data
+        return data
+
+    @classmethod
+    def register(
+        cls,
+        language: str,
+        words: Union[str, Path, Iterable[str]],
+        word_length: int = WORD_LENGTH
+    ) -> LanguageData:
+        """
+        Enregistre la liste de mots d'une langue pour une longueur donnée.
+
+        Remplace la liste chargée (ou à charger) depuis les fichiers fournis,
+        par exemple pour les longueurs autres que 5 lettres.
+
+        Args:
+            language: Code de la langue
+            words: Mots, ou chemin d'un fichier (un mot par ligne)
+            word_length: Longueur des mots retenus (les autres sont ignorés)
+
+        Returns:
+            LanguageData enregistré
+
+        Raises:
+            ValueError: Si aucun mot de cette longueur n'est fourni
+        """
+        check_word_length(word_length)
+        if isinstance(words, (str, Path)):
+            words = DictionaryLoader.load_from_file(str(words), word_length)
+        else:
+            words = {word.upper() for word in words if len(word) == word_length and word.isalpha()}
+        if not words:
+            raise ValueError(f"Aucun mot de {word_length} lettres pour '{language}'")
+
+        data = LanguageData(language.lower(), WordTable(words, word_length))
+        with cls._lock:
+            cls._languages[(data.language, word_length)] = data
+        return data
+
+    @classmethod
+    def memory_estimate(cls, language: str, word_length: int = WORD_LENGTH) -> Dict[str, int]:
+        """
+        Estime la mémoire d'une langue pour une longueur, sans construire ses structures.
+
+        Seule la liste de mots est lue (ou réutilisée si déjà chargée).
+
+        Args:
+            language: 'en' ou 'fr'
+            word_length: Longueur des mots
+
+        Returns:
+            Octets par structure (voir estimate_memory)
+        """
+        data = cls._languages.get((language.lower(), word_length))
+        if data is not None:
+            return data.memory_estimate()
+        words = DictionaryLoader.load_language(language, word_length=word_length)
+        return estimate_memory(len(words), word_length, len(set(''.join(words))))
+
+    @classmethod
+    def warm_up(
+        cls,
+        languages: Iterable[str] = ('en', 'fr'),
+        pattern_matrix: bool = True,
+        word_lengths: Iterable[int] = (WORD_LENGTH,)
+    ):
+        """
+        Charge les langues et leurs structures dérivées (à appeler au démarrage).
+
+        Args:
+            languages: Langues à charger
+            pattern_matrix: Charger aussi les matrices de patterns
+            word_lengths: Longueurs de mots à charger pour chaque langue
+        """
+        word_lengths = tuple(word_lengths)
+        for language in languages:
+            for word_length in word_lengths:
+                cls.get(language, word_length).warm_up(pattern_matrix=pattern_matrix)
+
+    @classmethod
+    def loaded(cls) -> FrozenSet[Tuple[str, int]]:
+        """Couples (langue, longueur) déjà chargés."""
+        return frozenset(cls._languages)
+
+    @classmethod
+    def clear(cls):
+        """Oublie les langues chargées (tests)."""
+        with cls._lock:
+            cls._languages.clear()
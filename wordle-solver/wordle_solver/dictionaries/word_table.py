@@ -0,0 +1,258 @@
+"""
+Module de représentation compacte d'un dictionnaire.
+
+Un WordTable est un dictionnaire immuable : les mots y sont normalisés une
+seule fois (majuscules, dédoublonnés, triés) et stockés sous forme d'un
+tableau (N, L) d'indices de lettres, L étant la longueur (commune) des mots
+du dictionnaire, de 4 à 8 lettres. L'identifiant d'un mot est son rang
+alphabétique, partagé par la matrice de patterns et l'index de candidats.
+Les ensembles de candidats se manipulent alors comme tableaux
+d'identifiants ou masques de bits, et les chaînes ne sont matérialisées
+qu'aux frontières de l'API.
+"""
+
+import hashlib
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+WORD_LENGTH = 5
+MIN_WORD_LENGTH = 4
+MAX_WORD_LENGTH = 8
+
+
+def check_word_length(word_length: int) -> int:
+    """
+    Vérifie qu'une longueur de mot est prise en charge.
+
+    Args:
+        word_length: Longueur des mots
+
+    Returns:
+        La longueur, inchangée
+
+    Raises:
+        ValueError: Si la longueur est hors de [MIN_WORD_LENGTH, MAX_WORD_LENGTH]
+    """
+    if not MIN_WORD_LENGTH <= word_length <= MAX_WORD_LENGTH:
+        raise ValueError(
+            f"Longueur de mot non supportée : {word_length} "
+            f"(de {MIN_WORD_LENGTH} à {MAX_WORD_LENGTH} lettres)"
+        )
+    return word_length
+
+
+def words_digest(words: Sequence[str]) -> str:
+    """
+    Calcule l'empreinte du contenu d'une liste de mots triée.
+
+    Args:
+        words: Mots triés (majuscules)
+
+    Returns:
+        Empreinte hexadécimale (16 caractères)
+    """
+    return hashlib.sha256('\n'.join(words).encode('utf-8')).hexdigest()[:16]
+
+
+def encode_letters(words: Sequence[str], word_length: int = WORD_LENGTH) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """
+    Convertit les mots en tableau (N, L) d'indices de lettres.
+
+    Les lettres sont numérotées selon l'alphabet trié du dictionnaire
+    (ce qui gère aussi les lettres comme 'Æ' ou 'Œ' du français).
+
+    Args:
+        words: Mots de même longueur
+        word_length: Longueur des mots
+
+    Returns:
+        Tuple (tableau uint8 des indices, alphabet)
+    """
+    if not words:
+        return np.zeros((0, word_length), dtype=np.uint8), ()
+    raw = np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32)
+    code_points, letters = np.unique(raw, return_inverse=True)
+    alphabet = tuple(chr(int(point)) for point in code_points)
+    return letters.reshape(len(words), word_length).astype(np.uint8), alphabet
+
+
+def letter_counts(letters: np.ndarray, alphabet_size: int) -> np.ndarray:
+    """Compte les occurrences de chaque lettre dans chaque mot (N, A)."""
+    counts = np.zeros((len(letters), alphabet_size), dtype=np.uint8)
+    rows = np.arange(len(letters))
+    for pos in range(letters.shape[1]):
+        np.add.at(counts, (rows, letters[:, pos]), 1)
+    return counts
+
+
+class WordTable:
+    """
+    Dictionnaire immuable indexé par identifiants entiers.
+
+    Attributs principaux :
+    - words : mots triés en majuscules (identifiant = rang alphabétique)
+    - index : {mot: identifiant}
+    - word_length : longueur des mots (L)
+    - alphabet : lettres du dictionnaire, triées (indice = code de lettre)
+    - letters : tableau (N, L) uint8 des codes de lettres (lecture seule)
+    - counts : tableau (N, A) uint8 des occurrences de chaque lettre (lecture seule)
+    - presence : tableau (N, A) booléen de présence de chaque lettre (lecture seule)
+    - digest : empreinte du contenu
+    """
+
+    def __init__(self, words: Iterable[str], word_length: Optional[int] = None):
+        """
+        Construit la table (seule normalisation des mots).
+
+        Args:
+            words: Mots du dictionnaire (même longueur, casse quelconque)
+            word_length: Longueur des mots (défaut : celle des mots, ou 5 si vide)
+
+        Raises:
+            ValueError: Si les mots n'ont pas tous cette longueur
+        """
+        words = tuple(sorted({word.upper() for word in words}))
+        if word_length is None:
+            word_length = len(words[0]) if words else WORD_LENGTH
+        check_word_length(word_length)
+        if any(len(word) != word_length for word in words):
+            raise ValueError(f"Les mots du dictionnaire doivent contenir exactement {word_length} lettres")
+        letters, alphabet = encode_letters(words, word_length)
+        counts = letter_counts(letters, len(alphabet))
+        presence = counts > 0
+        letters.setflags(write=False)
+        counts.setflags(write=False)
+        presence.setflags(write=False)
+
+        set_attribute = super().__setattr__
+        set_attribute('words', words)
+        set_attribute('index', {word: i for i, word in enumerate(words)})
+        set_attribute('word_length', word_length)
+        set_attribute('alphabet', alphabet)
+        set_attribute('letter_index', {letter: i for i, letter in enumerate(alphabet)})
+        set_attribute('letters', letters)
+        set_attribute('counts', counts)
+        set_attribute('presence', presence)
+        set_attribute('digest', words_digest(words))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("WordTable est immuable")
+
+    @classmethod
+    def of(cls, words: Union["WordTable", Iterable[str]], word_length: Optional[int] = None) -> "WordTable":
+        """
+        Retourne une table pour ces mots (la même si c'est déjà une table).
+
+        Args:
+            words: WordTable ou mots
+            word_length: Longueur des mots (défaut : celle des mots)
+
+        Returns:
+            WordTable correspondant
+        """
+        if isinstance(words, WordTable):
+            return words
+        return cls(words, word_length)
+
+    def id_of(self, word: str) -> Optional[int]:
+        """Retourne l'identifiant d'un mot (None s'il est inconnu)."""
+        return self.index.get(word)
+
+    def ids(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Convertit des mots en identifiants.
+
+        Args:
+            words: Mots (majuscules) présents dans la table
+
+        Returns:
+            Tableau d'identifiants (int64)
+
+        Raises:
+            KeyError: Si un mot est inconnu
+        """
+        index = self.index
+        return np.fromiter((index[word] for word in words), dtype=np.int64)
+
+    def words_of(self, ids: Iterable[int]) -> List[str]:
+        """
+        Matérialise les mots d'un ensemble d'identifiants.
+
+        Args:
+            ids: Identifiants
+
+        Returns:
+            Liste de mots, dans l'ordre des identifiants
+        """
+        words = self.words
+        return [words[i] for i in ids]
+
+    def presence_counts(self, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compte, pour chaque lettre, les mots qui la contiennent.
+
+        Args:
+            ids: Identifiants des mots (défaut : tout le dictionnaire)
+
+        Returns:
+            Tableau (A,) indexé par code de lettre
+        """
+        presence = self.presence if ids is None else self.presence[ids]
+        return np.count_nonzero(presence, axis=0)
+
+    def position_counts(self, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compte les occurrences de chaque lettre à chaque position.
+
+        Un seul np.bincount sur les codes (position, lettre) = position * A + lettre.
+
+        Args:
+            ids: Identifiants des mots (défaut : tout le dictionnaire)
+
+        Returns:
+            Tableau (L, A) indexé par position puis code de lettre
+        """
+        letters = self.letters if ids is None else self.letters[ids]
+        n_letters = len(self.alphabet)
+        codes = letters + np.arange(self.word_length) * n_letters
+        counts = np.bincount(codes.ravel(), minlength=self.word_length * n_letters)
+        return counts.reshape(self.word_length, n_letters)
+
+    @property
+    def nbytes(self) -> int:
+        """Taille mémoire des tableaux de la table."""
+        return self.letters.nbytes + self.counts.nbytes + self.presence.nbytes
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.index
+
+    def __getitem__(self, word_id: int) -> str:
+        return self.words[word_id]
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, WordTable)
+            and other.digest == self.digest
+            and other.word_length == self.word_length
+            and other.words == self.words
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __reduce__(self):
+        return (WordTable, (self.words, self.word_length))
+
+    def __repr__(self) -> str:
+        return (
+            f"WordTable(words={len(self.words)}, length={self.word_length}, "
+            f"alphabet={len(self.alphabet)}, digest='{self.digest}')"
+        )
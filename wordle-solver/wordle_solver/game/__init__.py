@@ -1,13 +1,18 @@
 """Module de simulation du jeu Wordle."""
 
-from .feedback import Feedback, FeedbackResult, generate_feedback
+from .feedback import Feedback, FeedbackResult, generate_feedback, feedback_code, feedback_codes, hard_mode_violation
 from .wordle_game import WordleGame
+from .multi_board import MultiBoardGame
 from .validator import WordValidator
 
 __all__ = [
     'Feedback',
     'FeedbackResult',
     'generate_feedback',
+    'feedback_code',
+    'feedback_codes',
+    'hard_mode_violation',
     'WordleGame',
+    'MultiBoardGame',
     'WordValidator',
 ]
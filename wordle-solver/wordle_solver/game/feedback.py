@@ -8,7 +8,32 @@ Définit les types de retour possibles pour chaque lettre :
 """
 
 from enum import Enum
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from ..dictionaries.word_table import MAX_WORD_LENGTH, WORD_LENGTH, check_word_length
+
+if TYPE_CHECKING:
+    import numpy as np
+    from ..dictionaries.word_table import WordTable
+
+
+# Un pattern est encodé en base 3 (ABSENT=0, PRESENT=1, CORRECT=2), la
+# position 0 étant le chiffre de poids faible : 3^L codes pour des mots de
+# L lettres, soit 243 codes de 0 à 242 pour la longueur par défaut (5).
+N_PATTERNS = 3 ** WORD_LENGTH
+ALL_CORRECT = N_PATTERNS - 1
+
+_POWERS = tuple(3 ** i for i in range(MAX_WORD_LENGTH))
+
+
+def n_patterns(word_length: int = WORD_LENGTH) -> int:
+    """Nombre de patterns possibles pour des mots de cette longueur (3^L)."""
+    return 3 ** word_length
+
+
+def all_correct_code(word_length: int = WORD_LENGTH) -> int:
+    """Code du pattern entièrement vert pour des mots de cette longueur."""
+    return 3 ** word_length - 1
 
 
 class Feedback(Enum):
@@ -61,28 +86,142 @@ class Feedback(Enum):
         return mapping[self]
 
 
+_DIGITS = {Feedback.ABSENT: 0, Feedback.PRESENT: 1, Feedback.CORRECT: 2}
+_FROM_DIGIT = (Feedback.ABSENT, Feedback.PRESENT, Feedback.CORRECT)
+_LETTERS = {'B': 0, 'Y': 1, 'G': 2}
+
+
+def encode_feedbacks(feedbacks: Sequence[Feedback]) -> int:
+    """
+    Encode une liste de Feedback en code entier (0 à 3^L - 1).
+    
+    Args:
+        feedbacks: Liste de Feedback (un par lettre)
+        
+    Returns:
+        Code base 3 du pattern
+    """
+    return sum(_DIGITS[fb] * _POWERS[i] for i, fb in enumerate(feedbacks))
+
+
+def decode_feedbacks(code: int, word_length: int = WORD_LENGTH) -> List[Feedback]:
+    """
+    Décode un code entier en liste de Feedback.
+    
+    Args:
+        code: Code base 3 (0 à 3^L - 1)
+        word_length: Longueur des mots (L)
+        
+    Returns:
+        Liste de Feedback
+    """
+    feedbacks = []
+    for _ in range(word_length):
+        feedbacks.append(_FROM_DIGIT[code % 3])
+        code //= 3
+    return feedbacks
+
+
+def pattern_to_code(pattern: str) -> int:
+    """
+    Convertit un pattern texte ("GYBBG") en code entier.
+    
+    Args:
+        pattern: Pattern au format de FeedbackResult.to_pattern()
+        
+    Returns:
+        Code base 3 du pattern
+    """
+    return sum(_LETTERS[c] * _POWERS[i] for i, c in enumerate(pattern.upper()))
+
+
+def code_to_pattern(code: int, word_length: int = WORD_LENGTH) -> str:
+    """
+    Convertit un code entier en pattern texte ("GYBBG").
+    
+    Args:
+        code: Code base 3 (0 à 3^L - 1)
+        word_length: Longueur des mots (L)
+        
+    Returns:
+        Pattern au format de FeedbackResult.to_pattern()
+    """
+    chars = []
+    for _ in range(word_length):
+        chars.append('BYG'[code % 3])
+        code //= 3
+    return ''.join(chars)
+
+
 class FeedbackResult:
-    """Représente le résultat complet d'une tentative."""
+    """
+    Représente le résultat complet d'une tentative.
+    
+    Le résultat peut être créé à partir de la liste des Feedback ou,
+    paresseusement, à partir du code entier du pattern (from_code) : la
+    liste n'est alors construite qu'au premier accès à `feedbacks`.
+    """
     
     def __init__(self, guess: str, feedbacks: List[Feedback]):
         """
         Initialise un résultat de feedback.
         
         Args:
-            guess: Le mot deviné
-            feedbacks: Liste de 5 Feedback (un par lettre)
+            guess: Le mot deviné (4 à 8 lettres)
+            feedbacks: Liste de Feedback (un par lettre)
         """
-        if len(guess) != 5:
-            raise ValueError("Le mot doit contenir exactement 5 lettres")
-        if len(feedbacks) != 5:
-            raise ValueError("Il doit y avoir exactement 5 feedbacks")
+        check_word_length(len(guess))
+        if len(feedbacks) != len(guess):
+            raise ValueError(f"Il doit y avoir exactement {len(guess)} feedbacks")
         
         self.guess = guess.upper()
-        self.feedbacks = feedbacks
+        self._feedbacks: Optional[List[Feedback]] = feedbacks
+        self._code: Optional[int] = None
+    
+    @classmethod
+    def from_code(cls, guess: str, code: int) -> "FeedbackResult":
+        """
+        Crée un résultat à partir du code de pattern (sans construire les Feedback).
+        
+        Args:
+            guess: Le mot deviné (4 à 8 lettres en majuscules)
+            code: Code base 3 du pattern (0 à 3^L - 1)
+            
+        Returns:
+            FeedbackResult paresseux
+        """
+        check_word_length(len(guess))
+        if not 0 <= code < n_patterns(len(guess)):
+            raise ValueError(f"Code de pattern invalide : {code}")
+        
+        result = cls.__new__(cls)
+        result.guess = guess
+        result._feedbacks = None
+        result._code = int(code)
+        return result
+    
+    @property
+    def feedbacks(self) -> List[Feedback]:
+        """Liste des Feedback, un par lettre (décodée au premier accès si besoin)."""
+        if self._feedbacks is None:
+            self._feedbacks = decode_feedbacks(self._code, len(self.guess))
+        return self._feedbacks
+    
+    @feedbacks.setter
+    def feedbacks(self, feedbacks: List[Feedback]):
+        self._feedbacks = feedbacks
+        self._code = None
+    
+    @property
+    def code(self) -> int:
+        """Code base 3 du pattern (0 à 3^L - 1)."""
+        if self._code is None:
+            self._code = encode_feedbacks(self._feedbacks)
+        return self._code
     
     def is_correct(self) -> bool:
         """Vérifie si toutes les lettres sont correctes (mot trouvé)."""
-        return all(fb == Feedback.CORRECT for fb in self.feedbacks)
+        return self.code == all_correct_code(len(self.guess))
     
     def get_correct_positions(self) -> List[Tuple[int, str]]:
         """
@@ -143,12 +282,7 @@ class FeedbackResult:
         Returns:
             String comme "GYBBG" (G=green, Y=yellow, B=black)
         """
-        mapping = {
-            Feedback.CORRECT: 'G',
-            Feedback.PRESENT: 'Y',
-            Feedback.ABSENT: 'B',
-        }
-        return ''.join(mapping[fb] for fb in self.feedbacks)
+        return code_to_pattern(self.code, len(self.guess))
     
     def __str__(self) -> str:
         return self.to_string()
@@ -157,6 +291,104 @@ class FeedbackResult:
         return f"FeedbackResult(guess='{self.guess}', pattern='{self.to_pattern()}')"
 
 
+def feedback_code(guess: str, target: str) -> int:
+    """
+    Calcule directement le code du pattern (0 à 3^L - 1) d'une tentative.
+    
+    Chemin rapide de generate_feedback : pas de validation, pas de
+    normalisation, pas de liste de Feedback. Les mots doivent être déjà en
+    majuscules et de même longueur. Le résultat est identique à
+    generate_feedback(guess, target).code, lettres dupliquées comprises.
+    
+    Args:
+        guess: Le mot deviné (majuscules)
+        target: Le mot cible (majuscules, même longueur)
+        
+    Returns:
+        Code base 3 du pattern
+    """
+    code = 0
+    # Occurrences des lettres de la cible non consommées par les verts
+    remaining = {}
+    word_length = len(guess)
+    
+    for i in range(word_length):
+        if guess[i] == target[i]:
+            code += 2 * _POWERS[i]
+        else:
+            remaining[target[i]] = remaining.get(target[i], 0) + 1
+    
+    if not remaining:
+        return code
+    
+    # Jaunes : de gauche à droite, dans la limite des occurrences restantes
+    for i in range(word_length):
+        letter = guess[i]
+        if letter != target[i]:
+            count = remaining.get(letter)
+            if count:
+                code += _POWERS[i]
+                remaining[letter] = count - 1
+    
+    return code
+
+
+def feedback_codes(guess_ids: "np.ndarray", target_ids: "np.ndarray", table: "WordTable") -> "np.ndarray":
+    """
+    Calcule les codes de pattern de toutes les paires (tentative, cible) avec NumPy.
+    
+    Args:
+        guess_ids: Identifiants des tentatives dans la table (G,)
+        target_ids: Identifiants des cibles dans la table (T,)
+        table: WordTable des mots
+        
+    Returns:
+        Tableau (G, T) de codes (uint8, uint16 au-delà de 5 lettres), identiques à feedback_code
+    """
+    import numpy as np
+    from ..utils.pattern_matrix import compute_patterns
+    
+    guess_ids = np.asarray(guess_ids, dtype=np.int64)
+    target_ids = np.asarray(target_ids, dtype=np.int64)
+    return compute_patterns(table.letters[guess_ids], table.letters[target_ids], table.counts[target_ids])
+
+
+def hard_mode_violation(guess: str, feedbacks: Sequence[FeedbackResult]) -> Optional[str]:
+    """
+    Vérifie qu'une tentative respecte les indices déjà révélés (mode difficile).
+    
+    En mode difficile, chaque lettre verte doit rester à sa place et chaque
+    lettre révélée (verte ou jaune) doit être réutilisée, au moins autant de
+    fois qu'elle a été révélée dans une même tentative. Les lettres grises
+    peuvent être rejouées.
+    
+    Args:
+        guess: La tentative à vérifier
+        feedbacks: Feedbacks des tentatives précédentes
+    
+    Returns:
+        Message d'erreur, ou None si la tentative est autorisée
+    """
+    guess = guess.upper()
+    
+    for feedback in feedbacks:
+        for i, (letter, fb) in enumerate(zip(feedback.guess, feedback.feedbacks)):
+            if fb == Feedback.CORRECT and guess[i] != letter:
+                return f"La lettre {i + 1} doit être {letter}"
+    
+    for feedback in feedbacks:
+        revealed = {}
+        for letter, fb in zip(feedback.guess, feedback.feedbacks):
+            if fb != Feedback.ABSENT:
+                revealed[letter] = revealed.get(letter, 0) + 1
+        for letter, count in revealed.items():
+            if guess.count(letter) < count:
+                times = f" {count} fois" if count > 1 else ""
+                return f"La tentative doit contenir {letter}{times}"
+    
+    return None
+
+
 def generate_feedback(guess: str, target: str) -> FeedbackResult:
     """
     Génère le feedback pour une tentative donnée.
@@ -165,36 +397,23 @@ def generate_feedback(guess: str, target: str) -> FeedbackResult:
     les cas complexes (lettres dupliquées, etc.).
     
     Args:
-        guess: Le mot deviné (5 lettres)
-        target: Le mot cible (5 lettres)
+        guess: Le mot deviné (4 à 8 lettres)
+        target: Le mot cible (même longueur)
         
     Returns:
         FeedbackResult contenant les feedbacks pour chaque position
         
     Example:
         >>> generate_feedback("AROSE", "ROBOT")
-        FeedbackResult(guess='AROSE', pattern='BYBBB')
+        FeedbackResult(guess='AROSE', pattern='BYYBB')
     """
     guess = guess.upper()
     target = target.upper()
     
-    if len(guess) != 5 or len(target) != 5:
-        raise ValueError("Les mots doivent contenir exactement 5 lettres")
-    
-    feedbacks = [Feedback.ABSENT] * 5
-    target_letters = list(target)
-    
-    # Premier passage : marquer les lettres correctes (vertes)
-    for i in range(5):
-        if guess[i] == target[i]:
-            feedbacks[i] = Feedback.CORRECT
-            target_letters[i] = None  # Marquer comme utilisée
-    
-    # Deuxième passage : marquer les lettres présentes (jaunes)
-    for i in range(5):
-        if feedbacks[i] == Feedback.ABSENT and guess[i] in target_letters:
-            feedbacks[i] = Feedback.PRESENT
-            # Retirer la première occurrence de cette lettre
-            target_letters[target_letters.index(guess[i])] = None
+    if len(guess) != len(target):
+        raise ValueError("Les mots doivent contenir le même nombre de lettres")
+    check_word_length(len(guess))
     
-    return FeedbackResult(guess, feedbacks)
+    # Premier passage : les lettres correctes (vertes) ; deuxième passage :
+    # les lettres présentes (jaunes), voir feedback_code
+    return FeedbackResult.from_code(guess, feedback_code(guess, target))
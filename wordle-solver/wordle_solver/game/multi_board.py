@@ -0,0 +1,143 @@
+"""
+Module de simulation des variantes multi-grilles (Quordle, Octordle).
+
+Chaque tentative est jouée simultanément sur toutes les grilles non
+résolues ; la partie est gagnée quand toutes les grilles sont résolues.
+Le nombre de tentatives autorisées est de N + 5 pour N grilles
+(9 pour Quordle, 13 pour Octordle).
+"""
+
+from typing import List, Optional, Sequence
+from .feedback import FeedbackResult, generate_feedback
+from .validator import WordValidator
+
+
+class MultiBoardGame:
+    """Simulateur d'une partie à plusieurs grilles."""
+    
+    # Tentatives supplémentaires accordées au-delà du nombre de grilles
+    EXTRA_ATTEMPTS = 5
+    
+    def __init__(
+        self,
+        target_words: Sequence[str],
+        validator: Optional[WordValidator] = None,
+        max_attempts: Optional[int] = None
+    ):
+        """
+        Initialise une nouvelle partie multi-grilles.
+        
+        Args:
+            target_words: Mot à deviner de chaque grille (même longueur, 4 à 8 lettres)
+            validator: Validateur optionnel pour vérifier les tentatives
+            max_attempts: Nombre de tentatives (défaut : grilles + 5)
+        """
+        if not target_words:
+            raise ValueError("Il faut au moins une grille")
+        self.validator = validator or WordValidator(word_length=len(target_words[0]))
+        if any(len(word) != self.validator.word_length for word in target_words):
+            raise ValueError(f"Les mots cibles doivent contenir exactement {self.validator.word_length} lettres")
+        
+        self.target_words = [word.upper() for word in target_words]
+        self.max_attempts = max_attempts or len(target_words) + self.EXTRA_ATTEMPTS
+        self.guesses: List[str] = []
+        # Feedbacks de chaque grille (arrêtés à sa résolution)
+        self.boards: List[List[FeedbackResult]] = [[] for _ in target_words]
+        # Numéro de la tentative qui a résolu chaque grille (None : non résolue)
+        self.solved_at: List[Optional[int]] = [None] * len(target_words)
+    
+    @property
+    def n_boards(self) -> int:
+        """Nombre de grilles."""
+        return len(self.target_words)
+    
+    @property
+    def is_won(self) -> bool:
+        """Toutes les grilles sont résolues."""
+        return all(attempt is not None for attempt in self.solved_at)
+    
+    @property
+    def is_over(self) -> bool:
+        """Partie gagnée ou tentatives épuisées."""
+        return self.is_won or len(self.guesses) >= self.max_attempts
+    
+    def unsolved_boards(self) -> List[int]:
+        """Indices des grilles non résolues."""
+        return [i for i, attempt in enumerate(self.solved_at) if attempt is None]
+    
+    def get_remaining_attempts(self) -> int:
+        """Retourne le nombre de tentatives restantes."""
+        return self.max_attempts - len(self.guesses)
+    
+    def get_attempt_number(self) -> int:
+        """Retourne le numéro de la tentative actuelle."""
+        return len(self.guesses) + 1
+    
+    def make_guess(self, guess: str) -> List[Optional[FeedbackResult]]:
+        """
+        Joue une tentative sur toutes les grilles non résolues.
+        
+        Args:
+            guess: Le mot deviné (longueur des mots cibles)
+        
+        Returns:
+            Feedback de chaque grille (None pour les grilles déjà résolues)
+        
+        Raises:
+            ValueError: Si la partie est terminée ou le mot invalide
+        """
+        if self.is_over:
+            raise ValueError("La partie est terminée")
+        
+        is_valid, error = self.validator.validate(guess)
+        if not is_valid:
+            raise ValueError(f"Mot invalide : {error}")
+        
+        guess = guess.upper()
+        self.guesses.append(guess)
+        
+        feedbacks: List[Optional[FeedbackResult]] = []
+        for i, target in enumerate(self.target_words):
+            if self.solved_at[i] is not None:
+                feedbacks.append(None)
+                continue
+            
+            feedback = generate_feedback(guess, target)
+            self.boards[i].append(feedback)
+            if feedback.is_correct():
+                self.solved_at[i] = len(self.guesses)
+            feedbacks.append(feedback)
+        
+        return feedbacks
+    
+    def get_game_state(self) -> dict:
+        """
+        Retourne l'état complet de la partie.
+        
+        Returns:
+            Dictionnaire avec l'état de la partie
+        """
+        return {
+            'target_words': self.target_words,
+            'attempts': len(self.guesses),
+            'max_attempts': self.max_attempts,
+            'remaining_attempts': self.get_remaining_attempts(),
+            'is_won': self.is_won,
+            'is_over': self.is_over,
+            'solved_at': self.solved_at,
+            'boards': [
+                [{'guess': fb.guess, 'pattern': fb.to_pattern()} for fb in board]
+                for board in self.boards
+            ]
+        }
+    
+    def __str__(self) -> str:
+        status = "Gagné" if self.is_won else ("Perdu" if self.is_over else "En cours")
+        solved = self.n_boards - len(self.unsolved_boards())
+        return (
+            f"Multi-grilles [{status}] - {solved}/{self.n_boards} grilles - "
+            f"Tentative {self.get_attempt_number()}/{self.max_attempts}"
+        )
+    
+    def __repr__(self) -> str:
+        return f"MultiBoardGame(targets={self.target_words}, attempts={len(self.guesses)}, won={self.is_won})"
@@ -2,32 +2,50 @@
 Module de validation des mots Wordle.
 
 Vérifie que les mots respectent les règles :
-- 5 lettres exactement
+- Longueur du dictionnaire exactement (5 lettres par défaut)
 - Uniquement des lettres (pas de chiffres ou caractères spéciaux)
 - Présent dans le dictionnaire autorisé
 """
 
 import re
-from typing import Set, Optional
+from typing import Set, Optional, Union
+
+from ..dictionaries.registry import LanguageData
+from ..dictionaries.word_table import WORD_LENGTH, WordTable, check_word_length
 
 
 class WordValidator:
     """Validateur de mots pour Wordle."""
     
-    def __init__(self, valid_words: Optional[Set[str]] = None):
+    def __init__(
+        self,
+        valid_words: Optional[Union[LanguageData, WordTable, Set[str]]] = None,
+        word_length: Optional[int] = None
+    ):
         """
         Initialise le validateur.
         
         Args:
-            valid_words: Ensemble des mots valides (optionnel)
+            valid_words: LanguageData, WordTable ou ensemble des mots valides (optionnel)
                         Si None, seules les règles de base sont vérifiées
+            word_length: Longueur des mots (défaut : celle de la table, sinon 5)
         """
-        self.valid_words = {word.upper() for word in valid_words} if valid_words else None
-        self.pattern = re.compile(r'^[A-Za-z]{5}$')
+        if isinstance(valid_words, LanguageData):
+            # Ensemble partagé du registre des langues (pas de copie)
+            self.valid_words = valid_words.words
+            word_length = word_length or valid_words.table.word_length
+        elif isinstance(valid_words, WordTable):
+            # Mots déjà normalisés par la table
+            self.valid_words = set(valid_words.words)
+            word_length = word_length or valid_words.word_length
+        else:
+            self.valid_words = {word.upper() for word in valid_words} if valid_words else None
+        self.word_length = check_word_length(word_length or WORD_LENGTH)
+        self.pattern = re.compile(rf'^[A-Za-z]{{{self.word_length}}}$')
     
     def is_valid_format(self, word: str) -> bool:
         """
-        Vérifie que le mot a le bon format (5 lettres).
+        Vérifie que le mot a le bon format (word_length lettres).
         
         Args:
             word: Le mot à vérifier
@@ -77,8 +95,8 @@ class WordValidator:
         if not word:
             return False, "Le mot ne peut pas être vide"
         
-        if len(word) != 5:
-            return False, f"Le mot doit contenir exactement 5 lettres (reçu: {len(word)})"
+        if len(word) != self.word_length:
+            return False, f"Le mot doit contenir exactement {self.word_length} lettres (reçu: {len(word)})"
         
         if not self.is_valid_format(word):
             return False, "Le mot doit contenir uniquement des lettres"
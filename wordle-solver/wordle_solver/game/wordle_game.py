@@ -6,10 +6,11 @@ Permet de simuler une partie complète de Wordle avec :
 - Jusqu'à 6 tentatives
 - Génération automatique des feedbacks
 - Suivi de l'historique
+- Mode difficile (les indices révélés doivent être réutilisés)
 """
 
 from typing import List, Optional
-from .feedback import FeedbackResult, generate_feedback
+from .feedback import FeedbackResult, generate_feedback, hard_mode_violation
 from .validator import WordValidator
 
 
@@ -18,23 +19,56 @@ class WordleGame:
     
     MAX_ATTEMPTS = 6
     
-    def __init__(self, target_word: str, validator: Optional[WordValidator] = None):
+    def __init__(self, target_word: str, validator: Optional[WordValidator] = None, hard_mode: bool = False):
         """
         Initialise une nouvelle partie de Wordle.
         
         Args:
-            target_word: Le mot à deviner (5 lettres)
+            target_word: Le mot à deviner (4 à 8 lettres)
             validator: Validateur optionnel pour vérifier les tentatives
+            hard_mode: Mode difficile (tentatives cohérentes avec les indices)
         """
-        if len(target_word) != 5:
-            raise ValueError("Le mot cible doit contenir exactement 5 lettres")
+        self.validator = validator or WordValidator(word_length=len(target_word))
+        if len(target_word) != self.validator.word_length:
+            raise ValueError(f"Le mot cible doit contenir exactement {self.validator.word_length} lettres")
         
         self.target_word = target_word.upper()
-        self.validator = validator or WordValidator()
+        self.hard_mode = hard_mode
         self.attempts: List[FeedbackResult] = []
         self.is_won = False
         self.is_over = False
     
+    @classmethod
+    def from_history(
+        cls,
+        target_word: str,
+        feedbacks: List[FeedbackResult],
+        validator: Optional[WordValidator] = None,
+        hard_mode: bool = False
+    ) -> "WordleGame":
+        """
+        Restaure une partie à partir de ses feedbacks (sans les revalider).
+        
+        Args:
+            target_word: Le mot à deviner
+            feedbacks: Feedbacks des tentatives déjà jouées, dans l'ordre
+            validator: Validateur optionnel pour les tentatives suivantes
+            hard_mode: Mode difficile pour les tentatives suivantes
+            
+        Returns:
+            WordleGame dans l'état correspondant
+        """
+        game = cls(target_word, validator, hard_mode)
+        for feedback in feedbacks:
+            game.attempts.append(feedback)
+            if feedback.is_correct():
+                game.is_won = True
+                game.is_over = True
+                break
+            if len(game.attempts) >= cls.MAX_ATTEMPTS:
+                game.is_over = True
+        return game
+    
     def get_remaining_attempts(self) -> int:
         """Retourne le nombre de tentatives restantes."""
         return self.MAX_ATTEMPTS - len(self.attempts)
@@ -48,13 +82,14 @@ class WordleGame:
         Fait une tentative de deviner le mot.
         
         Args:
-            guess: Le mot deviné (5 lettres)
+            guess: Le mot deviné (longueur du mot cible)
             
         Returns:
             FeedbackResult avec les retours pour chaque lettre
             
         Raises:
-            ValueError: Si la partie est terminée ou le mot invalide
+            ValueError: Si la partie est terminée, le mot invalide ou, en mode
+                        difficile, incompatible avec les indices révélés
         """
         if self.is_over:
             raise ValueError("La partie est terminée")
@@ -64,6 +99,11 @@ class WordleGame:
         if not is_valid:
             raise ValueError(f"Mot invalide : {error}")
         
+        if self.hard_mode:
+            error = hard_mode_violation(guess, self.attempts)
+            if error:
+                raise ValueError(f"Mode difficile : {error}")
+        
         # Générer le feedback
         feedback = generate_feedback(guess, self.target_word)
         self.attempts.append(feedback)
@@ -98,6 +138,7 @@ class WordleGame:
             'target_word': self.target_word,
             'attempts': len(self.attempts),
             'max_attempts': self.MAX_ATTEMPTS,
+            'hard_mode': self.hard_mode,
             'remaining_attempts': self.get_remaining_attempts(),
             'is_won': self.is_won,
             'is_over': self.is_over,
@@ -119,8 +160,8 @@ class WordleGame:
             new_target: Nouveau mot cible (optionnel, garde l'ancien si None)
         """
         if new_target:
-            if len(new_target) != 5:
-                raise ValueError("Le mot cible doit contenir exactement 5 lettres")
+            if len(new_target) != self.validator.word_length:
+                raise ValueError(f"Le mot cible doit contenir exactement {self.validator.word_length} lettres")
             self.target_word = new_target.upper()
         
         self.attempts = []
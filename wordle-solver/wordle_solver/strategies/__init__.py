@@ -4,7 +4,13 @@ from .base_strategy import BaseStrategy, SimpleStrategy, RandomStrategy
 from .frequency_strategy import FrequencyStrategy, PositionalFrequencyStrategy
 from .entropy_strategy import EntropyStrategy, FastEntropyStrategy
 from .minimax_strategy import MinimaxStrategy, ExpectedSizeStrategy
-from .comparator import StrategyComparator, quick_benchmark, GameResult, StrategyStats
+from .comparator import (
+    StrategyComparator, quick_benchmark, GameResult, StrategyStats, BenchmarkEvent, ResultsLog
+)
+from .opening_book import OpeningBook
+from .optimal_strategy import OptimalStrategy, OptimalResult
+from .batch import suggest_batch, BatchSuggestion
+from .multi_board import MultiBoardStrategy
 
 __all__ = [
     # Classes de base
@@ -24,9 +30,25 @@ __all__ = [
     'MinimaxStrategy',
     'ExpectedSizeStrategy',
     
+    # Stratégie multi-grilles (Quordle, Octordle)
+    'MultiBoardStrategy',
+    
+    # Stratégie optimale
+    'OptimalStrategy',
+    'OptimalResult',
+    
     # Comparaison
     'StrategyComparator',
     'quick_benchmark',
     'GameResult',
     'StrategyStats',
+    'BenchmarkEvent',
+    'ResultsLog',
+    
+    # Livre d'ouvertures
+    'OpeningBook',
+    
+    # Résolution par lots
+    'suggest_batch',
+    'BatchSuggestion',
 ]
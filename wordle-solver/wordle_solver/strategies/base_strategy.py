@@ -3,11 +3,83 @@ Classe de base abstraite pour les stratégies de résolution Wordle.
 
 Toutes les stratégies doivent hériter de cette classe et implémenter
 la méthode choose_word().
+
+choose_word() accepte une échéance (deadline=time.time() + budget) : les
+stratégies coûteuses évaluent alors les tentatives dans l'ordre d'une
+heuristique bon marché et renvoient le meilleur mot trouvé à temps. La
+qualité du dernier choix est indiquée par stats['quality'] :
+- 'exact' : toutes les tentatives ont été évaluées
+- 'partial' : une partie seulement a été évaluée avant l'échéance
+- 'heuristic' : échéance déjà dépassée, choix de l'heuristique seule
+
+En mode difficile (attribut hard_mode, ou argument hard_mode=True de
+choose_word), les tentatives proposées ('full_dictionary', 'guess_words')
+sont d'abord restreintes à celles qui respectent les indices révélés ; si
+le solveur est passé ('solver'), ce sous-ensemble vient de son index de bits
+maintenu d'un tour à l'autre. Les candidats restants sont toujours autorisés.
 """
 
 from abc import ABC, abstractmethod
 from typing import Set, Optional, Dict, Any
+import functools
+import time
+import numpy as np
 from ..csp import ConstraintManager
+from ..dictionaries.registry import LanguageRegistry
+from ..dictionaries.word_table import WordTable
+from ..utils import metrics
+from ..utils.cache import LRUCache, ids_digest
+from ..utils.pattern_matrix import PatternMatrix
+from ..utils.scoring import GuessScores, score_guesses, score_guesses_until
+from .opening_book import OpeningBook
+
+
+# Qualité du dernier choix (stats['quality'])
+QUALITY_EXACT = 'exact'
+QUALITY_PARTIAL = 'partial'
+QUALITY_HEURISTIC = 'heuristic'
+
+
+# Tables construites pour des ensembles de mots hors registre (clé : frozenset des mots)
+_word_tables = LRUCache('strategy_word_tables', max_entries=16)
+
+
+def _scores_nbytes(key, scores: GuessScores) -> int:
+    """Taille d'une entrée du cache de scores (fonction de module : sérialisable)."""
+    return scores.nbytes
+
+
+def _with_opening_book(choose_word):
+    """
+    Enveloppe choose_word pour répondre depuis les livres d'ouvertures.
+    
+    Si l'état de la partie est couvert par un livre de la stratégie, le mot
+    est lu directement ; sinon le calcul normal est effectué. En mode
+    difficile, les tentatives proposées sont d'abord restreintes. La durée
+    de l'appel est notée dans stats['time_taken'] (secondes) et dans la
+    phase 'choose_word' des métriques.
+    """
+    @functools.wraps(choose_word)
+    def wrapper(self, possible_words, constraint_manager, attempt_number, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            self.stats['quality'] = QUALITY_EXACT
+            if kwargs.get('hard_mode', self.hard_mode) and constraint_manager is not None:
+                # Les livres sont calculés en mode normal : pas de lecture ici
+                kwargs = self._restrict_to_hard_mode(possible_words, constraint_manager, kwargs)
+            elif self.opening_books and constraint_manager is not None:
+                word = self._book_lookup(possible_words, constraint_manager)
+                if word is not None:
+                    self.stats['book_hits'] += 1
+                    return word
+            return choose_word(self, possible_words, constraint_manager, attempt_number, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            self.stats['time_taken'] = elapsed / 1e9
+            if metrics.is_enabled():
+                metrics.observe('choose_word', elapsed)
+    
+    return wrapper
 
 
 class BaseStrategy(ABC):
@@ -18,6 +90,22 @@ class BaseStrategy(ABC):
     en fonction de l'état actuel du jeu.
     """
     
+    # Taille maximale des caches de scores (une entrée par couple tentatives/cibles)
+    CACHE_MAX_ENTRIES = 1024
+    SCORES_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    
+    # Taille maximale des caches de fréquences (une entrée par ensemble de cibles)
+    FREQUENCY_CACHE_MAX_ENTRIES = 256
+    
+    # Mode difficile par défaut (surchargé par l'argument hard_mode de choose_word)
+    hard_mode = False
+    
+    def __init_subclass__(cls, **kwargs):
+        """Branche les livres d'ouvertures sur le choose_word des sous-classes."""
+        super().__init_subclass__(**kwargs)
+        if 'choose_word' in cls.__dict__:
+            cls.choose_word = _with_opening_book(cls.__dict__['choose_word'])
+    
     def __init__(self, name: str = "Base Strategy"):
         """
         Initialise la stratégie.
@@ -26,10 +114,13 @@ class BaseStrategy(ABC):
             name: Nom de la stratégie
         """
         self.name = name
+        self.opening_books: Dict[str, OpeningBook] = {}
         self.stats = {
             'words_evaluated': 0,
             'time_taken': 0.0,
             'cache_hits': 0,
+            'book_hits': 0,
+            'quality': QUALITY_EXACT,
         }
     
     @abstractmethod
@@ -47,7 +138,8 @@ class BaseStrategy(ABC):
             possible_words: Ensemble des mots encore possibles
             constraint_manager: Gestionnaire de contraintes actuel
             attempt_number: Numéro de la tentative (1-6)
-            **kwargs: Arguments supplémentaires spécifiques à la stratégie
+            **kwargs: Arguments supplémentaires spécifiques à la stratégie,
+                      dont 'deadline' (échéance absolue, time.time())
             
         Returns:
             Le mot choisi, ou None si aucun mot n'est possible
@@ -92,12 +184,180 @@ class BaseStrategy(ABC):
         """
         return f"Stratégie {self.name} a choisi '{chosen_word}' parmi {len(possible_words)} mots possibles."
     
+    def _get_pattern_matrix(self, words: Set[str], **kwargs) -> PatternMatrix:
+        """
+        Retourne une matrice de patterns couvrant les mots donnés.
+        
+        Utilise la matrice passée en argument ('pattern_matrix') si elle
+        couvre les mots, sinon une matrice partagée du registre.
+        
+        Args:
+            words: Mots (tentatives et cibles) à couvrir
+            **kwargs: Peut contenir 'pattern_matrix'
+            
+        Returns:
+            PatternMatrix couvrant ces mots
+        """
+        matrix = kwargs.get('pattern_matrix')
+        if matrix is not None and matrix.covers(words):
+            return matrix
+        return PatternMatrix.for_words(words)
+    
+    def _get_word_table(self, words: Set[str], **kwargs) -> WordTable:
+        """
+        Retourne une table de mots couvrant les mots donnés.
+        
+        Réutilise la table du solveur ('solver') ou de la matrice
+        ('pattern_matrix') passés en argument si elle couvre les mots, puis
+        celle d'une langue déjà chargée du registre ; sinon construit une
+        table des seuls mots donnés, gardée en cache pour les appels suivants.
+        
+        Args:
+            words: Mots à couvrir
+            **kwargs: Peut contenir 'solver' ou 'pattern_matrix'
+        
+        Returns:
+            WordTable couvrant ces mots
+        """
+        for source in (kwargs.get('solver'), kwargs.get('pattern_matrix')):
+            table = getattr(source, 'table', None)
+            if table is not None and all(word in table for word in words):
+                return table
+        
+        length = len(next(iter(words))) if words else None
+        for language, word_length in LanguageRegistry.loaded():
+            if word_length == length:
+                table = LanguageRegistry.get(language, word_length).table
+                if all(word in table for word in words):
+                    return table
+        
+        key = frozenset(words)
+        table = _word_tables.get(key)
+        if table is None:
+            table = WordTable(words)
+            _word_tables.put(key, table)
+        return table
+    
+    def _new_scores_cache(self, name: str) -> LRUCache:
+        """Crée un cache borné de GuessScores (comptabilisé en octets)."""
+        return LRUCache(
+            name,
+            max_entries=self.CACHE_MAX_ENTRIES,
+            max_bytes=self.SCORES_CACHE_MAX_BYTES,
+            sizeof=_scores_nbytes
+        )
+    
+    def _score_guesses(
+        self,
+        matrix: PatternMatrix,
+        guess_ids: np.ndarray,
+        answer_ids: np.ndarray,
+        cache: Optional[LRUCache] = None,
+        deadline: Optional[float] = None
+    ) -> GuessScores:
+        """
+        Évalue un lot de tentatives avec le noyau vectorisé (avec cache).
+        
+        Avec une échéance, les tentatives sont évaluées par ordre de
+        fréquence des lettres jusqu'à l'échéance (stats['quality'] indique
+        si l'évaluation est complète) ; seuls les scores complets sont
+        mis en cache.
+        
+        Args:
+            matrix: Matrice de patterns couvrant tentatives et cibles
+            guess_ids: Identifiants des tentatives à évaluer (triés)
+            answer_ids: Identifiants des cibles possibles
+            cache: Cache de scores de la stratégie (optionnel)
+            deadline: Échéance absolue (time.time()), optionnelle
+            
+        Returns:
+            GuessScores aligné sur guess_ids (sous-ensemble trié si l'échéance
+            a interrompu l'évaluation)
+        """
+        cache_key = (matrix.digest, ids_digest(guess_ids), ids_digest(answer_ids))
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None and np.array_equal(cached.guess_ids, guess_ids):
+                self.stats['cache_hits'] += 1
+                return cached
+        
+        if deadline is None:
+            scores = score_guesses(matrix, guess_ids, answer_ids)
+        else:
+            scores = score_guesses_until(matrix, guess_ids, answer_ids, deadline)
+        self.stats['words_evaluated'] = len(scores)
+        
+        if len(scores) < len(guess_ids):
+            self.stats['quality'] = QUALITY_HEURISTIC if len(scores) == 1 else QUALITY_PARTIAL
+            return scores
+        
+        if cache is not None:
+            cache.put(cache_key, scores)
+        return scores
+    
+    def _restrict_to_hard_mode(
+        self,
+        possible_words: Set[str],
+        constraint_manager: ConstraintManager,
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Restreint les tentatives proposées à celles autorisées en mode difficile.
+        
+        Args:
+            possible_words: Mots encore possibles (toujours autorisés)
+            constraint_manager: Gestionnaire de contraintes (historique)
+            kwargs: Arguments de choose_word
+        
+        Returns:
+            Arguments avec 'full_dictionary' et 'guess_words' restreints
+        """
+        kwargs = dict(kwargs)
+        solver = kwargs.get('solver')
+        allowed = solver.allowed_guesses(constraint_manager) if solver is not None else None
+        
+        for key in ('full_dictionary', 'guess_words'):
+            if key in kwargs:
+                if allowed is not None:
+                    kwargs[key] = allowed
+                else:
+                    kwargs[key] = {word for word in kwargs[key] if constraint_manager.is_allowed_guess(word)}
+        return kwargs
+    
+    def use_opening_book(self, book: OpeningBook):
+        """
+        Associe un livre d'ouvertures à la stratégie (un par langue).
+        
+        Args:
+            book: Livre calculé par OpeningBook.build() pour cette stratégie
+        """
+        self.opening_books[book.language] = book
+    
+    def _book_lookup(self, possible_words: Set[str], constraint_manager: ConstraintManager) -> Optional[str]:
+        """
+        Cherche le mot à jouer dans les livres d'ouvertures.
+        
+        Args:
+            possible_words: Mots encore possibles
+            constraint_manager: Gestionnaire de contraintes (historique)
+            
+        Returns:
+            Le mot du livre, ou None si l'état est hors livre
+        """
+        for book in self.opening_books.values():
+            word = book.lookup(constraint_manager.history, len(possible_words))
+            if word is not None:
+                return word
+        return None
+    
     def reset_stats(self):
         """Réinitialise les statistiques de la stratégie."""
         self.stats = {
             'words_evaluated': 0,
             'time_taken': 0.0,
             'cache_hits': 0,
+            'book_hits': 0,
+            'quality': QUALITY_EXACT,
         }
     
     def get_stats(self) -> Dict[str, Any]:
@@ -0,0 +1,105 @@
+"""
+Résolution par lots d'états de jeu.
+
+Un lot est une liste d'historiques (tentative, code de pattern). Les
+historiques identiques ne sont résolus qu'une fois, et le filtrage des
+candidats est partagé entre historiques de même préfixe
+(HybridSolver.masks_for_histories). Les suggestions sont produites une par
+une, dans l'ordre du lot, pour pouvoir être diffusées au fil de l'eau.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .base_strategy import BaseStrategy, QUALITY_EXACT
+from ..csp import ConstraintManager, HybridSolver
+from ..game.feedback import FeedbackResult
+from ..utils.pattern_matrix import PatternMatrix
+
+
+History = Tuple[Tuple[str, int], ...]
+
+
+@dataclass
+class BatchSuggestion:
+    """Suggestion pour un état de jeu d'un lot."""
+    history: History
+    suggested_word: Optional[str]
+    candidate_count: int
+    quality: str
+    candidates: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """Représentation sérialisable (JSON)."""
+        return {
+            'history': [[guess, code] for guess, code in self.history],
+            'suggested_word': self.suggested_word,
+            'candidate_count': self.candidate_count,
+            'quality': self.quality,
+            'candidates': self.candidates,
+        }
+
+
+def suggest_batch(
+    strategy: BaseStrategy,
+    solver: HybridSolver,
+    histories: Iterable[Sequence[Tuple[str, int]]],
+    language: str = "en",
+    pattern_matrix: Optional[PatternMatrix] = None,
+    limit: int = 0
+) -> Iterator[Tuple[int, BatchSuggestion]]:
+    """
+    Suggère un mot pour chaque historique d'un lot.
+    
+    Args:
+        strategy: Stratégie utilisée pour chaque état
+        solver: Solveur hybride du dictionnaire
+        histories: Historiques de (tentative, code du pattern 0..242)
+        language: Langue (premier mot des historiques vides)
+        pattern_matrix: Matrice de patterns du dictionnaire (optionnelle)
+        limit: Nombre de candidats à joindre à chaque suggestion (0 : aucun)
+    
+    Yields:
+        Tuples (position dans le lot, BatchSuggestion), dans l'ordre du lot
+    """
+    histories = list(histories)
+    masks = solver.masks_for_histories(histories)
+    index = solver.word_filter.index
+    full_dictionary = solver.word_filter.full_dictionary
+    
+    suggestions: Dict[History, BatchSuggestion] = {}
+    for position, history in enumerate(histories):
+        key = tuple((guess.upper(), int(code)) for guess, code in history)
+        suggestion = suggestions.get(key)
+        
+        if suggestion is None:
+            mask = masks[key]
+            candidates = index.words_of(mask)
+            possible_words = set(candidates)
+            
+            if not key:
+                suggested_word = strategy.get_first_guess(language)
+                quality = QUALITY_EXACT
+            else:
+                constraint_manager = ConstraintManager.from_feedbacks(
+                    [FeedbackResult.from_code(guess, code) for guess, code in key]
+                )
+                suggested_word = strategy.choose_word(
+                    possible_words,
+                    constraint_manager,
+                    len(key) + 1,
+                    full_dictionary=full_dictionary,
+                    pattern_matrix=pattern_matrix
+                )
+                quality = strategy.stats.get('quality', QUALITY_EXACT)
+            
+            suggestion = BatchSuggestion(
+                history=key,
+                suggested_word=suggested_word,
+                candidate_count=mask.bit_count(),
+                quality=quality,
+                candidates=candidates[:limit]
+            )
+            suggestions[key] = suggestion
+        
+        yield position, suggestion
@@ -2,11 +2,21 @@
 Système de benchmark et comparaison de stratégies.
 
 Permet de tester et comparer les performances de différentes stratégies
-sur un ensemble de mots cibles.
+sur un ensemble de mots cibles, éventuellement en parallèle sur plusieurs
+processus (les mots cibles sont répartis entre les workers).
+
+Les longues comparaisons peuvent être suivies en continu (iter_events :
+résultat de chaque partie et instantanés des statistiques) et reprises
+après une interruption grâce à un journal de résultats (ResultsLog).
 """
 
-from typing import List, Dict, Set, Any, Optional
+from typing import List, Dict, Set, Any, Optional, Iterator, Tuple, Union
 from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import json
+import multiprocessing
+import os
 import time
 from collections import defaultdict
 import statistics
@@ -14,7 +24,8 @@ import statistics
 from .base_strategy import BaseStrategy
 from ..game import WordleGame, generate_feedback
 from ..csp import ConstraintManager, HybridSolver
-from ..dictionaries import DictionaryLoader
+from ..dictionaries import LanguageData, LanguageRegistry, WordTable
+from ..utils.pattern_matrix import PatternMatrix
 
 
 @dataclass
@@ -37,6 +48,18 @@ class GameResult:
             'guesses': self.guesses,
             'time': round(self.time_taken, 3)
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GameResult':
+        """Reconstruit un résultat depuis to_dict()."""
+        return cls(
+            target_word=data['target'],
+            strategy_name=data['strategy'],
+            attempts=data['attempts'],
+            won=data['won'],
+            guesses=list(data['guesses']),
+            time_taken=data['time']
+        )
 
 
 @dataclass
@@ -65,6 +88,24 @@ class StrategyStats:
         """Temps moyen par partie."""
         return (self.total_time / self.games_played) if self.games_played > 0 else 0.0
     
+    def add_result(self, result: GameResult):
+        """
+        Agrège le résultat d'une partie.
+        
+        Args:
+            result: Résultat à comptabiliser
+        """
+        self.games_played += 1
+        self.total_time += result.time_taken
+        
+        if result.won:
+            self.games_won += 1
+            self.total_attempts += result.attempts
+            self.attempt_distribution[result.attempts] += 1
+        else:
+            self.failed_words.append(result.target_word)
+            self.attempt_distribution[0] += 1  # 0 = échec
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convertit en dictionnaire."""
         return {
@@ -75,10 +116,138 @@ class StrategyStats:
             'average_attempts': round(self.average_attempts, 2),
             'average_time': round(self.average_time, 3),
             'attempt_distribution': dict(self.attempt_distribution),
-            'failed_words': self.failed_words
+            'failed_words': list(self.failed_words)
         }
 
 
+@dataclass
+class BenchmarkEvent:
+    """
+    Événement d'une comparaison de stratégies (voir iter_events).
+    
+    kind :
+    - 'start' : début de la comparaison (completed = parties reprises du journal)
+    - 'game' : une partie terminée (result)
+    - 'stats' : instantané des statistiques d'une stratégie (stats)
+    - 'end' : fin de la comparaison (stats de toutes les stratégies)
+    """
+    kind: str
+    completed: int
+    total: int
+    strategy_name: Optional[str] = None
+    result: Optional[GameResult] = None
+    stats: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit en dictionnaire (sérialisable en JSON)."""
+        data = {'event': self.kind, 'completed': self.completed, 'total': self.total}
+        if self.strategy_name is not None:
+            data['strategy'] = self.strategy_name
+        if self.result is not None:
+            data['result'] = self.result.to_dict()
+        if self.stats is not None:
+            data['stats'] = self.stats
+        return data
+
+
+class ResultsLog:
+    """
+    Journal de résultats en ajout seul (une ligne JSON par partie).
+    
+    Chaque résultat est écrit et vidé sur disque dès la fin de la partie :
+    après un arrêt brutal, le journal contient toutes les parties terminées
+    et une comparaison relancée avec le même journal reprend là où elle
+    s'était arrêtée. Une dernière ligne incomplète est ignorée.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialise le journal (ouvert à la première écriture).
+        
+        Args:
+            path: Chemin du fichier .jsonl
+        """
+        self.path = Path(path)
+        self._file = None
+    
+    def load(self) -> List[GameResult]:
+        """
+        Lit les résultats déjà enregistrés.
+        
+        Returns:
+            Résultats dans l'ordre d'écriture
+        """
+        if not self.path.exists():
+            return []
+        
+        results = []
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break  # Ligne interrompue par un arrêt brutal
+                results.append(GameResult.from_dict(json.loads(line)))
+        return results
+    
+    def append(self, result: GameResult):
+        """Ajoute un résultat et le vide sur disque."""
+        if self._file is None:
+            self._open()
+        self._file.write(json.dumps(result.to_dict(), ensure_ascii=False) + '\n')
+        self._file.flush()
+    
+    def _open(self):
+        """Ouvre le journal en ajout, en retirant une éventuelle ligne incomplète."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            with open(self.path, 'rb+') as f:
+                data = f.read()
+                if data and not data.endswith(b'\n'):
+                    f.truncate(data.rfind(b'\n') + 1)
+        self._file = open(self.path, 'a', encoding='utf-8')
+    
+    def close(self):
+        """Ferme le journal."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self) -> 'ResultsLog':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+# État d'un processus worker : (comparateur, stratégie), hérité par fork
+_worker_state: Optional[Tuple['StrategyComparator', BaseStrategy]] = None
+
+
+def _init_worker(comparator: 'StrategyComparator', strategy: BaseStrategy):
+    """Installe le comparateur et la stratégie dans le processus worker."""
+    global _worker_state
+    _worker_state = (comparator, strategy)
+
+
+def _play_in_worker(target_word: str) -> GameResult:
+    """Joue une partie dans le processus worker."""
+    comparator, strategy = _worker_state
+    return comparator._play_game(strategy, target_word)
+
+
+def _pool_context():
+    """
+    Contexte multiprocessing des workers.
+    
+    Utilise fork quand il est disponible : le dictionnaire, l'index et la
+    matrice de patterns sont alors partagés en lecture seule (copy-on-write)
+    au lieu d'être sérialisés vers chaque worker. Sinon (spawn), le
+    comparateur et la stratégie sont sérialisés, caches vidés.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
 class StrategyComparator:
     """
     Compare les performances de différentes stratégies.
@@ -89,17 +258,37 @@ class StrategyComparator:
     - Générer des rapports comparatifs
     """
     
-    def __init__(self, dictionary: Set[str], language: str = "en"):
+    def __init__(
+        self,
+        dictionary: Union[LanguageData, Set[str]],
+        language: str = "en",
+        hard_mode: bool = False
+    ):
         """
         Initialise le comparateur.
         
         Args:
-            dictionary: Dictionnaire de mots valides
-            language: Langue ('en' ou 'fr')
+            dictionary: Données d'une langue du registre (LanguageRegistry.get)
+                        ou dictionnaire de mots valides
+            language: Langue ('en' ou 'fr'), ignorée si dictionary est un LanguageData
+            hard_mode: Jouer les parties en mode difficile
         """
-        self.dictionary = dictionary
-        self.language = language
-        self.solver = HybridSolver(dictionary)
+        self.hard_mode = hard_mode
+        if isinstance(dictionary, LanguageData):
+            # Structures partagées du registre des langues (par référence)
+            self.dictionary = dictionary.words
+            self.language = dictionary.language
+            self.table = dictionary.table
+            self.solver = dictionary.solver
+            self.pattern_matrix = dictionary.pattern_matrix
+        else:
+            self.dictionary = dictionary
+            self.language = language
+            # Table de mots partagée par le solveur et la matrice de patterns
+            self.table = WordTable.of(dictionary)
+            self.solver = HybridSolver(self.table)
+            # Matrice de patterns partagée par toutes les stratégies (calculée au premier usage)
+            self.pattern_matrix = PatternMatrix.for_words(self.table)
         self.results: List[GameResult] = []
         self.stats_by_strategy: Dict[str, StrategyStats] = {}
     
@@ -107,7 +296,8 @@ class StrategyComparator:
         self,
         strategy: BaseStrategy,
         target_words: List[str],
-        verbose: bool = False
+        verbose: bool = False,
+        workers: Optional[int] = 1
     ) -> StrategyStats:
         """
         Teste une stratégie sur un ensemble de mots.
@@ -116,34 +306,69 @@ class StrategyComparator:
             strategy: La stratégie à tester
             target_words: Liste de mots cibles
             verbose: Si True, affiche les progrès
+            workers: Nombre de processus (1 = séquentiel, None = tous les cœurs)
             
         Returns:
             Statistiques de la stratégie
         """
         stats = StrategyStats(strategy_name=strategy.name)
         
-        for i, target in enumerate(target_words):
+        for i, result in enumerate(self.iter_results(strategy, target_words, workers=workers)):
             if verbose and (i + 1) % 10 == 0:
                 print(f"  Progression: {i+1}/{len(target_words)} mots testés...")
             
-            result = self._play_game(strategy, target)
             self.results.append(result)
-            
-            # Mettre à jour les stats
-            stats.games_played += 1
-            stats.total_time += result.time_taken
-            
-            if result.won:
-                stats.games_won += 1
-                stats.total_attempts += result.attempts
-                stats.attempt_distribution[result.attempts] += 1
-            else:
-                stats.failed_words.append(target)
-                stats.attempt_distribution[0] += 1  # 0 = échec
+            stats.add_result(result)
         
         self.stats_by_strategy[strategy.name] = stats
         return stats
     
+    def iter_results(
+        self,
+        strategy: BaseStrategy,
+        target_words: List[str],
+        workers: Optional[int] = 1
+    ) -> Iterator[GameResult]:
+        """
+        Joue les parties et produit les résultats au fur et à mesure.
+        
+        Les résultats sont toujours produits dans l'ordre de target_words,
+        quel que soit le nombre de workers : les statistiques agrégées sont
+        donc identiques en séquentiel et en parallèle.
+        
+        Args:
+            strategy: La stratégie à tester
+            target_words: Liste de mots cibles
+            workers: Nombre de processus (1 = séquentiel, None = tous les cœurs)
+            
+        Yields:
+            GameResult de chaque mot cible
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(target_words))
+        
+        if workers <= 1:
+            for target in target_words:
+                yield self._play_game(strategy, target)
+            return
+        
+        # Construire la matrice avant le fork pour qu'elle soit partagée
+        self.pattern_matrix.matrix
+        
+        chunksize = max(1, len(target_words) // (workers * 4))
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(self, strategy)
+        )
+        try:
+            yield from executor.map(_play_in_worker, target_words, chunksize=chunksize)
+        finally:
+            # Consommateur arrêté en cours de route : abandonner les parties restantes
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def _play_game(self, strategy: BaseStrategy, target_word: str) -> GameResult:
         """
         Joue une partie avec une stratégie donnée.
@@ -155,9 +380,9 @@ class StrategyComparator:
         Returns:
             Résultat de la partie
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        game = WordleGame(target_word)
+        game = WordleGame(target_word, hard_mode=self.hard_mode)
         cm = ConstraintManager()
         guesses = []
         
@@ -177,13 +402,16 @@ class StrategyComparator:
                 guess = strategy.get_first_guess(self.language)
                 # S'assurer que le premier mot est dans le dictionnaire
                 if guess not in self.dictionary:
-                    guess = sorted(possible_words)[0]
+                    guess = possible_words[0]
             else:
                 guess = strategy.choose_word(
                     possible_words, 
                     cm, 
                     attempt,
-                    full_dictionary=self.dictionary
+                    full_dictionary=self.dictionary,
+                    pattern_matrix=self.pattern_matrix,
+                    hard_mode=self.hard_mode,
+                    solver=self.solver
                 )
             
             if not guess:
@@ -196,12 +424,12 @@ class StrategyComparator:
                 cm.apply_feedback(feedback)
             except ValueError:
                 # Mot invalide, prendre le premier possible
-                guess = sorted(possible_words)[0]
+                guess = possible_words[0]
                 feedback = game.make_guess(guess)
                 guesses.append(guess)
                 cm.apply_feedback(feedback)
         
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
         
         return GameResult(
             target_word=target_word,
@@ -212,11 +440,90 @@ class StrategyComparator:
             time_taken=elapsed
         )
     
+    def iter_events(
+        self,
+        strategies: List[BaseStrategy],
+        target_words: List[str],
+        workers: Optional[int] = 1,
+        results_log: Optional[Union[ResultsLog, str, Path]] = None,
+        snapshot_every: int = 10
+    ) -> Iterator[BenchmarkEvent]:
+        """
+        Compare plusieurs stratégies en produisant un flux d'événements.
+        
+        Chaque partie produit un événement 'game', et les statistiques de la
+        stratégie en cours sont publiées ('stats') toutes les snapshot_every
+        parties et à la fin de chaque stratégie. Avec un journal de
+        résultats, chaque partie y est enregistrée dès qu'elle est terminée,
+        et les parties déjà présentes dans le journal ne sont pas rejouées.
+        
+        Args:
+            strategies: Liste de stratégies à comparer
+            target_words: Mots cibles pour les tests
+            workers: Nombre de processus par stratégie (1 = séquentiel, None = tous les cœurs)
+            results_log: Journal de résultats (ResultsLog ou chemin), optionnel
+            snapshot_every: Fréquence des instantanés 'stats' (en parties)
+            
+        Yields:
+            BenchmarkEvent ('start', 'game', 'stats', puis 'end')
+        """
+        if results_log is not None and not isinstance(results_log, ResultsLog):
+            results_log = ResultsLog(results_log)
+        
+        # Parties déjà jouées (reprise)
+        done: Dict[Tuple[str, str], GameResult] = {}
+        if results_log is not None:
+            for result in results_log.load():
+                done[(result.strategy_name, result.target_word)] = result
+        
+        total = len(strategies) * len(target_words)
+        resumed = sum(
+            (strategy.name, target) in done for strategy in strategies for target in target_words
+        )
+        completed = resumed
+        yield BenchmarkEvent('start', completed, total)
+        
+        try:
+            for strategy in strategies:
+                stats = StrategyStats(strategy_name=strategy.name)
+                remaining = []
+                for target in target_words:
+                    result = done.get((strategy.name, target))
+                    if result is None:
+                        remaining.append(target)
+                    else:
+                        self.results.append(result)
+                        stats.add_result(result)
+                self.stats_by_strategy[strategy.name] = stats
+                
+                for i, result in enumerate(self.iter_results(strategy, remaining, workers=workers), 1):
+                    if results_log is not None:
+                        results_log.append(result)
+                    self.results.append(result)
+                    stats.add_result(result)
+                    completed += 1
+                    yield BenchmarkEvent('game', completed, total, strategy.name, result=result)
+                    
+                    if snapshot_every and i % snapshot_every == 0 and i < len(remaining):
+                        yield BenchmarkEvent('stats', completed, total, strategy.name, stats=stats.to_dict())
+                
+                yield BenchmarkEvent('stats', completed, total, strategy.name, stats=stats.to_dict())
+        finally:
+            if results_log is not None:
+                results_log.close()
+        
+        yield BenchmarkEvent(
+            'end', completed, total,
+            stats={name: stats.to_dict() for name, stats in self.stats_by_strategy.items()}
+        )
+    
     def compare_strategies(
         self,
         strategies: List[BaseStrategy],
         target_words: List[str],
-        verbose: bool = True
+        verbose: bool = True,
+        workers: Optional[int] = 1,
+        results_log: Optional[Union[ResultsLog, str, Path]] = None
     ) -> Dict[str, StrategyStats]:
         """
         Compare plusieurs stratégies sur les mêmes mots.
@@ -225,6 +532,8 @@ class StrategyComparator:
             strategies: Liste de stratégies à comparer
             target_words: Mots cibles pour les tests
             verbose: Afficher les progrès
+            workers: Nombre de processus par stratégie (1 = séquentiel, None = tous les cœurs)
+            results_log: Journal de résultats pour reprendre une comparaison interrompue
             
         Returns:
             Dictionnaire {nom_stratégie: stats}
@@ -235,14 +544,18 @@ class StrategyComparator:
             print(f"Mots cibles: {len(target_words)}")
             print(f"{'='*70}\n")
         
-        for i, strategy in enumerate(strategies, 1):
-            if verbose:
-                print(f"[{i}/{len(strategies)}] Test de : {strategy.name}")
+        position = {strategy.name: i for i, strategy in enumerate(strategies, 1)}
+        current = None
+        for event in self.iter_events(strategies, target_words, workers=workers, results_log=results_log):
+            if not verbose or event.strategy_name is None:
+                continue
             
-            self.test_strategy(strategy, target_words, verbose=False)
+            if event.strategy_name != current:
+                current = event.strategy_name
+                print(f"[{position[current]}/{len(strategies)}] Test de : {current}")
             
-            if verbose:
-                stats = self.stats_by_strategy[strategy.name]
+            stats = self.stats_by_strategy[current]
+            if event.kind == 'stats' and stats.games_played == len(target_words):
                 print(f"  ✓ Taux de victoire: {stats.win_rate:.1f}%")
                 print(f"  ✓ Moyenne tentatives: {stats.average_attempts:.2f}")
                 print(f"  ✓ Temps moyen: {stats.average_time:.3f}s\n")
@@ -340,7 +653,9 @@ def quick_benchmark(
     strategies: List[BaseStrategy],
     n_words: int = 20,
     language: str = "en",
-    verbose: bool = True
+    verbose: bool = True,
+    workers: Optional[int] = 1,
+    hard_mode: bool = False
 ) -> Dict[str, StrategyStats]:
     """
     Benchmark rapide de stratégies.
@@ -350,21 +665,23 @@ def quick_benchmark(
         n_words: Nombre de mots à tester
         language: Langue ('en' ou 'fr')
         verbose: Afficher les résultats
+        workers: Nombre de processus (1 = séquentiel, None = tous les cœurs)
+        hard_mode: Jouer les parties en mode difficile
         
     Returns:
         Statistiques par stratégie
     """
-    # Charger le dictionnaire
-    dictionary = DictionaryLoader.load_language(language)
+    # Dictionnaire partagé du registre des langues
+    data = LanguageRegistry.get(language)
     
     # Sélectionner des mots représentatifs
-    words_list = sorted(dictionary)
+    words_list = list(data.table.words)
     step = max(1, len(words_list) // n_words)
     test_words = words_list[::step][:n_words]
     
     # Comparer
-    comparator = StrategyComparator(dictionary, language)
-    stats = comparator.compare_strategies(strategies, test_words, verbose=verbose)
+    comparator = StrategyComparator(data, hard_mode=hard_mode)
+    stats = comparator.compare_strategies(strategies, test_words, verbose=verbose, workers=workers)
     
     if verbose:
         print(comparator.generate_report(detailed=True))
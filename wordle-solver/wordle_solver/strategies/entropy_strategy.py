@@ -5,12 +5,10 @@ Cette stratégie choisit le mot qui maximise l'information gagnée,
 c'est-à-dire celui qui divise le mieux l'espace des possibilités.
 """
 
-from typing import Set, Optional, Dict, List, Tuple
-from collections import defaultdict
-import math
+from typing import Set, Optional
+import numpy as np
 from .base_strategy import BaseStrategy
 from ..csp import ConstraintManager
-from ..game import generate_feedback
 
 
 class EntropyStrategy(BaseStrategy):
@@ -34,6 +32,10 @@ class EntropyStrategy(BaseStrategy):
     Inconvénients :
     - Très coûteux en calcul (O(n²) où n = nombre de mots possibles)
     - Nécessite de simuler tous les feedbacks possibles
+    
+    Les scores sont calculés en un seul passage vectorisé sur la matrice
+    de patterns (score_guesses), ce qui rend use_full_dictionary=True
+    utilisable en ligne sans échantillonnage.
     """
     
     def __init__(self, use_full_dictionary: bool = False, max_words_to_evaluate: int = None):
@@ -47,7 +49,7 @@ class EntropyStrategy(BaseStrategy):
         super().__init__(name="Entropie (Information Theory)")
         self.use_full_dictionary = use_full_dictionary
         self.max_words_to_evaluate = max_words_to_evaluate
-        self._entropy_cache = {}
+        self._entropy_cache = self._new_scores_cache('entropy_strategy')
     
     def choose_word(
         self,
@@ -64,6 +66,7 @@ class EntropyStrategy(BaseStrategy):
             constraint_manager: Gestionnaire de contraintes (non utilisé ici)
             attempt_number: Numéro de la tentative
             **kwargs: Peut contenir 'full_dictionary' pour évaluation élargie
+                      et 'deadline' (échéance, voir BaseStrategy)
             
         Returns:
             Le mot qui maximise l'entropie attendue
@@ -85,63 +88,22 @@ class EntropyStrategy(BaseStrategy):
         else:
             words_to_evaluate = possible_words
         
-        # Limiter le nombre de mots à évaluer si nécessaire
-        if self.max_words_to_evaluate and len(words_to_evaluate) > self.max_words_to_evaluate:
+        # Limiter le nombre de mots à évaluer si nécessaire (avec une échéance,
+        # tous les mots sont évalués par ordre de priorité jusqu'à l'échéance)
+        deadline = kwargs.get('deadline')
+        if deadline is None and self.max_words_to_evaluate and len(words_to_evaluate) > self.max_words_to_evaluate:
             # Prendre un échantillon représentatif
             words_to_evaluate = self._sample_words(words_to_evaluate, self.max_words_to_evaluate)
         
-        # Calculer l'entropie de chaque mot
-        best_word = None
-        best_entropy = -1
-        
-        for candidate in words_to_evaluate:
-            entropy = self._calculate_entropy(candidate, possible_words)
-            
-            if entropy > best_entropy:
-                best_entropy = entropy
-                best_word = candidate
-        
-        self.stats['words_evaluated'] = len(words_to_evaluate)
-        return best_word
-    
-    def _calculate_entropy(self, candidate: str, possible_targets: Set[str]) -> float:
-        """
-        Calcule l'entropie d'un mot candidat.
-        
-        Args:
-            candidate: Le mot à évaluer
-            possible_targets: Les mots cibles possibles
-            
-        Returns:
-            Entropie du mot (bits d'information)
-        """
-        # Vérifier le cache
-        cache_key = (candidate, frozenset(possible_targets))
-        if cache_key in self._entropy_cache:
-            self.stats['cache_hits'] += 1
-            return self._entropy_cache[cache_key]
-        
-        # Simuler le feedback pour chaque mot cible possible
-        pattern_counts = defaultdict(int)
-        
-        for target in possible_targets:
-            # Générer le feedback
-            feedback = generate_feedback(candidate, target)
-            pattern = feedback.to_pattern()  # "GYBBG" par exemple
-            pattern_counts[pattern] += 1
-        
-        # Calculer l'entropie
-        n_total = len(possible_targets)
-        entropy = 0.0
-        
-        for count in pattern_counts.values():
-            if count > 0:
-                probability = count / n_total
-                entropy -= probability * math.log2(probability)
+        # Matrice de patterns partagée et identifiants des mots
+        matrix = self._get_pattern_matrix(set(words_to_evaluate) | set(possible_words), **kwargs)
+        guess_ids = np.sort(matrix.ids(words_to_evaluate))
+        target_ids = matrix.ids(possible_words)
         
-        # Mettre en cache
-        self._entropy_cache[cache_key] = entropy
-        return entropy
+        # Entropie de chaque mot en un seul passage, puis le meilleur
+        scores = self._score_guesses(matrix, guess_ids, target_ids, self._entropy_cache, deadline)
+        best = int(np.argmax(scores.entropy))
+        return matrix.words[scores.guess_ids[best]]
     
     def _sample_words(self, words: Set[str], n: int) -> Set[str]:
         """
@@ -211,6 +173,9 @@ class FastEntropyStrategy(BaseStrategy):
     - Limite le nombre de mots évalués
     - Utilise un cache agressif
     - Échantillonnage intelligent
+    
+    L'entropie de chaque mot retenu est calculée exactement sur toutes les
+    cibles avec le noyau vectorisé (plus besoin d'échantillonner les cibles).
     """
     
     def __init__(self, evaluation_limit: int = 50):
@@ -222,7 +187,7 @@ class FastEntropyStrategy(BaseStrategy):
         """
         super().__init__(name="Entropie Rapide")
         self.evaluation_limit = evaluation_limit
-        self._cache = {}
+        self._cache = self._new_scores_cache('fast_entropy_strategy')
     
     def choose_word(
         self,
@@ -238,8 +203,10 @@ class FastEntropyStrategy(BaseStrategy):
         if len(possible_words) <= 2:
             return sorted(possible_words)[0]
         
-        # Limiter les mots à évaluer
-        if len(possible_words) > self.evaluation_limit:
+        # Limiter les mots à évaluer (avec une échéance, tous les mots sont
+        # évalués par ordre de priorité jusqu'à l'échéance)
+        deadline = kwargs.get('deadline')
+        if deadline is None and len(possible_words) > self.evaluation_limit:
             # Stratégie hybride : 
             # 1. Prendre les X premiers alphabétiquement
             # 2. Échantillonner le reste
@@ -247,69 +214,22 @@ class FastEntropyStrategy(BaseStrategy):
             words_to_eval = set(sorted_words[:self.evaluation_limit // 2])
             
             # Ajouter un échantillon du reste
-            remaining = set(sorted_words[self.evaluation_limit // 2:])
+            remaining = sorted_words[self.evaluation_limit // 2:]
             sample_size = self.evaluation_limit // 2
             if len(remaining) > sample_size:
                 step = len(remaining) // sample_size
-                sampled = [w for i, w in enumerate(sorted(remaining)) if i % step == 0]
+                sampled = [w for i, w in enumerate(remaining) if i % step == 0]
                 words_to_eval.update(sampled[:sample_size])
             else:
                 words_to_eval.update(remaining)
         else:
             words_to_eval = possible_words
         
-        # Calculer l'entropie approximative
-        best_word = None
-        best_score = -1
-        
-        for candidate in words_to_eval:
-            score = self._approximate_entropy(candidate, possible_words)
-            
-            if score > best_score:
-                best_score = score
-                best_word = candidate
-        
-        self.stats['words_evaluated'] = len(words_to_eval)
-        return best_word
-    
-    def _approximate_entropy(self, candidate: str, targets: Set[str]) -> float:
-        """
-        Calcule une approximation rapide de l'entropie.
-        
-        Utilise un échantillon si le nombre de cibles est trop grand.
-        """
-        # Si peu de cibles, calcul exact
-        if len(targets) <= 20:
-            return self._calculate_exact_entropy(candidate, targets)
-        
-        # Sinon, échantillonner
-        sample_size = 20
-        targets_list = sorted(targets)
-        step = max(1, len(targets_list) // sample_size)
-        sample = set(targets_list[::step][:sample_size])
-        
-        return self._calculate_exact_entropy(candidate, sample)
-    
-    def _calculate_exact_entropy(self, candidate: str, targets: Set[str]) -> float:
-        """Calcule l'entropie exacte."""
-        cache_key = (candidate, frozenset(targets))
-        if cache_key in self._cache:
-            self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
-        
-        pattern_counts = defaultdict(int)
-        for target in targets:
-            feedback = generate_feedback(candidate, target)
-            pattern = feedback.to_pattern()
-            pattern_counts[pattern] += 1
-        
-        n_total = len(targets)
-        entropy = 0.0
-        
-        for count in pattern_counts.values():
-            if count > 0:
-                p = count / n_total
-                entropy -= p * math.log2(p)
+        # Entropie exacte des mots retenus sur toutes les cibles
+        matrix = self._get_pattern_matrix(possible_words, **kwargs)
+        guess_ids = np.sort(matrix.ids(words_to_eval))
+        target_ids = matrix.ids(possible_words)
         
-        self._cache[cache_key] = entropy
-        return entropy
+        scores = self._score_guesses(matrix, guess_ids, target_ids, self._cache, deadline)
+        best = int(np.argmax(scores.entropy))
+        return matrix.words[scores.guess_ids[best]]
@@ -3,12 +3,18 @@ Stratégie basée sur la fréquence des lettres.
 
 Cette stratégie privilégie les mots contenant les lettres les plus
 fréquentes dans les mots encore possibles.
+
+Les fréquences sont comptées sur le tableau de lettres d'une WordTable
+(np.bincount), et le score de tous les mots s'obtient par un seul produit
+matrice-vecteur : présence des lettres (N × A) × fréquences (A).
 """
 
 from typing import Set, Optional, Dict
-from collections import Counter
+import numpy as np
 from .base_strategy import BaseStrategy
 from ..csp import ConstraintManager
+from ..dictionaries.word_table import WordTable
+from ..utils.cache import LRUCache, ids_digest
 
 
 class FrequencyStrategy(BaseStrategy):
@@ -41,7 +47,7 @@ class FrequencyStrategy(BaseStrategy):
         super().__init__(name="Fréquence des lettres")
         self.penalize_known = penalize_known
         self.unique_letters_bonus = unique_letters_bonus
-        self._frequency_cache = {}
+        self._frequency_cache = LRUCache('frequency_strategy', max_entries=self.FREQUENCY_CACHE_MAX_ENTRIES)
     
     def choose_word(
         self,
@@ -70,57 +76,62 @@ class FrequencyStrategy(BaseStrategy):
             return list(possible_words)[0]
         
         # Calculer les fréquences des lettres
-        letter_frequencies = self._calculate_letter_frequencies(possible_words)
+        table = self._get_word_table(possible_words, **kwargs)
+        letter_frequencies = self._calculate_letter_frequencies(possible_words, table)
         
         # Obtenir les lettres déjà connues
         known_letters = constraint_manager.get_known_letters() if self.penalize_known else set()
         
-        # Évaluer chaque mot
-        best_word = None
-        best_score = -1
+        # Poids de chaque lettre : fréquence, réduite de moitié si déjà connue
+        weights = np.array([
+            letter_frequencies.get(letter, 0.0) * (0.5 if letter in known_letters else 1.0)
+            for letter in table.alphabet
+        ])
         
-        for word in possible_words:
-            score = self._score_word(word, letter_frequencies, known_letters)
-            
-            if score > best_score:
-                best_score = score
-                best_word = word
+        # Évaluer tous les mots en un produit matrice-vecteur (même score que _score_word)
+        ids = np.sort(table.ids(possible_words))
+        presence = table.presence[ids]
+        scores = presence @ weights
+        if self.unique_letters_bonus:
+            all_distinct = np.count_nonzero(presence, axis=1) == table.word_length
+            scores = np.where(all_distinct, scores * 1.2, scores)
         
         self.stats['words_evaluated'] = len(possible_words)
-        return best_word
+        return table.words[ids[int(np.argmax(scores))]]
     
-    def _calculate_letter_frequencies(self, words: Set[str]) -> Dict[str, float]:
+    def _calculate_letter_frequencies(self, words: Set[str], table: Optional[WordTable] = None) -> Dict[str, float]:
         """
         Calcule la fréquence de chaque lettre dans l'ensemble de mots.
         
         Args:
             words: Ensemble de mots
+            table: Table couvrant les mots (défaut : table des seuls mots)
             
         Returns:
             Dictionnaire {lettre: fréquence relative}
         """
-        # Utiliser le cache si disponible
-        cache_key = frozenset(words)
-        if cache_key in self._frequency_cache:
+        # Utiliser le cache si disponible (clé : identifiants dans la table)
+        table = table if table is not None else self._get_word_table(words)
+        ids = table.ids(words)
+        cache_key = (table.digest, ids_digest(ids))
+        cached = self._frequency_cache.get(cache_key)
+        if cached is not None:
             self.stats['cache_hits'] += 1
-            return self._frequency_cache[cache_key]
+            return cached
         
-        # Compter toutes les lettres
-        letter_counts = Counter()
-        for word in words:
-            # Compter chaque lettre une fois par mot (évite le biais des doublons)
-            for letter in set(word):
-                letter_counts[letter] += 1
+        # Compter chaque lettre une fois par mot (évite le biais des doublons)
+        letter_counts = table.presence_counts(ids)
         
         # Normaliser en fréquences
-        total = sum(letter_counts.values())
+        total = max(1, int(letter_counts.sum()))
         frequencies = {
             letter: count / total
-            for letter, count in letter_counts.items()
+            for letter, count in zip(table.alphabet, letter_counts.tolist())
+            if count
         }
         
         # Mettre en cache
-        self._frequency_cache[cache_key] = frequencies
+        self._frequency_cache.put(cache_key, frequencies)
         return frequencies
     
     def _score_word(
@@ -154,7 +165,7 @@ class FrequencyStrategy(BaseStrategy):
             score += letter_score
         
         # Bonus pour les mots avec toutes lettres différentes
-        if self.unique_letters_bonus and len(unique_letters) == 5:
+        if self.unique_letters_bonus and len(unique_letters) == len(word):
             score *= 1.2  # Bonus de 20%
         
         return score
@@ -211,7 +222,7 @@ class PositionalFrequencyStrategy(BaseStrategy):
     
     def __init__(self):
         super().__init__(name="Fréquence positionnelle")
-        self._position_freq_cache = {}
+        self._position_freq_cache = LRUCache('positional_frequency_strategy', max_entries=self.FREQUENCY_CACHE_MAX_ENTRIES)
     
     def choose_word(
         self,
@@ -228,49 +239,60 @@ class PositionalFrequencyStrategy(BaseStrategy):
             return list(possible_words)[0]
         
         # Calculer les fréquences positionnelles
-        position_frequencies = self._calculate_position_frequencies(possible_words)
+        table = self._get_word_table(possible_words, **kwargs)
+        position_frequencies = self._calculate_position_frequencies(possible_words, table)
         
-        # Évaluer chaque mot
-        best_word = None
-        best_score = -1
+        # Matrice (L, A) des fréquences, indexée par code de lettre
+        frequencies = np.zeros((table.word_length, len(table.alphabet)))
+        for pos, letter_frequencies in position_frequencies.items():
+            for letter, frequency in letter_frequencies.items():
+                frequencies[pos, table.letter_index[letter]] = frequency
         
-        for word in possible_words:
-            score = self._score_word_positional(word, position_frequencies)
-            
-            if score > best_score:
-                best_score = score
-                best_word = word
+        # Évaluer tous les mots d'un coup (même score que _score_word_positional)
+        ids = np.sort(table.ids(possible_words))
+        scores = frequencies[np.arange(table.word_length), table.letters[ids]].sum(axis=1)
         
         self.stats['words_evaluated'] = len(possible_words)
-        return best_word
+        return table.words[ids[int(np.argmax(scores))]]
     
-    def _calculate_position_frequencies(self, words: Set[str]) -> Dict[int, Dict[str, float]]:
+    def _calculate_position_frequencies(
+        self,
+        words: Set[str],
+        table: Optional[WordTable] = None
+    ) -> Dict[int, Dict[str, float]]:
         """
         Calcule la fréquence de chaque lettre à chaque position.
         
+        Args:
+            words: Ensemble de mots
+            table: Table couvrant les mots (défaut : table des seuls mots)
+        
         Returns:
             {position: {lettre: fréquence}}
         """
-        cache_key = frozenset(words)
-        if cache_key in self._position_freq_cache:
+        table = table if table is not None else self._get_word_table(words)
+        ids = table.ids(words)
+        cache_key = (table.digest, ids_digest(ids))
+        cached = self._position_freq_cache.get(cache_key)
+        if cached is not None:
             self.stats['cache_hits'] += 1
-            return self._position_freq_cache[cache_key]
-        
-        # Compter les lettres par position
-        position_counts = {i: Counter() for i in range(5)}
+            return cached
         
-        for word in words:
-            for pos, letter in enumerate(word):
-                position_counts[pos][letter] += 1
+        # Compter les lettres par position (un seul bincount)
+        position_counts = table.position_counts(ids)
         
         # Normaliser en fréquences
-        n_words = len(words)
+        n_words = max(1, len(words))
         position_frequencies = {
-            pos: {letter: count / n_words for letter, count in counts.items()}
-            for pos, counts in position_counts.items()
+            pos: {
+                letter: count / n_words
+                for letter, count in zip(table.alphabet, counts.tolist())
+                if count
+            }
+            for pos, counts in enumerate(position_counts)
         }
         
-        self._position_freq_cache[cache_key] = position_frequencies
+        self._position_freq_cache.put(cache_key, position_frequencies)
         return position_frequencies
     
     def _score_word_positional(
@@ -6,10 +6,10 @@ le meilleur résultat dans le scénario le moins favorable.
 """
 
 from typing import Set, Optional, Dict, Tuple
-from collections import defaultdict
+import numpy as np
 from .base_strategy import BaseStrategy
 from ..csp import ConstraintManager
-from ..game import generate_feedback
+from ..utils.scoring import GuessScores
 
 
 class MinimaxStrategy(BaseStrategy):
@@ -46,7 +46,7 @@ class MinimaxStrategy(BaseStrategy):
         """
         super().__init__(name="Minimax")
         self.tie_breaker = tie_breaker
-        self._cache = {}
+        self._cache = self._new_scores_cache('minimax_strategy')
     
     def choose_word(
         self,
@@ -62,7 +62,7 @@ class MinimaxStrategy(BaseStrategy):
             possible_words: Mots encore possibles
             constraint_manager: Gestionnaire de contraintes
             attempt_number: Numéro de la tentative
-            **kwargs: Arguments supplémentaires
+            **kwargs: Peut contenir 'pattern_matrix' et 'deadline'
             
         Returns:
             Le mot qui minimise le pire cas
@@ -77,83 +77,49 @@ class MinimaxStrategy(BaseStrategy):
         if len(possible_words) == 2:
             return sorted(possible_words)[0]
         
-        # Évaluer chaque mot
-        best_words = []
-        best_worst_case = float('inf')
+        # Évaluer tous les mots en un seul passage vectorisé
+        matrix = self._get_pattern_matrix(possible_words, **kwargs)
+        guess_ids = np.sort(matrix.ids(possible_words))
+        target_ids = matrix.ids(possible_words)
+        scores = self._score_guesses(matrix, guess_ids, target_ids, self._cache, kwargs.get('deadline'))
         
-        for candidate in possible_words:
-            worst_case = self._calculate_worst_case(candidate, possible_words)
-            
-            if worst_case < best_worst_case:
-                best_worst_case = worst_case
-                best_words = [candidate]
-            elif worst_case == best_worst_case:
-                best_words.append(candidate)
-        
-        self.stats['words_evaluated'] = len(possible_words)
+        # Mots dont le pire cas est minimal
+        tied = np.flatnonzero(scores.worst_case == scores.worst_case.min())
         
         # Si plusieurs mots avec le même pire cas, départager
-        if len(best_words) > 1:
-            return self._break_tie(best_words, possible_words)
+        if len(tied) > 1:
+            return self._break_tie(tied, scores, matrix.words, possible_words)
         
-        return best_words[0]
+        return matrix.words[scores.guess_ids[tied[0]]]
     
-    def _calculate_worst_case(self, candidate: str, targets: Set[str]) -> int:
-        """
-        Calcule la taille du pire groupe après feedback.
-        
-        Args:
-            candidate: Mot candidat
-            targets: Mots cibles possibles
-            
-        Returns:
-            Taille du plus grand groupe
-        """
-        cache_key = (candidate, frozenset(targets))
-        if cache_key in self._cache:
-            self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
-        
-        # Grouper les cibles par pattern de feedback
-        pattern_groups = defaultdict(list)
-        
-        for target in targets:
-            feedback = generate_feedback(candidate, target)
-            pattern = feedback.to_pattern()
-            pattern_groups[pattern].append(target)
-        
-        # Trouver le groupe le plus grand
-        worst_case = max(len(group) for group in pattern_groups.values())
-        
-        self._cache[cache_key] = worst_case
-        return worst_case
-    
-    def _break_tie(self, tied_words: list, possible_words: Set[str]) -> str:
+    def _break_tie(
+        self,
+        tied: np.ndarray,
+        scores: GuessScores,
+        words: tuple,
+        possible_words: Set[str]
+    ) -> str:
         """
         Départage les ex-aequo selon la méthode choisie.
         
         Args:
-            tied_words: Liste de mots ex-aequo
+            tied: Positions (dans scores) des mots ex-aequo
+            scores: Scores calculés par le noyau vectorisé
+            words: Mots de la matrice (identifiant -> mot)
             possible_words: Mots possibles
             
         Returns:
             Le mot choisi
         """
+        tied_words = [words[scores.guess_ids[i]] for i in tied]
+        
         if self.tie_breaker == "alphabetical":
             return sorted(tied_words)[0]
         
         elif self.tie_breaker == "entropy":
-            # Calculer une entropie simplifiée
-            best_word = tied_words[0]
-            best_score = -1
-            
-            for word in tied_words:
-                score = self._simple_entropy(word, possible_words)
-                if score > best_score:
-                    best_score = score
-                    best_word = word
-            
-            return best_word
+            # Entropie simplifiée : nombre de groupes différents (plus = mieux)
+            best = tied[int(np.argmax(scores.n_groups[tied]))]
+            return words[scores.guess_ids[best]]
         
         elif self.tie_breaker == "frequency":
             # Choisir le mot avec les lettres les plus fréquentes
@@ -175,18 +141,6 @@ class MinimaxStrategy(BaseStrategy):
         
         return tied_words[0]
     
-    def _simple_entropy(self, candidate: str, targets: Set[str]) -> float:
-        """Calcule une entropie simplifiée pour départager."""
-        pattern_counts = defaultdict(int)
-        
-        for target in targets:
-            feedback = generate_feedback(candidate, target)
-            pattern = feedback.to_pattern()
-            pattern_counts[pattern] += 1
-        
-        # Nombre de groupes différents (plus = mieux)
-        return len(pattern_counts)
-    
     def get_first_guess(self, language: str = "en") -> str:
         """
         Retourne le premier mot optimal selon minimax.
@@ -234,7 +188,7 @@ class ExpectedSizeStrategy(BaseStrategy):
     
     def __init__(self):
         super().__init__(name="Taille Espérée")
-        self._cache = {}
+        self._cache = self._new_scores_cache('expected_size_strategy')
     
     def choose_word(
         self,
@@ -250,52 +204,14 @@ class ExpectedSizeStrategy(BaseStrategy):
         if len(possible_words) <= 2:
             return sorted(possible_words)[0]
         
-        best_word = None
-        best_expected = float('inf')
-        
-        for candidate in possible_words:
-            expected = self._calculate_expected_size(candidate, possible_words)
-            
-            if expected < best_expected:
-                best_expected = expected
-                best_word = candidate
-        
-        self.stats['words_evaluated'] = len(possible_words)
-        return best_word
-    
-    def _calculate_expected_size(self, candidate: str, targets: Set[str]) -> float:
-        """
-        Calcule la taille moyenne attendue des groupes.
-        
-        Args:
-            candidate: Mot candidat
-            targets: Mots cibles possibles
-            
-        Returns:
-            Taille moyenne pondérée des groupes
-        """
-        cache_key = (candidate, frozenset(targets))
-        if cache_key in self._cache:
-            self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
-        
-        # Grouper par pattern
-        pattern_groups = defaultdict(list)
-        
-        for target in targets:
-            feedback = generate_feedback(candidate, target)
-            pattern = feedback.to_pattern()
-            pattern_groups[pattern].append(target)
-        
-        # Calculer la moyenne pondérée
-        n_total = len(targets)
-        expected = sum(
-            len(group) * len(group) / n_total
-            for group in pattern_groups.values()
-        )
+        # Taille espérée de chaque mot en un seul passage vectorisé
+        matrix = self._get_pattern_matrix(possible_words, **kwargs)
+        guess_ids = np.sort(matrix.ids(possible_words))
+        target_ids = matrix.ids(possible_words)
+        scores = self._score_guesses(matrix, guess_ids, target_ids, self._cache, kwargs.get('deadline'))
         
-        self._cache[cache_key] = expected
-        return expected
+        best = int(np.argmin(scores.expected_size))
+        return matrix.words[scores.guess_ids[best]]
     
     def explain_choice(
         self,
@@ -0,0 +1,149 @@
+"""
+Stratégie pour les variantes multi-grilles (Quordle, Octordle).
+
+Une tentative est jouée sur toutes les grilles à la fois : elle est donc
+évaluée contre tous les ensembles de candidats en un seul passage du noyau
+vectorisé (score_boards), qui additionne l'information gagnée sur chaque
+grille, au lieu d'une évaluation par grille.
+"""
+
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from .entropy_strategy import EntropyStrategy
+from ..csp import ConstraintManager, HybridSolver
+from ..game.multi_board import MultiBoardGame
+from ..utils.pattern_matrix import PatternMatrix
+from ..utils.scoring import score_boards
+
+
+class MultiBoardStrategy:
+    """
+    Choix d'une tentative commune à plusieurs grilles.
+    
+    Principe :
+    - Une grille dont il ne reste qu'un candidat est résolue immédiatement
+    - Sinon, chaque tentative est notée par la somme des entropies sur les
+      grilles non résolues, plus la probabilité de résoudre une grille
+      (tentative candidate sur cette grille) ; le critère 'minimax' minimise
+      plutôt le plus grand groupe restant toutes grilles confondues
+    """
+    
+    METRICS = ('entropy', 'minimax')
+    
+    def __init__(self, metric: str = 'entropy', use_full_dictionary: bool = True):
+        """
+        Initialise la stratégie multi-grilles.
+        
+        Args:
+            metric: 'entropy' (information totale) ou 'minimax' (pire cas)
+            use_full_dictionary: Si True, évalue aussi les mots hors candidats
+        """
+        if metric not in self.METRICS:
+            raise ValueError(f"Critère inconnu : {metric}")
+        self.name = f"Multi-grilles ({metric})"
+        self.metric = metric
+        self.use_full_dictionary = use_full_dictionary
+        self.stats = {'words_evaluated': 0, 'boards': 0}
+    
+    def get_first_guess(self, language: str = "en") -> str:
+        """Premier mot : le même que la stratégie d'entropie (grilles identiques au départ)."""
+        return EntropyStrategy().get_first_guess(language)
+    
+    def choose_word(
+        self,
+        candidate_sets: Sequence[Set[str]],
+        attempt_number: int,
+        **kwargs
+    ) -> Optional[str]:
+        """
+        Choisit la tentative commune aux grilles non résolues.
+        
+        Args:
+            candidate_sets: Mots encore possibles de chaque grille non résolue
+            attempt_number: Numéro de la tentative
+            **kwargs: Peut contenir 'full_dictionary' et 'pattern_matrix'
+        
+        Returns:
+            Le mot à jouer (None si aucune grille n'a de candidat)
+        """
+        boards = [words for words in candidate_sets if words]
+        if not boards:
+            return None
+        
+        # Une grille à un seul candidat : la résoudre sans perdre de tentative
+        singles = sorted(next(iter(words)) for words in boards if len(words) == 1)
+        if singles:
+            return singles[0]
+        
+        candidates = set().union(*boards)
+        if self.use_full_dictionary and kwargs.get('full_dictionary'):
+            guesses = set(kwargs['full_dictionary'])
+        else:
+            guesses = candidates
+        
+        matrix = kwargs.get('pattern_matrix')
+        if matrix is None or not matrix.covers(guesses | candidates):
+            matrix = PatternMatrix.for_words(guesses | candidates)
+        
+        guess_ids = np.sort(matrix.ids(guesses))
+        board_ids = [matrix.ids(words) for words in boards]
+        scores = score_boards(matrix, guess_ids, board_ids)
+        self.stats['words_evaluated'] = len(guess_ids)
+        self.stats['boards'] = len(boards)
+        
+        # Probabilité de résoudre une grille avec la tentative elle-même
+        solve_chance = np.zeros(len(guess_ids))
+        for words in boards:
+            solve_chance[np.isin(guess_ids, matrix.ids(words))] += 1.0 / len(words)
+        
+        if self.metric == 'entropy':
+            best = int(np.argmax(scores.entropy + solve_chance))
+        else:
+            best = int(np.lexsort((-solve_chance, scores.worst_case))[0])
+        return matrix.words[guess_ids[best]]
+    
+    def play(
+        self,
+        game: MultiBoardGame,
+        solver: HybridSolver,
+        language: str = "en",
+        pattern_matrix: Optional[PatternMatrix] = None
+    ) -> MultiBoardGame:
+        """
+        Joue une partie multi-grilles jusqu'à la fin.
+        
+        Args:
+            game: Partie à jouer
+            solver: Solveur hybride du dictionnaire
+            language: Langue (premier mot)
+            pattern_matrix: Matrice de patterns du dictionnaire (optionnelle)
+        
+        Returns:
+            La partie terminée
+        """
+        managers: Dict[int, ConstraintManager] = {i: ConstraintManager() for i in range(game.n_boards)}
+        
+        while not game.is_over:
+            unsolved = game.unsolved_boards()
+            guess = self.get_first_guess(language) if game.get_attempt_number() == 1 else None
+            if guess not in solver.word_filter.full_dictionary:
+                candidate_sets: List[Set[str]] = [solver.solve(managers[i]) for i in unsolved]
+                guess = self.choose_word(
+                    candidate_sets,
+                    game.get_attempt_number(),
+                    full_dictionary=solver.word_filter.full_dictionary,
+                    pattern_matrix=pattern_matrix
+                )
+            if guess is None:
+                break
+            
+            for i, feedback in enumerate(game.make_guess(guess)):
+                if feedback is not None:
+                    managers[i].apply_feedback(feedback)
+        
+        return game
+    
+    def __repr__(self) -> str:
+        return f"MultiBoardStrategy(metric='{self.metric}')"
@@ -0,0 +1,365 @@
+"""
+Livre d'ouvertures pré-calculé pour les stratégies Wordle.
+
+Le livre est l'arbre de décision d'une stratégie sur un dictionnaire :
+premier mot → pattern → deuxième mot → pattern → ... jusqu'à une
+profondeur donnée. Il est calculé une fois hors ligne, sauvegardé dans un
+fichier .npz compact, puis consulté en O(1) par tour de jeu.
+
+Format (tableaux plats, parcours en largeur) :
+- guesses[n] : indice dans vocabulary du mot joué au nœud n
+- counts[n] : nombre de candidats au nœud n (contrôle de cohérence)
+- offsets[n]:offsets[n+1] : arêtes sortantes du nœud n
+- codes[e] : code de pattern (0..242) de l'arête e ; l'arête e mène au nœud e + 1
+"""
+
+import argparse
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ..csp import ConstraintManager, HybridSolver
+from ..dictionaries.word_table import words_digest
+from ..game.feedback import FeedbackResult, all_correct_code
+from ..utils.pattern_matrix import PatternMatrix, pattern_dtype
+
+
+class OpeningBook:
+    """
+    Arbre de décision pré-calculé d'une stratégie.
+
+    Attributs principaux :
+    - language : langue du dictionnaire
+    - strategy_name : nom de la stratégie ayant produit le livre
+    - digest : empreinte du dictionnaire (voir PatternMatrix)
+    - max_depth : nombre de tentatives couvertes
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        vocabulary: Sequence[str],
+        guesses: np.ndarray,
+        counts: np.ndarray,
+        offsets: np.ndarray,
+        codes: np.ndarray,
+        language: str = "en",
+        strategy_name: str = "",
+        digest: str = "",
+        max_depth: int = 0
+    ):
+        """
+        Initialise le livre à partir de ses tableaux.
+
+        Args:
+            vocabulary: Mots joués dans le livre (triés)
+            guesses: Mot joué par nœud (indice dans vocabulary)
+            counts: Nombre de candidats par nœud
+            offsets: Début des arêtes de chaque nœud (taille nœuds + 1)
+            codes: Code de pattern de chaque arête (3^L codes : uint16 au-delà de 5 lettres)
+            language: Langue du dictionnaire
+            strategy_name: Nom de la stratégie
+            digest: Empreinte du dictionnaire
+            max_depth: Nombre de tentatives couvertes
+        """
+        self.vocabulary = tuple(vocabulary)
+        self.guesses = np.asarray(guesses, dtype=np.int32)
+        self.counts = np.asarray(counts, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int32)
+        dtype = pattern_dtype(len(self.vocabulary[0])) if self.vocabulary else pattern_dtype()
+        self.codes = np.asarray(codes, dtype=dtype)
+        self.language = language
+        self.strategy_name = strategy_name
+        self.digest = digest
+        self.max_depth = max_depth
+
+        # (nœud, code) -> nœud enfant
+        self._children: Dict[Tuple[int, int], int] = {}
+        for node in range(len(self.guesses)):
+            for edge in range(self.offsets[node], self.offsets[node + 1]):
+                self._children[(node, int(self.codes[edge]))] = edge + 1
+
+    @property
+    def first_guess(self) -> Optional[str]:
+        """Premier mot du livre."""
+        if len(self.guesses) == 0:
+            return None
+        return self.vocabulary[self.guesses[0]]
+
+    def matches(self, dictionary: Set[str]) -> bool:
+        """Vérifie que le livre a été calculé pour ce dictionnaire."""
+        return self.digest == _dictionary_digest(dictionary)
+
+    def lookup(self, history: Sequence[FeedbackResult], n_candidates: Optional[int] = None) -> Optional[str]:
+        """
+        Retourne le mot du livre pour un historique de feedbacks.
+
+        Args:
+            history: Feedbacks déjà reçus (ConstraintManager.history)
+            n_candidates: Nombre de candidats restants (contrôle optionnel)
+
+        Returns:
+            Le mot à jouer, ou None si l'état est hors du livre
+        """
+        if len(self.guesses) == 0:
+            return None
+
+        node = 0
+        for feedback in history:
+            if self.vocabulary[self.guesses[node]] != feedback.guess:
+                return None
+            node = self._children.get((node, feedback.code))
+            if node is None:
+                return None
+
+        if n_candidates is not None and self.counts[node] != n_candidates:
+            return None
+
+        return self.vocabulary[self.guesses[node]]
+
+    @classmethod
+    def build(
+        cls,
+        strategy,
+        dictionary: Set[str],
+        language: str = "en",
+        max_depth: int = 3,
+        pattern_matrix: Optional[PatternMatrix] = None,
+        verbose: bool = False
+    ) -> "OpeningBook":
+        """
+        Calcule le livre en parcourant l'arbre de jeu de la stratégie.
+
+        Les choix reproduisent exactement ceux d'une partie jouée par
+        StrategyComparator (même premier mot, mêmes arguments).
+
+        Args:
+            strategy: Stratégie à pré-calculer
+            dictionary: Dictionnaire de mots valides
+            language: Langue ('en' ou 'fr')
+            max_depth: Nombre de tentatives couvertes (1 = premier mot seul)
+            pattern_matrix: Matrice de patterns du dictionnaire (optionnelle)
+            verbose: Afficher la progression
+
+        Returns:
+            Le livre d'ouvertures
+        """
+        start_time = time.time()
+        solver = HybridSolver(dictionary)
+        matrix = pattern_matrix if pattern_matrix is not None else PatternMatrix.for_words(dictionary)
+        all_correct = all_correct_code(matrix.word_length)
+
+        # Le livre ne doit pas se consulter lui-même pendant la construction
+        saved_books = strategy.opening_books
+        strategy.opening_books = {}
+
+        guess_words: List[str] = []
+        counts: List[int] = []
+        offsets: List[int] = [0]
+        codes: List[int] = []
+
+        try:
+            # File : (gestionnaire de contraintes, numéro de tentative, candidats)
+            root = ConstraintManager()
+            queue = deque([(root, 1, solver.get_possible_words(root))])
+
+            while queue:
+                cm, attempt, possible_words = queue.popleft()
+                guess = cls._choose(strategy, possible_words, cm, attempt, dictionary, language, matrix)
+
+                guess_words.append(guess)
+                counts.append(len(possible_words))
+
+                if attempt < max_depth and len(possible_words) > 1:
+                    target_ids = matrix.ids(possible_words)
+                    for code in np.unique(matrix.matrix[matrix.index[guess], target_ids]):
+                        if code == all_correct:
+                            continue
+                        child = cm.copy()
+                        child.apply_feedback(FeedbackResult.from_code(guess, int(code)))
+                        child_words = solver.get_possible_words(child)
+                        if child_words:
+                            codes.append(int(code))
+                            queue.append((child, attempt + 1, child_words))
+
+                offsets.append(len(codes))
+
+                if verbose and len(counts) % 500 == 0:
+                    print(f"  {len(counts)} nœuds calculés ({len(queue)} en attente)...")
+        finally:
+            strategy.opening_books = saved_books
+
+        vocabulary = sorted(set(guess_words))
+        position = {word: i for i, word in enumerate(vocabulary)}
+
+        book = cls(
+            vocabulary=vocabulary,
+            guesses=np.array([position[word] for word in guess_words], dtype=np.int32),
+            counts=np.array(counts, dtype=np.int32),
+            offsets=np.array(offsets, dtype=np.int32),
+            codes=np.array(codes, dtype=pattern_dtype(matrix.word_length)),
+            language=language,
+            strategy_name=strategy.name,
+            digest=_dictionary_digest(dictionary),
+            max_depth=max_depth
+        )
+
+        if verbose:
+            print(f"  ✓ {len(book)} nœuds en {time.time() - start_time:.1f}s")
+
+        return book
+
+    @staticmethod
+    def _choose(strategy, possible_words, cm, attempt, dictionary, language, matrix) -> str:
+        """Choisit le mot d'un nœud comme le ferait une partie réelle."""
+        if attempt == 1:
+            guess = strategy.get_first_guess(language)
+            if guess not in dictionary:
+                guess = sorted(possible_words)[0]
+            return guess
+
+        guess = strategy.choose_word(
+            possible_words,
+            cm,
+            attempt,
+            full_dictionary=dictionary,
+            pattern_matrix=matrix
+        )
+        return guess or sorted(possible_words)[0]
+
+    def save(self, path: Union[str, Path]):
+        """
+        Sauvegarde le livre dans un fichier .npz compressé.
+
+        Args:
+            path: Chemin du fichier
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                vocabulary=np.array(self.vocabulary, dtype=str),
+                guesses=self.guesses,
+                counts=self.counts,
+                offsets=self.offsets,
+                codes=self.codes,
+                meta=np.array([
+                    str(self.FORMAT_VERSION), self.language, self.strategy_name,
+                    self.digest, str(self.max_depth)
+                ], dtype=str)
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "OpeningBook":
+        """
+        Charge un livre sauvegardé.
+
+        Args:
+            path: Chemin du fichier
+
+        Returns:
+            Le livre d'ouvertures
+
+        Raises:
+            ValueError: Si le format du fichier n'est pas reconnu
+        """
+        with np.load(path, allow_pickle=False) as data:
+            version, language, strategy_name, digest, max_depth = (str(value) for value in data['meta'])
+            if int(version) != cls.FORMAT_VERSION:
+                raise ValueError(f"Version de livre non supportée : {version}")
+
+            return cls(
+                vocabulary=[str(word) for word in data['vocabulary']],
+                guesses=data['guesses'],
+                counts=data['counts'],
+                offsets=data['offsets'],
+                codes=data['codes'],
+                language=language,
+                strategy_name=strategy_name,
+                digest=digest,
+                max_depth=int(max_depth)
+            )
+
+    @staticmethod
+    def default_path(strategy_id: str, language: str) -> Path:
+        """
+        Chemin par défaut d'un livre (dossier 'books' du cache).
+
+        Args:
+            strategy_id: Identifiant court de la stratégie ('entropy', ...)
+            language: Langue
+
+        Returns:
+            Chemin du fichier .npz
+        """
+        return PatternMatrix.default_cache_dir() / 'books' / f"{strategy_id}_{language}.npz"
+
+    def __len__(self) -> int:
+        return len(self.guesses)
+
+    def __repr__(self) -> str:
+        return (
+            f"OpeningBook(strategy='{self.strategy_name}', language='{self.language}', "
+            f"nodes={len(self)}, depth={self.max_depth})"
+        )
+
+
+def _dictionary_digest(dictionary: Set[str]) -> str:
+    """Empreinte d'un dictionnaire (identique à celle de PatternMatrix)."""
+    return words_digest(sorted({word.upper() for word in dictionary}))
+
+
+def _strategy_factories():
+    """Stratégies disponibles pour le constructeur en ligne de commande."""
+    from .frequency_strategy import FrequencyStrategy, PositionalFrequencyStrategy
+    from .entropy_strategy import EntropyStrategy, FastEntropyStrategy
+    from .minimax_strategy import MinimaxStrategy, ExpectedSizeStrategy
+
+    return {
+        'frequency': FrequencyStrategy,
+        'positional': PositionalFrequencyStrategy,
+        'entropy': lambda: EntropyStrategy(max_words_to_evaluate=100),
+        'fast-entropy': FastEntropyStrategy,
+        'minimax': MinimaxStrategy,
+        'expected-size': ExpectedSizeStrategy,
+    }
+
+
+def main():
+    """Construit un livre d'ouvertures hors ligne."""
+    from ..dictionaries import LanguageRegistry
+
+    factories = _strategy_factories()
+
+    parser = argparse.ArgumentParser(description="Construit un livre d'ouvertures Wordle")
+    parser.add_argument('--strategy', choices=sorted(factories), default='entropy', help='Stratégie')
+    parser.add_argument('--language', choices=['en', 'fr'], default='en', help='Langue')
+    parser.add_argument('--depth', type=int, default=3, help='Nombre de tentatives couvertes')
+    parser.add_argument('--output', help='Fichier de sortie (défaut : dossier de cache)')
+    args = parser.parse_args()
+
+    data = LanguageRegistry.get(args.language)
+    strategy = factories[args.strategy]()
+
+    print(f"Construction du livre '{args.strategy}' ({args.language}, profondeur {args.depth})...")
+    book = OpeningBook.build(
+        strategy,
+        data.words,
+        language=args.language,
+        max_depth=args.depth,
+        pattern_matrix=data.pattern_matrix,
+        verbose=True
+    )
+
+    output = Path(args.output) if args.output else OpeningBook.default_path(args.strategy, args.language)
+    book.save(output)
+    print(f"Livre sauvegardé : {output} ({output.stat().st_size / 1024:.1f} Ko)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""
+Stratégie optimale exacte pour Wordle.
+
+Cherche, par exploration complète de l'arbre de jeu bornée en profondeur,
+la stratégie qui minimise le nombre TOTAL (donc moyen) de tentatives sur un
+ensemble de réponses possibles :
+
+    F(S) = min_g [ |S| + Σ_p F(S_p) ]
+
+où S_p est le sous-ensemble de S (privé de g) qui donne le pattern p.
+
+Optimisations :
+- mémoïsation des sous-problèmes sur l'empreinte de l'ensemble restant
+- bornes inférieures : une réponse coûte au moins 1 tentative, et au moins
+  2 si elle n'est pas le mot joué, d'où F(S_p) >= 2|S_p| - 1
+- élagage alpha : l'évaluation d'une tentative s'arrête dès que son coût
+  partiel plus la borne des groupes restants dépasse le meilleur connu
+- candidats ordonnés par entropie (noyau vectorisé score_guesses)
+- premier niveau évalué en parallèle sur plusieurs processus
+"""
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .base_strategy import BaseStrategy, QUALITY_HEURISTIC
+from .comparator import _pool_context
+from .opening_book import OpeningBook, _dictionary_digest
+from ..csp import ConstraintManager
+from ..game.feedback import all_correct_code
+from ..utils.cache import ids_digest
+from ..utils.pattern_matrix import PatternMatrix, pattern_dtype
+from ..utils.scoring import pattern_histograms
+
+
+INF = math.inf
+
+
+class DeadlineExceeded(Exception):
+    """Échéance atteinte pendant la recherche."""
+
+
+@dataclass
+class OptimalResult:
+    """Résultat d'une résolution optimale."""
+    first_guess: str
+    total_guesses: float
+    n_answers: int
+    time_taken: float
+    tree: OpeningBook
+    
+    @property
+    def expected_guesses(self) -> float:
+        """Nombre moyen de tentatives (réponses équiprobables)."""
+        return self.total_guesses / self.n_answers if self.n_answers else 0.0
+
+
+class OptimalSolver:
+    """
+    Recherche exacte du coût optimal sur une matrice de patterns.
+    
+    Les ensembles de réponses sont des tableaux triés d'identifiants de la
+    matrice ; les tentatives autorisées sont un tableau d'identifiants fixe.
+    """
+    
+    def __init__(
+        self,
+        matrix: PatternMatrix,
+        guess_ids: np.ndarray,
+        max_candidates: Optional[int] = None
+    ):
+        """
+        Initialise le solveur.
+        
+        Args:
+            matrix: Matrice de patterns couvrant tentatives et réponses
+            guess_ids: Identifiants des tentatives autorisées
+            max_candidates: Nombre maximum de tentatives explorées par nœud,
+                            les meilleures en entropie (None = exact)
+        """
+        self.matrix = matrix
+        self.codes = matrix.matrix
+        self.all_correct = all_correct_code(matrix.word_length)
+        self.guess_ids = np.sort(np.asarray(guess_ids, dtype=np.int64))
+        self.max_candidates = max_candidates
+        
+        # (empreinte, profondeur) -> (coût exact, meilleure tentative)
+        self.exact: Dict[Tuple[bytes, int], Tuple[float, int]] = {}
+        # (empreinte, profondeur) -> borne inférieure prouvée
+        self.lower: Dict[Tuple[bytes, int], float] = {}
+        self.nodes = 0
+        
+        # Échéance absolue (time.time()) de la recherche en cours
+        self.deadline: Optional[float] = None
+    
+    def candidates(self, answer_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tentatives utiles d'un nœud, ordonnées par entropie décroissante.
+        
+        Args:
+            answer_ids: Réponses encore possibles (triées)
+        
+        Returns:
+            Tuple (tentatives, bornes inférieures de leur coût total)
+        """
+        n = len(answer_ids)
+        counts = pattern_histograms(self.matrix, self.guess_ids, answer_ids)
+        
+        in_set = counts[:, self.all_correct] > 0
+        groups = np.count_nonzero(counts, axis=1) - in_set
+        # Une tentative hors de S qui ne sépare rien est inutile
+        useful = in_set | (groups > 1)
+        
+        probabilities = counts / n
+        logs = np.log2(np.where(probabilities > 0, probabilities, 1.0))
+        entropy = -(probabilities * logs).sum(axis=1)
+        
+        # |S| + Σ_p (2|S_p| - 1)
+        bounds = n + 2 * (n - in_set) - groups
+        
+        order = np.flatnonzero(useful)
+        order = order[np.lexsort((bounds[order], -entropy[order]))]
+        if self.max_candidates is not None:
+            order = order[:self.max_candidates]
+        
+        return self.guess_ids[order], bounds[order].astype(float)
+    
+    def split(self, guess_id: int, answer_ids: np.ndarray) -> List[np.ndarray]:
+        """
+        Partitionne les réponses selon le pattern obtenu (hors mot trouvé).
+        
+        Args:
+            guess_id: Tentative jouée
+            answer_ids: Réponses possibles (triées)
+        
+        Returns:
+            Groupes de réponses (triés), du plus grand au plus petit
+        """
+        codes = self.codes[guess_id, answer_ids]
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+        groups = [
+            answer_ids[part] for part, code in zip(
+                np.split(order, bounds),
+                sorted_codes[np.concatenate(([0], bounds))] if len(order) else []
+            )
+            if code != self.all_correct
+        ]
+        groups.sort(key=len, reverse=True)
+        return groups
+    
+    def solve(self, answer_ids: np.ndarray, depth: int, budget: float = INF) -> Tuple[float, Optional[int]]:
+        """
+        Calcule le coût total minimal d'un ensemble de réponses.
+        
+        Args:
+            answer_ids: Réponses possibles (triées)
+            depth: Nombre de tentatives encore autorisées
+            budget: Coût au-delà duquel la recherche est abandonnée
+        
+        Returns:
+            Tuple (coût, tentative). Si le coût est >= budget, c'est
+            seulement une borne inférieure et la tentative est None.
+        """
+        n = len(answer_ids)
+        if n == 1:
+            return 1, int(answer_ids[0])
+        if depth <= 1:
+            return INF, None
+        if n == 2:
+            return 3, int(answer_ids[0])
+        
+        key = (ids_digest(answer_ids), depth)
+        known = self.exact.get(key)
+        if known is not None:
+            return known
+        lower = self.lower.get(key, 0)
+        if lower >= budget:
+            return lower, None
+        
+        if self.deadline is not None and time.time() > self.deadline:
+            raise DeadlineExceeded()
+        
+        self.nodes += 1
+        guesses, bounds = self.candidates(answer_ids)
+        
+        best, best_guess = budget, None
+        for guess, bound in zip(guesses, bounds):
+            if bound >= best:
+                continue
+            cost = self.evaluate(int(guess), answer_ids, depth, best, bound)
+            if cost < best:
+                best, best_guess = cost, int(guess)
+        
+        if best_guess is None:
+            self.lower[key] = max(lower, budget)
+            return max(lower, budget), None
+        
+        self.exact[key] = (best, best_guess)
+        return best, best_guess
+    
+    def evaluate(
+        self,
+        guess_id: int,
+        answer_ids: np.ndarray,
+        depth: int,
+        budget: float = INF,
+        bound: Optional[float] = None
+    ) -> float:
+        """
+        Coût total d'un ensemble si l'on joue d'abord guess_id.
+        
+        Args:
+            guess_id: Tentative jouée
+            answer_ids: Réponses possibles (triées)
+            depth: Nombre de tentatives autorisées (celle-ci comprise)
+            budget: Coût au-delà duquel l'évaluation est abandonnée
+            bound: Borne inférieure déjà connue (optionnelle)
+        
+        Returns:
+            Coût exact, ou valeur >= budget si abandonnée
+        """
+        groups = self.split(guess_id, answer_ids)
+        total = len(answer_ids)
+        remaining = sum(2 * len(group) - 1 for group in groups)
+        
+        for group in groups:
+            remaining -= 2 * len(group) - 1
+            cost, _ = self.solve(group, depth - 1, budget - total - remaining)
+            total += cost
+            if total + remaining >= budget:
+                return max(total + remaining, budget)
+        
+        return total
+    
+    def best_guess(self, answer_ids: np.ndarray, depth: int) -> Optional[int]:
+        """Meilleure tentative d'un nœud (résolu si besoin)."""
+        n = len(answer_ids)
+        if n <= 2:
+            return int(answer_ids[0])
+        _, guess = self.solve(answer_ids, depth)
+        return guess
+
+
+# État d'un processus worker : solveur hérité par fork
+_worker_solver: Optional[OptimalSolver] = None
+
+
+def _init_worker(solver: OptimalSolver):
+    """Installe le solveur dans le processus worker."""
+    global _worker_solver
+    _worker_solver = solver
+
+
+def _evaluate_in_worker(args: Tuple[int, np.ndarray, int, float]) -> float:
+    """Évalue une tentative de premier niveau dans le processus worker."""
+    guess_id, answer_ids, depth, budget = args
+    return _worker_solver.evaluate(guess_id, answer_ids, depth, budget)
+
+
+class OptimalStrategy(BaseStrategy):
+    """
+    Stratégie optimale : minimise le nombre espéré de tentatives.
+    
+    Contrairement à l'entropie (heuristique gloutonne sur un coup), elle
+    explore tout l'arbre de jeu jusqu'à max_guesses tentatives. Coûteuse :
+    elle est faite pour calculer hors ligne un arbre de décision (solve)
+    qui sert ensuite de livre d'ouvertures et de référence pour les
+    benchmarks.
+    """
+    
+    def __init__(
+        self,
+        max_guesses: int = 6,
+        max_candidates: Optional[int] = None,
+        workers: Optional[int] = 1,
+        candidates_only: bool = False
+    ):
+        """
+        Initialise la stratégie.
+        
+        Args:
+            max_guesses: Nombre maximum de tentatives d'une partie
+            max_candidates: Tentatives explorées par nœud (None = recherche exacte)
+            workers: Processus pour le premier niveau (1 = séquentiel, None = tous les cœurs)
+            candidates_only: Ne jouer que des mots encore possibles
+        """
+        super().__init__(name="Optimale")
+        self.max_guesses = max_guesses
+        self.max_candidates = max_candidates
+        self.workers = workers
+        self.candidates_only = candidates_only
+        self._solver: Optional[OptimalSolver] = None
+        self._solver_key = None
+    
+    def _get_solver(self, matrix: PatternMatrix, guess_ids: np.ndarray) -> OptimalSolver:
+        """Retourne le solveur (et sa mémoïsation) pour ces tentatives."""
+        key = (matrix.digest, ids_digest(guess_ids))
+        if self._solver is None or self._solver_key != key:
+            self._solver = OptimalSolver(matrix, guess_ids, self.max_candidates)
+            self._solver_key = key
+        return self._solver
+    
+    def choose_word(
+        self,
+        possible_words: Set[str],
+        constraint_manager: ConstraintManager,
+        attempt_number: int,
+        **kwargs
+    ) -> Optional[str]:
+        """
+        Choisit la tentative optimale pour les mots possibles.
+        
+        Args:
+            possible_words: Mots encore possibles (réponses)
+            constraint_manager: Gestionnaire de contraintes
+            attempt_number: Numéro de la tentative
+            **kwargs: Peut contenir 'pattern_matrix', 'guess_words'
+                      (tentatives autorisées, défaut : mots possibles)
+                      et 'deadline' (échéance, voir BaseStrategy)
+        
+        Returns:
+            La tentative qui minimise le nombre espéré de tentatives
+        """
+        if not possible_words:
+            return None
+        
+        if len(possible_words) <= 2:
+            return sorted(possible_words)[0]
+        
+        guess_words = possible_words if self.candidates_only else kwargs.get('guess_words', possible_words)
+        matrix = self._get_pattern_matrix(set(guess_words) | set(possible_words), **kwargs)
+        solver = self._get_solver(matrix, matrix.ids(guess_words))
+        answer_ids = np.sort(matrix.ids(possible_words))
+        
+        depth = max(2, self.max_guesses - attempt_number + 1)
+        solver.deadline = kwargs.get('deadline')
+        try:
+            guess = solver.best_guess(answer_ids, depth)
+            if guess is None:
+                # Impossible de garantir la victoire dans le temps imparti
+                guess = solver.best_guess(answer_ids, len(answer_ids))
+        except DeadlineExceeded:
+            # Recherche interrompue (les sous-problèmes résolus restent
+            # mémoïsés) : meilleur mot en entropie
+            guesses, _ = solver.candidates(answer_ids)
+            guess = int(guesses[0]) if len(guesses) else int(answer_ids[0])
+            self.stats['quality'] = QUALITY_HEURISTIC
+        finally:
+            solver.deadline = None
+        
+        self.stats['words_evaluated'] = solver.nodes
+        return matrix.words[guess]
+    
+    def solve(
+        self,
+        answers: Set[str],
+        guesses: Optional[Set[str]] = None,
+        language: str = "en",
+        pattern_matrix: Optional[PatternMatrix] = None,
+        verbose: bool = False
+    ) -> OptimalResult:
+        """
+        Calcule la stratégie optimale complète et son arbre de décision.
+        
+        L'arbre est un OpeningBook : strategy.use_opening_book(result.tree)
+        rejoue la stratégie optimale en O(1) par tour (par exemple dans
+        StrategyComparator avec answers comme dictionnaire).
+        
+        Args:
+            answers: Réponses possibles
+            guesses: Tentatives autorisées (défaut : les réponses)
+            language: Langue (enregistrée dans l'arbre)
+            pattern_matrix: Matrice couvrant réponses et tentatives (optionnelle)
+            verbose: Afficher la progression
+        
+        Returns:
+            OptimalResult (premier mot, coût total, arbre)
+        """
+        start_time = time.time()
+        guesses = set(answers) if guesses is None or self.candidates_only else set(guesses)
+        words = guesses | set(answers)
+        matrix = pattern_matrix if pattern_matrix is not None and pattern_matrix.covers(words) \
+            else PatternMatrix.for_words(words)
+        solver = self._get_solver(matrix, matrix.ids(guesses))
+        answer_ids = np.sort(matrix.ids(answers))
+        
+        total, first = self._solve_root(solver, answer_ids, verbose)
+        if first is None:
+            raise ValueError(f"Aucune stratégie ne résout ces mots en {self.max_guesses} tentatives")
+        
+        tree = self._build_tree(solver, answer_ids, first, answers, language)
+        self.opening_books[language] = tree
+        
+        result = OptimalResult(
+            first_guess=matrix.words[first],
+            total_guesses=total,
+            n_answers=len(answer_ids),
+            time_taken=time.time() - start_time,
+            tree=tree
+        )
+        
+        if verbose:
+            print(
+                f"  ✓ {result.first_guess} : {result.expected_guesses:.4f} tentatives en moyenne "
+                f"({solver.nodes} nœuds, {result.time_taken:.1f}s)"
+            )
+        
+        return result
+    
+    def _solve_root(self, solver: OptimalSolver, answer_ids: np.ndarray, verbose: bool) -> Tuple[float, Optional[int]]:
+        """Résout la racine, en parallèle sur les premiers mots si demandé."""
+        workers = self.workers
+        if workers is None:
+            import os
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1 or len(answer_ids) <= 2:
+            return solver.solve(answer_ids, self.max_guesses)
+        
+        guesses, bounds = solver.candidates(answer_ids)
+        if len(guesses) == 0:
+            return INF, None
+        
+        # Le coût exact du meilleur mot en entropie sert de borne à tous les workers
+        # (et le fork leur transmet les sous-problèmes déjà mémoïsés)
+        first = int(guesses[0])
+        total = solver.evaluate(first, answer_ids, self.max_guesses)
+        
+        tasks = [
+            (int(guess), answer_ids, self.max_guesses, total)
+            for guess, bound in zip(guesses[1:], bounds[1:])
+            if bound < total
+        ]
+        if tasks:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=(solver,)
+            ) as executor:
+                costs = list(executor.map(_evaluate_in_worker, tasks))
+            
+            # Premier mot de coût minimal, à égalité dans l'ordre des candidats
+            best = int(np.argmin(costs))
+            if costs[best] < total:
+                first = tasks[best][0]
+                # Recalcul local du sous-arbre retenu (pour l'arbre de décision)
+                total = solver.evaluate(first, answer_ids, self.max_guesses)
+        
+        if verbose:
+            print(f"  {len(tasks) + 1} premiers mots évalués sur {workers} processus")
+        
+        if total == INF:
+            return INF, None
+        solver.exact[(ids_digest(answer_ids), self.max_guesses)] = (total, first)
+        return total, first
+    
+    def _build_tree(
+        self,
+        solver: OptimalSolver,
+        answer_ids: np.ndarray,
+        first: int,
+        answers: Set[str],
+        language: str
+    ) -> OpeningBook:
+        """Parcourt la stratégie optimale en largeur et la stocke en OpeningBook."""
+        words = solver.matrix.words
+        guess_words: List[str] = []
+        counts: List[int] = []
+        offsets: List[int] = [0]
+        codes: List[int] = []
+        
+        queue = [(answer_ids, self.max_guesses, first)]
+        position = 0
+        while position < len(queue):
+            ids, depth, guess = queue[position]
+            position += 1
+            if guess is None:
+                guess = solver.best_guess(ids, depth)
+            
+            guess_words.append(words[guess])
+            counts.append(len(ids))
+            
+            for group in sorted(solver.split(guess, ids), key=lambda g: solver.codes[guess, g[0]]):
+                codes.append(int(solver.codes[guess, group[0]]))
+                queue.append((group, depth - 1, None))
+            offsets.append(len(codes))
+        
+        vocabulary = sorted(set(guess_words))
+        index = {word: i for i, word in enumerate(vocabulary)}
+        
+        return OpeningBook(
+            vocabulary=vocabulary,
+            guesses=np.array([index[word] for word in guess_words], dtype=np.int32),
+            counts=np.array(counts, dtype=np.int32),
+            offsets=np.array(offsets, dtype=np.int32),
+            codes=np.array(codes, dtype=pattern_dtype(solver.matrix.word_length)),
+            language=language,
+            strategy_name=self.name,
+            digest=_dictionary_digest(answers),
+            max_depth=self.max_guesses
+        )
+    
+    def get_first_guess(self, language: str = "en") -> str:
+        """Premier mot de l'arbre optimal s'il a été calculé."""
+        book = self.opening_books.get(language)
+        if book is not None and book.first_guess:
+            return book.first_guess
+        return super().get_first_guess(language)
+    
+    def reset_cache(self):
+        """Oublie les sous-problèmes mémoïsés."""
+        self._solver = None
+        self._solver_key = None
+    
+    def explain_choice(
+        self,
+        chosen_word: str,
+        possible_words: Set[str],
+        **kwargs
+    ) -> str:
+        return (
+            f"Stratégie Optimale : '{chosen_word}' minimise le nombre espéré de tentatives "
+            f"(recherche exhaustive parmi {len(possible_words)} mots)"
+        )
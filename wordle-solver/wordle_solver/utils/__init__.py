@@ -1,3 +1,42 @@
 """Module utilitaire."""
 
-__all__ = []
+from .pattern_matrix import PatternMatrix
+from ..game.feedback import (
+    N_PATTERNS,
+    ALL_CORRECT,
+    encode_feedbacks,
+    pattern_to_code,
+    code_to_pattern,
+)
+from .cache import LRUCache, cache_stats, ids_digest, words_digest
+from . import metrics
+from .scoring import (
+    GuessScores,
+    pattern_histograms,
+    score_guesses,
+    score_guesses_until,
+    frequency_priority,
+    board_histograms,
+    score_boards,
+)
+
+__all__ = [
+    'PatternMatrix',
+    'N_PATTERNS',
+    'ALL_CORRECT',
+    'encode_feedbacks',
+    'pattern_to_code',
+    'code_to_pattern',
+    'LRUCache',
+    'cache_stats',
+    'ids_digest',
+    'words_digest',
+    'GuessScores',
+    'pattern_histograms',
+    'score_guesses',
+    'score_guesses_until',
+    'frequency_priority',
+    'board_histograms',
+    'score_boards',
+    'metrics',
+]
@@ -0,0 +1,200 @@
+"""
+Module de cache LRU borné partagé par le filtre et les stratégies.
+
+Chaque cache est limité en nombre d'entrées et, optionnellement, en taille
+mémoire estimée. Les compteurs (hits, misses, évictions) de tous les caches
+vivants sont agrégés par nom via cache_stats().
+"""
+
+import hashlib
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+
+_MISSING = object()
+_caches: "weakref.WeakSet[LRUCache]" = weakref.WeakSet()
+
+
+def _default_sizeof(key: Hashable, value: Any) -> int:
+    """Estime la taille mémoire (octets) d'une entrée."""
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(key, tuple):
+        size += sum(sys.getsizeof(part) for part in key)
+    return size
+
+
+def ids_digest(ids: np.ndarray) -> bytes:
+    """
+    Calcule une empreinte compacte d'un ensemble d'identifiants.
+
+    Args:
+        ids: Identifiants de mots (ordre quelconque)
+
+    Returns:
+        Empreinte de 16 octets, indépendante de l'ordre
+    """
+    ordered = np.sort(np.asarray(ids, dtype=np.int64))
+    return hashlib.blake2b(ordered.tobytes(), digest_size=16).digest()
+
+
+def words_digest(words: Iterable[str]) -> bytes:
+    """
+    Calcule une empreinte compacte d'un ensemble de mots.
+
+    Args:
+        words: Mots (ordre quelconque)
+
+    Returns:
+        Empreinte de 16 octets, indépendante de l'ordre
+    """
+    return hashlib.blake2b('\n'.join(sorted(words)).encode('utf-8'), digest_size=16).digest()
+
+
+class LRUCache:
+    """
+    Cache LRU borné en entrées et en octets, avec compteurs.
+
+    S'utilise comme un dictionnaire réduit : get(), put(), clear().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Hashable, Any], int] = _default_sizeof
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            name: Nom du cache (clé d'agrégation des statistiques)
+            max_entries: Nombre maximum d'entrées
+            max_bytes: Taille mémoire maximum estimée (None = illimitée)
+            sizeof: Fonction d'estimation de la taille d'une entrée
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _caches.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retourne la valeur associée à une clé (et la marque comme récente).
+
+        Args:
+            key: Clé recherchée
+            default: Valeur retournée si absente
+
+        Returns:
+            Valeur en cache ou default
+        """
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Ajoute ou remplace une entrée, puis évince les plus anciennes.
+
+        Args:
+            key: Clé
+            value: Valeur
+        """
+        if key in self._data:
+            self.bytes -= self._sizes[key]
+
+        size = self._sizeof(key, value)
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._sizes[key] = size
+        self.bytes += size
+
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            old_key, _ = self._data.popitem(last=False)
+            self.bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)."""
+        self._data.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache."""
+        return {
+            'name': self.name,
+            'entries': len(self._data),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sérialisé vide (processus workers en spawn) : seule la configuration voyage
+        return {
+            'name': self.name,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'sizeof': self._sizeof,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"LRUCache(name='{self.name}', entries={len(self._data)}/{self.max_entries}, bytes={self.bytes})"
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """
+    Agrège les statistiques de tous les caches vivants par nom.
+
+    Returns:
+        Liste de dictionnaires (un par nom de cache), triée par nom
+    """
+    totals: Dict[str, Dict[str, Any]] = {}
+
+    for cache in list(_caches):
+        stats = cache.stats()
+        total = totals.setdefault(stats['name'], {
+            'name': stats['name'],
+            'instances': 0,
+            'entries': 0,
+            'bytes': 0,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        })
+        total['instances'] += 1
+        for field in ('entries', 'bytes', 'hits', 'misses', 'evictions'):
+            total[field] += stats[field]
+
+    return [totals[name] for name in sorted(totals)]
@@ -0,0 +1,274 @@
+"""
+Module d'instrumentation des chemins critiques.
+
+Des minuteurs (time.perf_counter_ns) mesurent les phases du calcul d'une
+suggestion : chargement du dictionnaire et de la matrice, filtrage, lecture
+des patterns, scoring, choix du mot, sérialisation de l'API. Les durées
+sont agrégées en histogrammes par phase (les phases peuvent s'imbriquer :
+'scoring' contient 'pattern_lookup') et exportées au format texte de
+Prometheus par metrics_text().
+
+L'instrumentation est désactivée par défaut (WORDLE_METRICS=1 ou enable()
+pour l'activer) : un minuteur se réduit alors à un test de booléen.
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+# Bornes supérieures des seaux des histogrammes (secondes)
+BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+METRIC_NAME = 'wordle_phase_duration_seconds'
+
+_enabled = os.environ.get('WORDLE_METRICS', '') not in ('', '0')
+_lock = threading.Lock()
+
+
+class Histogram:
+    """Histogramme des durées d'une phase (seaux non cumulés, en nanosecondes)."""
+
+    __slots__ = ('bounds_ns', 'counts', 'count', 'sum_ns')
+
+    def __init__(self, buckets: Sequence[float] = BUCKETS):
+        self.bounds_ns = [int(bound * 1e9) for bound in buckets]
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum_ns = 0
+
+    def observe(self, duration_ns: int):
+        """Ajoute une durée (nanosecondes)."""
+        self.counts[bisect.bisect_left(self.bounds_ns, duration_ns)] += 1
+        self.count += 1
+        self.sum_ns += duration_ns
+
+    def merge(self, state: Dict):
+        """Ajoute les compteurs d'un instantané (voir to_dict)."""
+        for bucket, count in enumerate(state['counts']):
+            self.counts[bucket] += count
+        self.count += state['count']
+        self.sum_ns += state['sum_ns']
+
+    def quantile(self, q: float) -> float:
+        """Estime un quantile (borne supérieure du seau, en secondes)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if bucket < len(self.bounds_ns):
+                    return self.bounds_ns[bucket] / 1e9
+                return float('inf')
+        return float('inf')
+
+    def to_dict(self) -> Dict:
+        """Instantané sérialisable (fusionnable par merge)."""
+        return {'counts': list(self.counts), 'count': self.count, 'sum_ns': self.sum_ns}
+
+
+_histograms: Dict[str, Histogram] = {}
+
+
+def enable(enabled: bool = True):
+    """Active (ou désactive) l'instrumentation du processus."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Indique si l'instrumentation est active."""
+    return _enabled
+
+
+def observe(phase: str, duration_ns: int):
+    """
+    Enregistre la durée d'une phase.
+
+    Args:
+        phase: Nom de la phase
+        duration_ns: Durée en nanosecondes
+    """
+    with _lock:
+        histogram = _histograms.get(phase)
+        if histogram is None:
+            histogram = _histograms[phase] = Histogram()
+        histogram.observe(duration_ns)
+
+
+class _Timer:
+    """Minuteur d'une phase (gestionnaire de contexte)."""
+
+    __slots__ = ('phase', 'start')
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.phase, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullTimer:
+    """Minuteur inactif (instrumentation désactivée)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(phase: str):
+    """
+    Mesure un bloc de code.
+
+    Usage :
+        with timer('filter'):
+            mask = solver.candidate_mask(cm)
+
+    Args:
+        phase: Nom de la phase
+
+    Returns:
+        Gestionnaire de contexte (inactif si l'instrumentation est désactivée)
+    """
+    return _Timer(phase) if _enabled else _NULL_TIMER
+
+
+def timed(phase: str) -> Callable:
+    """
+    Décorateur mesurant chaque appel d'une fonction.
+
+    Args:
+        phase: Nom de la phase
+
+    Returns:
+        Décorateur (l'état actif est testé à chaque appel)
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(phase, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
+
+
+def snapshot() -> Dict[str, Dict]:
+    """Instantané des histogrammes, par phase."""
+    with _lock:
+        return {phase: histogram.to_dict() for phase, histogram in _histograms.items()}
+
+
+def drain() -> Dict[str, Dict]:
+    """
+    Retourne l'instantané des histogrammes puis les remet à zéro.
+
+    Sert aux processus workers : leurs mesures sont renvoyées avec chaque
+    résultat et fusionnées dans le processus parent (merge).
+    """
+    with _lock:
+        state = {phase: histogram.to_dict() for phase, histogram in _histograms.items()}
+        _histograms.clear()
+    return state
+
+
+def merge(state: Optional[Dict[str, Dict]]):
+    """
+    Fusionne un instantané (d'un autre processus) dans les histogrammes.
+
+    Args:
+        state: Instantané produit par snapshot() ou drain()
+    """
+    if not state:
+        return
+    with _lock:
+        for phase, histogram_state in state.items():
+            histogram = _histograms.get(phase)
+            if histogram is None:
+                histogram = _histograms[phase] = Histogram()
+            histogram.merge(histogram_state)
+
+
+def reset():
+    """Remet tous les histogrammes à zéro."""
+    with _lock:
+        _histograms.clear()
+
+
+def summary() -> List[Dict]:
+    """
+    Résumé des phases : nombre d'appels, durée totale et quantiles estimés.
+
+    Returns:
+        Une entrée par phase, triées par durée totale décroissante
+    """
+    with _lock:
+        rows = [
+            {
+                'phase': phase,
+                'count': histogram.count,
+                'total_s': histogram.sum_ns / 1e9,
+                'p50_s': histogram.quantile(0.5),
+                'p99_s': histogram.quantile(0.99),
+            }
+            for phase, histogram in _histograms.items()
+        ]
+    return sorted(rows, key=lambda row: row['total_s'], reverse=True)
+
+
+def _format_bound(bound_ns: int) -> str:
+    """Borne de seau au format Prometheus (secondes)."""
+    return repr(bound_ns / 1e9)
+
+
+def metrics_text(extra_lines: Sequence[str] = ()) -> str:
+    """
+    Exporte les histogrammes au format texte de Prometheus.
+
+    Args:
+        extra_lines: Lignes supplémentaires (autres métriques) ajoutées à la fin
+
+    Returns:
+        Texte de l'exposition (seaux cumulés, _sum et _count par phase)
+    """
+    lines = [
+        f"# HELP {METRIC_NAME} Durée des phases du solveur.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    bounds = [int(bound * 1e9) for bound in BUCKETS]
+    for phase, state in sorted(snapshot().items()):
+        label = phase.replace('\\', '\\\\').replace('"', '\\"')
+        cumulative = 0
+        for bound, count in zip(bounds, state['counts']):
+            cumulative += count
+            lines.append(f'{METRIC_NAME}_bucket{{phase="{label}",le="{_format_bound(bound)}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_bucket{{phase="{label}",le="+Inf"}} {state["count"]}')
+        lines.append(f'{METRIC_NAME}_sum{{phase="{label}"}} {state["sum_ns"] / 1e9!r}')
+        lines.append(f'{METRIC_NAME}_count{{phase="{label}"}} {state["count"]}')
+    lines.extend(extra_lines)
+    return '\n'.join(lines) + '\n'
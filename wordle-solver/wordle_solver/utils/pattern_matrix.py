@@ -0,0 +1,331 @@
+"""
+Module de la matrice de patterns de feedback pré-calculée.
+
+Pour un dictionnaire de N mots, la matrice (N, N) contient en [i, j] le code
+du pattern obtenu en jouant le mot i lorsque la cible est le mot j.
+
+Chaque pattern est encodé en base 3 (ABSENT=0, PRESENT=1, CORRECT=2, la
+position 0 étant le chiffre de poids faible), soit 3^L codes possibles pour
+des mots de L lettres : 243 codes qui tiennent dans un uint8 jusqu'à 5
+lettres, un uint16 au-delà (6561 codes pour 8 lettres). La matrice est
+construite paresseusement. La matrice d'un dictionnaire de langue
+(for_language, une par longueur de mots) est sauvegardée sur disque avec
+une empreinte du contenu du dictionnaire pour être rechargée en mmap aux
+démarrages suivants ; les matrices de sous-ensembles ad hoc (for_words)
+restent en mémoire.
+"""
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from ..game.feedback import N_PATTERNS, WORD_LENGTH, n_patterns
+from ..dictionaries.word_table import MAX_WORD_LENGTH, WordTable, letter_counts
+from . import metrics
+
+
+def pattern_dtype(word_length: int = WORD_LENGTH) -> np.dtype:
+    """Type entier le plus petit contenant les 3^L codes de pattern."""
+    return np.dtype(np.uint8 if n_patterns(word_length) <= 256 else np.uint16)
+
+
+def pattern_count(matrix: Union["PatternMatrix", np.ndarray]) -> int:
+    """
+    Nombre de patterns possibles (taille des histogrammes) d'une matrice.
+
+    Args:
+        matrix: PatternMatrix, ou tableau brut de codes (borne selon son type)
+
+    Returns:
+        3^L pour une PatternMatrix, 243 ou 3^8 pour un tableau brut
+    """
+    if isinstance(matrix, PatternMatrix):
+        return matrix.n_patterns
+    return N_PATTERNS if matrix.dtype.itemsize == 1 else n_patterns(MAX_WORD_LENGTH)
+
+
+def compute_patterns(
+    guesses: np.ndarray,
+    targets: np.ndarray,
+    target_counts: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calcule les codes de pattern pour toutes les paires (tentative, cible).
+
+    Reproduit exactement generate_feedback, y compris pour les lettres
+    dupliquées : une lettre mal placée n'est jaune que s'il reste dans la
+    cible des occurrences non consommées par les verts et les jaunes
+    précédents.
+
+    Args:
+        guesses: Tableau (G, L) d'indices de lettres des tentatives
+        targets: Tableau (T, L) d'indices de lettres des cibles
+        target_counts: Comptes (T, A) des lettres de chaque cible (optionnel)
+
+    Returns:
+        Tableau (G, T) de codes (type pattern_dtype(L))
+    """
+    word_length = guesses.shape[1]
+    dtype = pattern_dtype(word_length)
+    if target_counts is None:
+        target_counts = letter_counts(targets, int(max(guesses.max(initial=0), targets.max(initial=0))) + 1)
+
+    green = guesses[:, None, :] == targets[None, :, :]
+    # same[g, j, i] : la tentative g a la même lettre aux positions j et i
+    same = guesses[:, :, None] == guesses[:, None, :]
+    codes = np.zeros((len(guesses), len(targets)), dtype=dtype)
+
+    for i in range(word_length):
+        same_i = same[:, :, i]
+        # Occurrences de la lettre dans la cible, hors positions vertes
+        available = target_counts[:, guesses[:, i]].T.astype(np.int8)
+        for k in range(word_length):
+            available -= green[:, :, k] & same_i[:, k, None]
+        # Occurrences déjà consommées par les positions précédentes non vertes
+        used = np.zeros_like(available)
+        for j in range(i):
+            used += ~green[:, :, j] & same_i[:, j, None]
+
+        yellow = ~green[:, :, i] & (available > used)
+        codes += (2 * green[:, :, i] + yellow).astype(dtype) * dtype.type(3 ** i)
+
+    return codes
+
+
+class PatternMatrix:
+    """
+    Matrice tentative × cible des codes de pattern pour un dictionnaire.
+
+    Les mots sont ceux d'un WordTable : l'identifiant d'un mot est son
+    rang dans le dictionnaire. La matrice n'est calculée qu'au premier accès.
+    """
+
+    # Nombre de tentatives traitées par bloc lors de la construction
+    BUILD_CHUNK_CELLS = 4_000_000
+
+    # Nombre maximum de matrices gardées dans le registre partagé
+    REGISTRY_SIZE = 8
+
+    _registry: "OrderedDict[str, PatternMatrix]" = OrderedDict()
+    _by_language: Dict[Tuple[str, int], "PatternMatrix"] = {}
+
+    def __init__(
+        self,
+        words: Union[WordTable, Iterable[str]],
+        cache_dir: Optional[Union[str, Path]] = None,
+        persist: bool = False
+    ):
+        """
+        Initialise la matrice (sans la calculer).
+
+        Args:
+            words: WordTable ou mots du dictionnaire (de même longueur)
+            cache_dir: Dossier de sauvegarde (défaut : WORDLE_SOLVER_CACHE_DIR
+                       ou ~/.cache/wordle_solver)
+            persist: Sauvegarder sur disque (réservé aux dictionnaires de
+                     langue : les fichiers ne sont jamais supprimés)
+        """
+        self.table = WordTable.of(words)
+        self.words = self.table.words
+        self.index = self.table.index
+        self.digest = self.table.digest
+        self.word_length = self.table.word_length
+        self.n_patterns = n_patterns(self.word_length)
+        self.dtype = pattern_dtype(self.word_length)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.default_cache_dir()
+        self.persist = persist
+        self._matrix: Optional[np.ndarray] = None
+
+    @staticmethod
+    def default_cache_dir() -> Path:
+        """Retourne le dossier de cache par défaut."""
+        env_dir = os.getenv('WORDLE_SOLVER_CACHE_DIR')
+        if env_dir:
+            return Path(env_dir)
+        return Path.home() / '.cache' / 'wordle_solver'
+
+    @property
+    def cache_path(self) -> Path:
+        """Chemin du fichier .npy associé à ce dictionnaire."""
+        return self.cache_dir / f"patterns_v1_{len(self.words)}_{self.digest}.npy"
+
+    @property
+    def nbytes(self) -> int:
+        """Taille mémoire de la matrice complète (calculée ou non)."""
+        return len(self.words) ** 2 * self.dtype.itemsize
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indique si la matrice a déjà été calculée ou chargée."""
+        return self._matrix is not None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Matrice (N, N) des codes, calculée ou chargée au premier accès."""
+        if self._matrix is None:
+            self._matrix = self._load_or_build()
+        return self._matrix
+
+    @metrics.timed('pattern_matrix_load')
+    def _load_or_build(self) -> np.ndarray:
+        """Charge la matrice depuis le disque, ou la calcule et la sauvegarde."""
+        path = self.cache_path
+
+        if self.persist and path.exists():
+            try:
+                matrix = np.load(path, mmap_mode='r')
+                if matrix.shape == (len(self.words), len(self.words)) and matrix.dtype == self.dtype:
+                    return matrix
+            except (OSError, ValueError):
+                pass  # Fichier corrompu : on recalcule
+
+        matrix = self.build()
+
+        if self.persist:
+            self._save(matrix)
+
+        return matrix
+
+    def _save(self, matrix: np.ndarray):
+        """Écrit la matrice dans cache_path (écriture atomique)."""
+        path = self.cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Dossier non accessible en écriture : garder en mémoire
+
+    def build(self) -> np.ndarray:
+        """
+        Calcule la matrice complète par blocs de tentatives.
+
+        Returns:
+            Tableau (N, N) de codes (uint8, uint16 au-delà de 5 lettres)
+        """
+        letters = self.table.letters
+        counts = self.table.counts
+        n = len(self.words)
+        matrix = np.empty((n, n), dtype=self.dtype)
+        chunk = max(1, self.BUILD_CHUNK_CELLS // max(1, n))
+
+        for start in range(0, n, chunk):
+            stop = min(n, start + chunk)
+            matrix[start:stop] = compute_patterns(letters[start:stop], letters, counts)
+
+        return matrix
+
+    def covers(self, words: Iterable[str]) -> bool:
+        """Vérifie que tous les mots sont dans le dictionnaire de la matrice."""
+        index = self.index
+        return all(word in index for word in words)
+
+    def ids(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Convertit des mots en identifiants.
+
+        Args:
+            words: Mots (majuscules) présents dans le dictionnaire
+
+        Returns:
+            Tableau d'identifiants (int64)
+        """
+        return self.table.ids(words)
+
+    def pattern_code(self, guess: str, target: str) -> int:
+        """Retourne le code du pattern pour une paire de mots."""
+        return int(self.matrix[self.index[guess.upper()], self.index[target.upper()]])
+
+    def histogram(self, guess_id: int, target_ids: np.ndarray) -> np.ndarray:
+        """
+        Compte les cibles tombant dans chaque pattern pour une tentative.
+
+        Args:
+            guess_id: Identifiant de la tentative
+            target_ids: Identifiants des cibles possibles
+
+        Returns:
+            Tableau de 3^L effectifs
+        """
+        return np.bincount(self.matrix[guess_id, target_ids], minlength=self.n_patterns)
+
+    @classmethod
+    def for_words(cls, words: Union[WordTable, Iterable[str]]) -> "PatternMatrix":
+        """
+        Retourne une matrice partagée couvrant les mots donnés.
+
+        Réutilise une matrice déjà calculée du registre si elle contient
+        tous les mots ; sinon en crée une nouvelle (paresseuse, gardée en
+        mémoire seulement).
+
+        Args:
+            words: Mots devant être couverts
+
+        Returns:
+            PatternMatrix couvrant ces mots
+        """
+        table = WordTable.of(words)
+        # Même dictionnaire (par exemple celui d'une langue, sauvegardé sur disque)
+        if table.digest in cls._registry:
+            return cls._register(cls._registry[table.digest])
+
+        for digest, matrix in cls._registry.items():
+            if matrix.is_loaded and matrix.covers(table.words):
+                cls._registry.move_to_end(digest)
+                return matrix
+
+        matrix = cls(table)
+        return cls._register(matrix)
+
+    @classmethod
+    def for_language(cls, language: str, word_length: int = WORD_LENGTH) -> "PatternMatrix":
+        """
+        Retourne la matrice partagée d'un dictionnaire de langue.
+
+        Args:
+            language: 'en' ou 'fr'
+            word_length: Longueur des mots (une matrice par longueur)
+
+        Returns:
+            PatternMatrix du dictionnaire (sauvegardée sur disque)
+        """
+        from ..dictionaries import LanguageRegistry
+
+        key = (language.lower(), word_length)
+        table = LanguageRegistry.get(*key).table
+        matrix = cls._by_language.get(key)
+        # Nouvelle matrice si la liste a été remplacée (LanguageRegistry.register)
+        if matrix is None or matrix.digest != table.digest:
+            matrix = cls._register(cls(table, persist=True))
+            if not matrix.persist:
+                # Déjà créée par for_words (en mémoire) : la sauvegarder désormais
+                matrix.persist = True
+                if matrix.is_loaded:
+                    matrix._save(matrix.matrix)
+            cls._by_language[key] = matrix
+        return matrix
+
+    @classmethod
+    def _register(cls, matrix: "PatternMatrix") -> "PatternMatrix":
+        """Ajoute une matrice au registre (ou retourne celle déjà présente)."""
+        existing = cls._registry.get(matrix.digest)
+        if existing is not None:
+            cls._registry.move_to_end(matrix.digest)
+            return existing
+
+        cls._registry[matrix.digest] = matrix
+        while len(cls._registry) > cls.REGISTRY_SIZE:
+            cls._registry.popitem(last=False)
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __repr__(self) -> str:
+        status = "chargée" if self.is_loaded else "non calculée"
+        return f"PatternMatrix(words={len(self.words)}, length={self.word_length}, digest='{self.digest}', {status})"
@@ -0,0 +1,314 @@
+"""
+Module de scoring vectorisé des tentatives.
+
+Entropie, pire cas (minimax) et taille espérée sont trois lectures du même
+histogramme de patterns par tentative. score_guesses() calcule cet
+histogramme pour toutes les tentatives à la fois, avec un seul bincount
+2-D sur un tableau (tentatives × 3^L, soit 243 patterns pour des mots de 5
+lettres), puis en dérive les trois scores.
+
+score_guesses_until() est la variante "anytime" : les tentatives sont
+évaluées par blocs dans l'ordre d'une heuristique bon marché (fréquence
+des lettres) jusqu'à une échéance.
+
+score_boards() évalue les tentatives contre plusieurs grilles à la fois
+(Quordle, Octordle) : les cibles de toutes les grilles sont traitées dans
+le même bincount, chaque grille ayant sa propre plage de 3^L patterns.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from . import metrics
+from .pattern_matrix import PatternMatrix, pattern_count
+
+
+# Nombre maximum de cases (tentative, cible) traitées par bloc
+CHUNK_CELLS = 4_000_000
+
+# Taille des blocs en mode anytime (quelques millisecondes par bloc)
+ANYTIME_CHUNK_CELLS = 250_000
+
+
+@dataclass
+class GuessScores:
+    """Scores de chaque tentative évaluée (tableaux alignés sur guess_ids)."""
+    guess_ids: np.ndarray
+    entropy: np.ndarray
+    worst_case: np.ndarray
+    expected_size: np.ndarray
+    n_groups: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        """Taille mémoire des tableaux (pour la comptabilité des caches)."""
+        return sum(
+            array.nbytes
+            for array in (self.guess_ids, self.entropy, self.worst_case, self.expected_size, self.n_groups)
+        )
+
+    def __len__(self) -> int:
+        return len(self.guess_ids)
+
+
+def pattern_histograms(
+    matrix: Union[PatternMatrix, np.ndarray],
+    guess_ids: np.ndarray,
+    answer_ids: np.ndarray,
+    weights: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calcule l'histogramme des patterns pour un bloc de tentatives.
+
+    Args:
+        matrix: Matrice de patterns (ou tableau (N, N) de codes)
+        guess_ids: Identifiants des tentatives (G,)
+        answer_ids: Identifiants des cibles restantes (A,)
+        weights: Poids des cibles (A,), optionnel
+
+    Returns:
+        Tableau (G, 3^L) des effectifs (ou poids cumulés)
+    """
+    codes = matrix.matrix if isinstance(matrix, PatternMatrix) else matrix
+    n_guesses = len(guess_ids)
+    n_bins = pattern_count(matrix)
+
+    with metrics.timer('pattern_lookup'):
+        block = codes[np.ix_(guess_ids, answer_ids)].astype(np.int64)
+    block += (np.arange(n_guesses, dtype=np.int64) * n_bins)[:, None]
+
+    flat_weights = None
+    if weights is not None:
+        flat_weights = np.broadcast_to(weights, block.shape).ravel()
+
+    counts = np.bincount(block.ravel(), weights=flat_weights, minlength=n_guesses * n_bins)
+    return counts.reshape(n_guesses, n_bins)
+
+
+@metrics.timed('scoring')
+def score_guesses(
+    matrix: Union[PatternMatrix, np.ndarray],
+    guess_ids: np.ndarray,
+    answer_ids: np.ndarray,
+    weights: Optional[np.ndarray] = None
+) -> GuessScores:
+    """
+    Calcule entropie, pire cas et taille espérée de chaque tentative.
+
+    Args:
+        matrix: Matrice de patterns (ou tableau (N, N) de codes)
+        guess_ids: Identifiants des tentatives à évaluer
+        answer_ids: Identifiants des cibles encore possibles
+        weights: Poids (probabilités a priori) des cibles, optionnel
+
+    Returns:
+        GuessScores aligné sur guess_ids
+    """
+    guess_ids = np.asarray(guess_ids, dtype=np.int64)
+    answer_ids = np.asarray(answer_ids, dtype=np.int64)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+
+    n_guesses = len(guess_ids)
+    entropy = np.zeros(n_guesses)
+    worst_case = np.zeros(n_guesses)
+    expected_size = np.zeros(n_guesses)
+    n_groups = np.zeros(n_guesses, dtype=np.int64)
+
+    total = float(weights.sum()) if weights is not None else float(len(answer_ids))
+    if total <= 0 or n_guesses == 0:
+        return GuessScores(guess_ids, entropy, worst_case, expected_size, n_groups)
+
+    # Les histogrammes (G, 3^L) comptent aussi dans la taille d'un bloc
+    chunk = max(1, CHUNK_CELLS // max(len(answer_ids), pattern_count(matrix)))
+
+    for start in range(0, n_guesses, chunk):
+        stop = min(n_guesses, start + chunk)
+        counts = pattern_histograms(matrix, guess_ids[start:stop], answer_ids, weights)
+
+        probabilities = counts / total
+        logs = np.log2(np.where(probabilities > 0, probabilities, 1.0))
+
+        entropy[start:stop] = -(probabilities * logs).sum(axis=1)
+        worst_case[start:stop] = counts.max(axis=1)
+        expected_size[start:stop] = (counts * counts).sum(axis=1) / total
+        n_groups[start:stop] = np.count_nonzero(counts, axis=1)
+
+    return GuessScores(guess_ids, entropy, worst_case, expected_size, n_groups)
+
+
+def frequency_priority(
+    matrix: PatternMatrix,
+    guess_ids: np.ndarray,
+    answer_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Score de fréquence des lettres de chaque tentative (vectorisé).
+    
+    Même score que FrequencyStrategy (somme des fréquences des lettres
+    distinctes, bonus de 20 % si toutes sont distinctes), sans la pénalité
+    des lettres connues. Sert d'ordre de priorité en mode anytime.
+    
+    Args:
+        matrix: Matrice de patterns (pour sa table de mots)
+        guess_ids: Identifiants des tentatives
+        answer_ids: Identifiants des cibles
+        
+    Returns:
+        Scores alignés sur guess_ids (plus élevé = plus prometteur)
+    """
+    table = matrix.table
+    guess_presence = table.presence[guess_ids]
+    
+    letter_counts = table.presence_counts(answer_ids)
+    frequencies = letter_counts / max(1, letter_counts.sum())
+    
+    scores = guess_presence @ frequencies
+    all_distinct = guess_presence.sum(axis=1) == table.letters.shape[1]
+    return np.where(all_distinct, scores * 1.2, scores)
+
+
+def score_guesses_until(
+    matrix: PatternMatrix,
+    guess_ids: np.ndarray,
+    answer_ids: np.ndarray,
+    deadline: float,
+    priority: Optional[np.ndarray] = None,
+    weights: Optional[np.ndarray] = None
+) -> GuessScores:
+    """
+    Évalue les tentatives par ordre de priorité jusqu'à une échéance.
+    
+    Un bloc n'est commencé que si la durée du bloc précédent tient avant
+    l'échéance. Si l'échéance est déjà passée, seule la tentative la plus
+    prioritaire est évaluée.
+    
+    Args:
+        matrix: Matrice de patterns
+        guess_ids: Identifiants des tentatives (triés)
+        answer_ids: Identifiants des cibles encore possibles
+        deadline: Échéance absolue (time.time())
+        priority: Priorité de chaque tentative (défaut : frequency_priority)
+        weights: Poids des cibles, optionnel
+        
+    Returns:
+        GuessScores des tentatives évaluées, triées par identifiant
+        (toutes si len(résultat) == len(guess_ids))
+    """
+    guess_ids = np.asarray(guess_ids, dtype=np.int64)
+    answer_ids = np.asarray(answer_ids, dtype=np.int64)
+    if priority is None:
+        priority = frequency_priority(matrix, guess_ids, answer_ids)
+    
+    order = guess_ids[np.argsort(-priority, kind='stable')]
+    chunk = max(1, ANYTIME_CHUNK_CELLS // max(len(answer_ids), pattern_count(matrix)))
+    
+    parts = []
+    evaluated = 0
+    last_duration = 0.0
+    while evaluated < len(order):
+        now = time.time()
+        if evaluated and now + last_duration > deadline:
+            break
+        size = chunk if evaluated or now < deadline else 1
+        parts.append(score_guesses(matrix, order[evaluated:evaluated + size], answer_ids, weights))
+        evaluated += size
+        last_duration = time.time() - now
+    
+    if not parts:
+        return score_guesses(matrix, order, answer_ids, weights)
+    
+    # Réordonne par identifiant : à évaluation complète, le résultat (et le
+    # départage des ex-aequo) est identique à celui de score_guesses()
+    merged = [np.concatenate(arrays) for arrays in zip(*(
+        (p.guess_ids, p.entropy, p.worst_case, p.expected_size, p.n_groups) for p in parts
+    ))]
+    by_id = np.argsort(merged[0], kind='stable')
+    return GuessScores(*(array[by_id] for array in merged))
+
+
+def board_histograms(
+    matrix: Union[PatternMatrix, np.ndarray],
+    guess_ids: np.ndarray,
+    boards: Sequence[np.ndarray]
+) -> np.ndarray:
+    """
+    Calcule l'histogramme des patterns de chaque grille pour un bloc de tentatives.
+
+    Args:
+        matrix: Matrice de patterns (ou tableau (N, N) de codes)
+        guess_ids: Identifiants des tentatives (G,)
+        boards: Identifiants des cibles restantes de chaque grille (B tableaux)
+
+    Returns:
+        Tableau (G, B, 3^L) des effectifs
+    """
+    codes = matrix.matrix if isinstance(matrix, PatternMatrix) else matrix
+    n_guesses = len(guess_ids)
+    n_patterns = pattern_count(matrix)
+    n_bins = len(boards) * n_patterns
+
+    answer_ids = np.concatenate(boards)
+    board_offsets = np.repeat(np.arange(len(boards), dtype=np.int64) * n_patterns, [len(b) for b in boards])
+
+    with metrics.timer('pattern_lookup'):
+        block = codes[np.ix_(guess_ids, answer_ids)].astype(np.int64)
+    block += board_offsets[None, :]
+    block += (np.arange(n_guesses, dtype=np.int64) * n_bins)[:, None]
+
+    counts = np.bincount(block.ravel(), minlength=n_guesses * n_bins)
+    return counts.reshape(n_guesses, len(boards), n_patterns)
+
+
+@metrics.timed('scoring')
+def score_boards(
+    matrix: Union[PatternMatrix, np.ndarray],
+    guess_ids: np.ndarray,
+    boards: Sequence[np.ndarray]
+) -> GuessScores:
+    """
+    Évalue des tentatives contre plusieurs grilles en un seul passage.
+
+    Les scores sont agrégés sur les grilles : l'entropie, la taille espérée
+    et le nombre de groupes sont additionnés (grilles indépendantes), le
+    pire cas est le plus grand groupe de toutes les grilles.
+
+    Args:
+        matrix: Matrice de patterns (ou tableau (N, N) de codes)
+        guess_ids: Identifiants des tentatives à évaluer
+        boards: Identifiants des cibles encore possibles de chaque grille non résolue
+
+    Returns:
+        GuessScores aligné sur guess_ids
+    """
+    guess_ids = np.asarray(guess_ids, dtype=np.int64)
+    boards = [np.asarray(board, dtype=np.int64) for board in boards if len(board)]
+
+    n_guesses = len(guess_ids)
+    entropy = np.zeros(n_guesses)
+    worst_case = np.zeros(n_guesses)
+    expected_size = np.zeros(n_guesses)
+    n_groups = np.zeros(n_guesses, dtype=np.int64)
+
+    if n_guesses == 0 or not boards:
+        return GuessScores(guess_ids, entropy, worst_case, expected_size, n_groups)
+
+    totals = np.array([len(board) for board in boards], dtype=np.float64)[None, :, None]
+    chunk = max(1, CHUNK_CELLS // max(sum(len(board) for board in boards), len(boards) * pattern_count(matrix)))
+
+    for start in range(0, n_guesses, chunk):
+        stop = min(n_guesses, start + chunk)
+        counts = board_histograms(matrix, guess_ids[start:stop], boards)
+
+        probabilities = counts / totals
+        logs = np.log2(np.where(probabilities > 0, probabilities, 1.0))
+
+        entropy[start:stop] = -(probabilities * logs).sum(axis=(1, 2))
+        worst_case[start:stop] = counts.max(axis=(1, 2))
+        expected_size[start:stop] = ((counts * counts) / totals).sum(axis=(1, 2))
+        n_groups[start:stop] = np.count_nonzero(counts, axis=(1, 2))
+
+    return GuessScores(guess_ids, entropy, worst_case, expected_size, n_groups)